@@ -1,14 +1,45 @@
 import argparse
+import contextlib
 import io
 import json
+import pickle
 import re
 import shutil
-from dataclasses import dataclass, asdict
-from hashlib import md5
+import sys
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, field
+from hashlib import md5, sha256
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import pdfplumber
+from pdfplumber.page import test_proposed_bbox
+
+from catalog_patterns import (
+    AIRPRESS_SKU_CELL,
+    ALNUM_SKU,
+    CATALOG_SKU_PROBES,
+    INVALID_SKU,
+    KRANZLE_SKU,
+    MAKITA_MODEL,
+    MEASUREMENT_CELL,
+    NUMERIC_ARTICLE_CODE,
+    PRODUCT_CODE_PREFIX,
+    SKU_ARTIFACTS,
+    SKU_TOKEN,
+    classify_cell,
+)
+from cost_model import COST_MODEL_NAME, CatalogScan, CostModel, PageFeatures, lpt_makespan, lpt_order
+from encode_pool import DEFAULT_ENCODE_THREADS, EncodePool, format_encode_stats
+from image_store import image_store_for
+from page_renderer import DEFAULT_RENDER_WORKERS, PageRenderer, page_job
+from pdf_image_info import ImageInfo, format_read_stats, note_read, note_skipped, page_image_infos
+from quantities import parse_quantity, quantity_cache_stats
+from run_metrics import METRICS, add_metrics_arguments, format_rates, merge_counters, verbosity_from_args
+from slugs import slug
 
 try:
     import fitz  # PyMuPDF for image extraction
@@ -22,6 +53,17 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import psutil  # Optional: accurate per-catalog peak RSS
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+try:
+    import resource  # Unix only; fallback for peak RSS
+except ImportError:
+    resource = None
+
 
 # ============================================================================
 # PROJECT PATHS
@@ -66,11 +108,7 @@ class EnrichedContext:
 def slugify(text: Optional[str]) -> Optional[str]:
     if text is None:
         return None
-    t = text.strip().lower()
-    t = re.sub(r"/", " ", t)
-    t = re.sub(r"[^a-z0-9]+", "-", t)
-    t = re.sub(r"-+", "-", t).strip("-")
-    return t or None
+    return slug(text) or None
 
 
 # ============================================================================
@@ -404,6 +442,7 @@ def render_page_as_image(
     output_dir: Optional[Path] = None,
     dpi: int = 200,
     quality: int = 90,
+    clip: Optional[Tuple[float, float, float, float]] = None,
 ) -> Optional[str]:
     """Render a PDF page as a high-quality image.
     
@@ -416,12 +455,32 @@ def render_page_as_image(
         output_dir: Output directory for images
         dpi: Resolution for rendering (default 200 for good quality)
         quality: WebP quality (0-100)
+        clip: Optional bbox (PDF points) to render instead of the whole page
     
     Returns:
         Relative image path or None if failed
     """
+    rendered = render_pages_as_images(pdf_path, [page_num], output_dir, dpi, quality, jobs=1, clip=clip)
+    return rendered.get(page_num)
+
+
+def render_pages_as_images(
+    pdf_path: Path,
+    page_nums: Sequence[int],
+    output_dir: Optional[Path] = None,
+    dpi: int = 200,
+    quality: int = 90,
+    jobs: int = DEFAULT_RENDER_WORKERS,
+    clip: Optional[Tuple[float, float, float, float]] = None,
+) -> Dict[int, str]:
+    """Render several pages (see render_page_as_image) in one batch.
+
+    The PDF is opened once per worker and page ranges are rasterised in
+    `jobs` processes (see page_renderer). Returns {page: relative image path}
+    for the pages that were rendered or already existed.
+    """
     if not HAS_FITZ or not HAS_PIL:
-        return None
+        return {}
     
     pdf_stem = pdf_path.stem
     if output_dir is None:
@@ -429,34 +488,26 @@ def render_page_as_image(
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    img_filename = f"{pdf_stem}__p{page_num}__rendered.webp"
-    img_path = output_dir / img_filename
-    
-    # Skip if already exists
-    if img_path.exists():
-        return f"images/{pdf_stem}/{img_filename}"
-    
+    if clip is None:
+        suffix = "rendered"
+    else:
+        suffix = "region_" + "_".join(f"{v:.0f}" for v in clip)
+    render_jobs = [
+        page_job(n, output_dir / f"{pdf_stem}__p{n}__{suffix}.webp", dpi, clip)
+        for n in page_nums
+    ]
+    out: Dict[int, str] = {}
     try:
-        doc = fitz.open(str(pdf_path))
-        page = doc[page_num - 1]  # 0-indexed
-        
-        # Render at high DPI
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        
-        # Save as WebP
-        img.save(img_path, "WEBP", quality=quality)
-        
-        doc.close()
-        
-        return f"images/{pdf_stem}/{img_filename}"
-        
+        results = PageRenderer(pdf_path, workers=jobs, quality=quality).render(render_jobs)
     except Exception as e:
-        print(f"    Warning: Failed to render page {page_num}: {e}")
-        return None
+        METRICS.warn(f"    Warning: Failed to render pages of {pdf_path.name}: {e}", pdf=pdf_path.name)
+        return out
+    for job, result in zip(render_jobs, results):
+        if result.error is not None:
+            METRICS.warn(f"    Warning: Failed to render page {result.page}: {result.error}", pdf=pdf_path.name, page=result.page)
+            continue
+        out[result.page] = f"images/{pdf_stem}/{job.outputs[0].path.name}"
+    return out
 
 
 def is_good_product_image(width: int, height: int, size_bytes: int, aspect_ratio: float = None) -> bool:
@@ -477,30 +528,101 @@ def is_good_product_image(width: int, height: int, size_bytes: int, aspect_ratio
     Returns:
         True if image appears to be a good product image
     """
+    # Filter criteria for good product images
+    min_size_kb = 15     # Must be at least 15KB (filter tiny icons)
+    max_size_kb = 200    # Must be under 200KB (filter full-page images)
+    
+    # Check all criteria
+    if size_bytes < min_size_kb * 1024:
+        return False
+    if size_bytes > max_size_kb * 1024:
+        return False
+    
+    return has_product_image_shape(width, height, aspect_ratio)
+
+
+def has_product_image_shape(width: int, height: int, aspect_ratio: float = None) -> bool:
+    """The dimension and aspect-ratio part of is_good_product_image, which
+    image metadata answers before any bytes are extracted."""
     # Calculate aspect ratio if not provided
     if aspect_ratio is None and height > 0:
         aspect_ratio = width / height
     
-    # Filter criteria for good product images
     min_dimension = 150  # Both dimensions must be at least this
-    min_size_kb = 15     # Must be at least 15KB (filter tiny icons)
-    max_size_kb = 200    # Must be under 200KB (filter full-page images)
     min_aspect = 0.3     # Not too tall/narrow
     max_aspect = 3.0     # Not too wide (banners)
     
-    # Check all criteria
     if width < min_dimension or height < min_dimension:
         return False
-    if size_bytes < min_size_kb * 1024:
-        return False
-    if size_bytes > max_size_kb * 1024:
-        return False
     if aspect_ratio and (aspect_ratio < min_aspect or aspect_ratio > max_aspect):
         return False
     
     return True
 
 
+# Encode parameters of catalog WebP images: part of the image store key
+CATALOG_WEBP_PARAMS = ("WEBP", 90, "keep RGB/RGBA/LA/P, else RGB")
+
+
+def _decode_catalog_image(image_bytes: bytes) -> "Image.Image":
+    """Decode an extracted image for WebP encoding; raises for data Pillow
+    can't read (e.g. JBIG2 streams)."""
+    pil_img = Image.open(io.BytesIO(image_bytes))
+    # Preserve transparency for RGBA/LA/P modes
+    if pil_img.mode not in ("RGB", "RGBA", "LA", "P"):
+        pil_img = pil_img.convert("RGB")
+    pil_img.load()
+    return pil_img
+
+
+def _encode_catalog_webp(pil_img: "Image.Image") -> bytes:
+    buf = io.BytesIO()
+    with PROFILER.stage("webp_encode"):
+        pil_img.save(buf, "WEBP", quality=90)
+    return buf.getvalue()
+
+
+# WebP writes run on this pool while the main thread keeps parsing pages.
+# process_pdf sizes it (inline under --profile) and drains it per catalog.
+ENCODE_POOL = EncodePool()
+
+
+def _count_catalog_webp(outcome: Optional[str]) -> None:
+    if outcome is not None:
+        METRICS.count("images")
+        METRICS.count(f"image_blobs_{outcome}")
+
+
+def save_catalog_webp(image_bytes: bytes, img_path: Path, on_error: Callable[[Exception], None]) -> None:
+    """Queue an embedded image to be written as WebP at img_path (kept if it
+    already exists); on_error(exc) is called if the write fails.
+
+    Goes through the content-addressed image store: an image already encoded
+    for another series, column or page is hardlinked instead of re-encoded.
+    A new image is decoded here, so bytes Pillow can't read raise before the
+    caller records img_path; only the encode and write happen on
+    ENCODE_POOL, so img_path may not exist until the pool is drained.
+    """
+    if img_path.exists():
+        return
+    store = image_store_for(IMAGE_DIR)
+    encode: Callable[[bytes], bytes] = _decode_and_encode_catalog_webp
+    if not store.has_blob(image_bytes, CATALOG_WEBP_PARAMS):
+        pil_img = _decode_catalog_image(image_bytes)
+
+        def encode(_raw: bytes) -> bytes:
+            return _encode_catalog_webp(pil_img)
+
+    ENCODE_POOL.submit(
+        store.materialize, image_bytes, CATALOG_WEBP_PARAMS, img_path, encode,
+        on_done=_count_catalog_webp, on_error=on_error,
+    )
+
+
+def _decode_and_encode_catalog_webp(image_bytes: bytes) -> bytes:
+    return _encode_catalog_webp(_decode_catalog_image(image_bytes))
+
+
 def extract_images_from_page(
     pdf_path: Path,
     page_num: int,
@@ -532,13 +654,18 @@ def extract_images_from_page(
         doc = fitz.open(str(pdf_path))
         page = doc[page_num - 1]  # 0-indexed
         
-        for img_idx, img_info in enumerate(page.get_images(full=True)):
+        for img_idx, info in enumerate(page_image_infos(doc, page)):
             try:
-                xref = img_info[0]
+                xref = info.xref
+                # Check image size (skip tiny images like icons) before reading any bytes
+                if info.width < 50 or info.height < 50:
+                    note_skipped(info)
+                    continue
+                
                 base_image = doc.extract_image(xref)
+                note_read(info)
                 image_bytes = base_image["image"]
                 
-                # Check image size (skip tiny images like icons)
                 width = base_image.get("width", 0)
                 height = base_image.get("height", 0)
                 
@@ -554,27 +681,21 @@ def extract_images_from_page(
                 img_path = output_dir / img_filename
                 
                 # Save image (if not exists)
-                if not img_path.exists():
-                    pil_img = Image.open(io.BytesIO(image_bytes))
-                    
-                    # Preserve transparency for RGBA/LA/P modes
-                    if pil_img.mode in ("RGBA", "LA", "P"):
-                        pass  # Keep as-is
-                    elif pil_img.mode != "RGB":
-                        pil_img = pil_img.convert("RGB")
-                    
-                    pil_img.save(img_path, "WEBP", quality=90)
+                save_catalog_webp(
+                    image_bytes, img_path,
+                    lambda e, i=img_idx: METRICS.warn(f"    Warning: Failed to extract image {i} from page {page_num}: {e}", pdf=pdf_path.name, page=page_num),
+                )
                 
                 rel_path = f"images/{pdf_stem}/{img_filename}"
                 images.append(rel_path)
                 
             except Exception as e:
-                print(f"    Warning: Failed to extract image {img_idx} from page {page_num}: {e}")
+                METRICS.warn(f"    Warning: Failed to extract image {img_idx} from page {page_num}: {e}", pdf=pdf_path.name, page=page_num)
         
         doc.close()
         
     except Exception as e:
-        print(f"    Warning: Failed to open PDF for image extraction: {e}")
+        METRICS.warn(f"    Warning: Failed to open PDF for image extraction: {e}", pdf=pdf_path.name)
     
     return images
 
@@ -621,14 +742,9 @@ def extract_makita_product_images(
         page = doc[page_num - 1]
         page_height = page.rect.height
         
-        for img_idx, img_info in enumerate(page.get_images(full=True)):
+        for img_idx, info in enumerate(page_image_infos(doc, page)):
             try:
-                xref = img_info[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                width = base_image.get("width", 0)
-                height = base_image.get("height", 0)
-                size_bytes = len(image_bytes)
+                xref = info.xref
                 
                 # Get image position on page
                 rects = page.get_image_rects(xref)
@@ -636,11 +752,26 @@ def extract_makita_product_images(
                     rect = rects[0]
                     # Skip images in header area (top 10% of page)
                     if rect.y1 < page_height * 0.1:
+                        note_skipped(info)
                         continue
                     # Skip images in footer area (bottom 5% of page)
                     if rect.y0 > page_height * 0.95:
+                        note_skipped(info)
                         continue
                 
+                # Dimension and aspect checks need no bytes; the size check
+                # below needs the extracted stream
+                if not has_product_image_shape(info.width, info.height):
+                    note_skipped(info)
+                    continue
+                
+                base_image = doc.extract_image(xref)
+                note_read(info)
+                image_bytes = base_image["image"]
+                width = base_image.get("width", 0)
+                height = base_image.get("height", 0)
+                size_bytes = len(image_bytes)
+                
                 # Check if this is a good product image
                 if not is_good_product_image(width, height, size_bytes):
                     continue
@@ -650,22 +781,21 @@ def extract_makita_product_images(
                 img_path = output_dir / img_filename
                 
                 # Save image
-                if not img_path.exists():
-                    pil_img = Image.open(io.BytesIO(image_bytes))
-                    if pil_img.mode not in ("RGB", "RGBA", "LA", "P"):
-                        pil_img = pil_img.convert("RGB")
-                    pil_img.save(img_path, "WEBP", quality=90)
+                save_catalog_webp(
+                    image_bytes, img_path,
+                    lambda e, i=img_idx: METRICS.warn(f"    Warning: Failed to extract Makita image {i} from page {page_num}: {e}", pdf=pdf_path.name, page=page_num),
+                )
                 
                 rel_path = f"images/{pdf_stem}/{img_filename}"
                 good_images.append((rel_path, size_bytes))
                 
             except Exception as e:
-                print(f"    Warning: Failed to extract Makita image {img_idx} from page {page_num}: {e}")
+                METRICS.warn(f"    Warning: Failed to extract Makita image {img_idx} from page {page_num}: {e}", pdf=pdf_path.name, page=page_num)
         
         doc.close()
         
     except Exception as e:
-        print(f"    Warning: Failed to open Makita PDF for image extraction: {e}")
+        METRICS.warn(f"    Warning: Failed to open Makita PDF for image extraction: {e}", pdf=pdf_path.name)
     
     # Sort by file size descending (largest = best quality)
     good_images.sort(key=lambda x: x[1], reverse=True)
@@ -673,12 +803,102 @@ def extract_makita_product_images(
     return good_images
 
 
+@dataclass
+class IndexedImage:
+    """One embedded image placement on a page, as recorded by PdfImageIndex."""
+
+    img_idx: int
+    xref: int
+    width: int = 0
+    height: int = 0
+    # Raw bytes, filled by PdfImageIndex.image_bytes() on first use
+    image_bytes: Optional[bytes] = None
+    # First placement rect in PyMuPDF page space (None if the image is not placed)
+    rect: Optional[Tuple[float, float, float, float]] = None
+    info: Optional[ImageInfo] = None
+
+
+class PdfImageIndex:
+    """Per-PDF image index: opens the document once and records, per page,
+    each image's xref, dimensions and placement rect on first touch.
+
+    process_pdf asks for the same page's images once per table and once per
+    series, so caching avoids resolving the same xrefs repeatedly. Only the
+    metadata is read up front; an image's bytes are extracted when a caller
+    actually writes it (image_bytes), so filtered-out images are never read.
+    Only the most recently touched pages are kept to bound memory on large
+    catalogs (pages are visited in order).
+    """
+
+    def __init__(self, pdf_path: Path, max_pages: int = 2):
+        self.pdf_path = pdf_path
+        self.max_pages = max_pages
+        self._doc = None
+        self._pages: Dict[int, Tuple[float, List[IndexedImage]]] = {}
+        # Output files already written (or found on disk) during this run
+        self.written: set = set()
+
+    def _open(self):
+        if self._doc is None:
+            self._doc = fitz.open(str(self.pdf_path))
+        return self._doc
+
+    def page_images(self, page_num: int) -> Tuple[float, List[IndexedImage]]:
+        """Return (page_width, images) for a 1-indexed page."""
+        cached = self._pages.get(page_num)
+        if cached is not None:
+            return cached
+
+        doc = self._open()
+        page = doc[page_num - 1]
+        images: List[IndexedImage] = []
+        for img_idx, info in enumerate(page_image_infos(doc, page)):
+            entry = IndexedImage(img_idx=img_idx, xref=info.xref, width=info.width, height=info.height, info=info)
+            if entry.width >= 50 and entry.height >= 50:
+                try:
+                    rects = page.get_image_rects(info.xref)
+                except Exception:
+                    rects = []
+                if rects:
+                    r = rects[0]
+                    entry.rect = (float(r.x0), float(r.y0), float(r.x1), float(r.y1))
+            images.append(entry)
+
+        result = (page.rect.width, images)
+        while len(self._pages) >= self.max_pages:
+            self._retire(self._pages.pop(next(iter(self._pages)))[1])
+        self._pages[page_num] = result
+        return result
+
+    def image_bytes(self, image: IndexedImage) -> bytes:
+        """The image's raw bytes (extracted once, on first call)."""
+        if image.image_bytes is None:
+            image.image_bytes = self._open().extract_image(image.xref)["image"]
+            note_read(image.info)
+        return image.image_bytes
+
+    def _retire(self, images: List[IndexedImage]) -> None:
+        # Images whose bytes no caller asked for were filtered on metadata
+        for image in images:
+            if image.image_bytes is None and image.info is not None:
+                note_skipped(image.info)
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        for _, images in self._pages.values():
+            self._retire(images)
+        self._pages.clear()
+
+
 def extract_images_with_bboxes_from_page(
     pdf_path: Path,
     page_num: int,
     series_slug: str,
     output_dir: Optional[Path] = None,
     column_filter: Optional[str] = None,  # 'left', 'right', or None for all
+    image_index: Optional[PdfImageIndex] = None,
 ) -> List[Tuple[str, Tuple[float, float, float, float]]]:
     """Extract images from a PDF page and also return their page-space bounding boxes.
 
@@ -686,6 +906,8 @@ def extract_images_with_bboxes_from_page(
     - (relative_image_path, (x0, y0, x1, y1))
 
     The bbox coordinates are in the PDF page coordinate space as returned by PyMuPDF.
+    Pass a shared PdfImageIndex to reuse the open document and the page's
+    extracted images across calls.
     """
     if not HAS_FITZ or not HAS_PIL:
         return []
@@ -697,42 +919,33 @@ def extract_images_with_bboxes_from_page(
 
     out: List[Tuple[str, Tuple[float, float, float, float]]] = []
 
+    own_index = image_index is None
+    index = image_index if image_index is not None else PdfImageIndex(pdf_path)
     try:
-        doc = fitz.open(str(pdf_path))
-        page = doc[page_num - 1]
-        page_width = page.rect.width
+        page_width, images = index.page_images(page_num)
         page_mid_x = page_width / 2
 
         filtered_img_count = 0
-        for img_idx, img_info in enumerate(page.get_images(full=True)):
+        for img in images:
             try:
-                xref = img_info[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-
-                width = base_image.get("width", 0)
-                height = base_image.get("height", 0)
-                if width < 50 or height < 50:
+                if img.width < 50 or img.height < 50:
                     continue
 
                 # Use the first placement rect as the representative bbox.
-                rects = []
-                try:
-                    rects = page.get_image_rects(xref)
-                except Exception:
-                    rects = []
-                if not rects:
+                if img.rect is None:
                     continue
+                x0, y0, x1, y1 = img.rect
 
-                rect = rects[0]
-                
                 # Filter by column if specified
-                img_center_x = (rect.x0 + rect.x1) / 2
+                img_center_x = (x0 + x1) / 2
                 if column_filter == 'left' and img_center_x >= page_mid_x:
                     continue  # Skip right-side images
                 if column_filter == 'right' and img_center_x < page_mid_x:
                     continue  # Skip left-side images
 
+                # Survivors only: extracted once, then cached on the index
+                image_bytes = index.image_bytes(img)
+
                 # Use filtered count for naming (not raw img_idx)
                 if filtered_img_count == 0:
                     img_filename = f"{pdf_stem}__p{page_num}__{series_slug}.webp"
@@ -741,22 +954,24 @@ def extract_images_with_bboxes_from_page(
                 filtered_img_count += 1
 
                 img_path = output_dir / img_filename
-                if not img_path.exists():
-                    pil_img = Image.open(io.BytesIO(image_bytes))
-                    if pil_img.mode in ("RGBA", "LA", "P"):
-                        pass
-                    elif pil_img.mode != "RGB":
-                        pil_img = pil_img.convert("RGB")
-                    pil_img.save(img_path, "WEBP", quality=90)
+                if img_path not in index.written:
+                    save_catalog_webp(
+                        image_bytes, img_path,
+                        lambda e, i=img.img_idx: METRICS.warn(
+                            f"    Warning: Failed to extract image {i} from page {page_num}: {e}", pdf=pdf_path.name, page=page_num,
+                        ),
+                    )
+                index.written.add(img_path)
 
                 rel_path = f"images/{pdf_stem}/{img_filename}"
-                out.append((rel_path, (float(rect.x0), float(rect.y0), float(rect.x1), float(rect.y1))))
+                out.append((rel_path, img.rect))
             except Exception as e:
-                print(f"    Warning: Failed to extract image {img_idx} from page {page_num}: {e}")
-
-        doc.close()
+                METRICS.warn(f"    Warning: Failed to extract image {img.img_idx} from page {page_num}: {e}", pdf=pdf_path.name, page=page_num)
     except Exception as e:
-        print(f"    Warning: Failed to open PDF for image extraction: {e}")
+        METRICS.warn(f"    Warning: Failed to open PDF for image extraction: {e}", pdf=pdf_path.name)
+    finally:
+        if own_index:
+            index.close()
 
     return out
 
@@ -780,6 +995,399 @@ def _bbox_area(a: Tuple[float, float, float, float]) -> float:
     return float((x1 - x0) * (y1 - y0))
 
 
+# ============================================================================
+# PAGE LAYOUT CACHE - Per-page char/word/rect index shared by page helpers
+# ============================================================================
+
+class PageLayout:
+    """Spatial index over one pdfplumber page, built once and queried by region.
+
+    Helpers like has_dema_footer, extract_blue_header_text or
+    extract_category_above_table used to scan all of page.chars (or build a
+    within_bbox() cropped page) on every call. PageLayout keeps the chars and
+    rects sorted by `top` so a region query only touches the chars in its
+    vertical band. Results are returned in original page order so text and
+    word extraction match pdfplumber exactly.
+    """
+
+    def __init__(self, page):
+        self.bbox = page.bbox
+        self.width = page.width
+        self.height = page.height
+        self.chars: List[Dict[str, Any]] = page.chars or []
+        self._char_order = sorted(range(len(self.chars)), key=lambda i: self.chars[i].get("top", 0))
+        self._char_tops = [self.chars[i].get("top", 0) for i in self._char_order]
+        rects = page.rects or []
+        self._rects = sorted(rects, key=lambda r: r.get("top", 0))
+        self._rect_tops = [r.get("top", 0) for r in self._rects]
+        # bucket size -> LineIndex, built on first use
+        self._lines: Dict[int, "LineIndex"] = {}
+        self._bold_fonts: Dict[str, bool] = {}
+
+    def chars_by_top(
+        self,
+        lo: Optional[float] = None,
+        hi: Optional[float] = None,
+        lo_inclusive: bool = True,
+        hi_inclusive: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Chars whose `top` lies between lo and hi, in page order."""
+        tops = self._char_tops
+        start = 0
+        end = len(tops)
+        if lo is not None:
+            start = bisect_left(tops, lo) if lo_inclusive else bisect_right(tops, lo)
+        if hi is not None:
+            end = bisect_right(tops, hi) if hi_inclusive else bisect_left(tops, hi)
+        if start >= end:
+            return []
+        return [self.chars[i] for i in sorted(self._char_order[start:end])]
+
+    def chars_within(self, bbox: Tuple[float, float, float, float]) -> List[Dict[str, Any]]:
+        """Equivalent of page.within_bbox(bbox).chars."""
+        test_proposed_bbox(bbox, self.bbox)
+        candidates = self.chars_by_top(bbox[1], bbox[3])
+        return pdfplumber.utils.within_bbox(candidates, bbox)
+
+    def words_within(self, bbox: Tuple[float, float, float, float]) -> List[Dict[str, Any]]:
+        """Equivalent of page.within_bbox(bbox).extract_words()."""
+        return pdfplumber.utils.extract_words(self.chars_within(bbox))
+
+    def text_within(self, bbox: Tuple[float, float, float, float]) -> str:
+        """Equivalent of page.within_bbox(bbox).extract_text()."""
+        chars = self.chars_within(bbox)
+        textmap = pdfplumber.utils.chars_to_textmap(
+            chars,
+            layout_bbox=bbox,
+            layout_width=bbox[2] - bbox[0],
+            layout_height=bbox[3] - bbox[1],
+        )
+        return textmap.as_string
+
+    def line_index(self, bucket: int) -> "LineIndex":
+        """Chars grouped into lines by round(top / bucket) * bucket (cached)."""
+        index = self._lines.get(bucket)
+        if index is None:
+            index = LineIndex(self.chars, bucket)
+            self._lines[bucket] = index
+        return index
+
+    def lines(
+        self,
+        bucket: int,
+        lo: Optional[float] = None,
+        hi: Optional[float] = None,
+        lo_inclusive: bool = True,
+        hi_inclusive: bool = True,
+    ) -> List[Tuple[float, List[Dict[str, Any]]]]:
+        """Chars grouped into lines by round(top / bucket) * bucket.
+
+        Returns [(y_key, chars sorted by x0)] sorted by y_key, restricted to
+        chars whose top lies between lo and hi.
+        """
+        def _keep(top: float) -> bool:
+            if lo is not None and (top < lo if lo_inclusive else top <= lo):
+                return False
+            if hi is not None and (top > hi if hi_inclusive else top >= hi):
+                return False
+            return True
+
+        out: List[Tuple[float, List[Dict[str, Any]]]] = []
+        for line in self.line_index(bucket).band(lo, hi):
+            kept = [c for c in line.chars if _keep(c.get("top", 0))]
+            if kept:
+                out.append((line.y, kept))
+        return out
+
+    def rects_below(self, top: float) -> List[Dict[str, Any]]:
+        """Rects whose top is at or below the given y (e.g. footer zone)."""
+        return self._rects[bisect_left(self._rect_tops, top):]
+
+    def is_bold(self, ch: Dict[str, Any]) -> bool:
+        fontname = ch.get("fontname") or ""
+        bold = self._bold_fonts.get(fontname)
+        if bold is None:
+            bold = is_bold_font(fontname)
+            self._bold_fonts[fontname] = bold
+        return bold
+
+
+class TextLine:
+    """One bucketed text line: chars sorted by x0 plus precomputed word gaps."""
+
+    __slots__ = ("y", "chars", "x0s", "seps", "min_top", "max_top")
+
+    # Gap (in points) between a char's x1 and the next char's x0 that counts
+    # as a word boundary when rebuilding line text
+    WORD_GAP = 3
+
+    def __init__(self, y: float, chars: List[Dict[str, Any]]):
+        self.y = y
+        self.chars = chars
+        self.x0s = [c["x0"] for c in chars]
+        tops = [c["top"] for c in chars]
+        self.min_top = min(tops)
+        self.max_top = max(tops)
+        # seps[i]: separator placed before chars[i] when chars[i - 1] precedes it
+        self.seps = [""] * len(chars)
+        for i in range(1, len(chars)):
+            if chars[i]["x0"] - self._right(chars[i - 1]) > self.WORD_GAP:
+                self.seps[i] = " "
+
+    @staticmethod
+    def _right(c: Dict[str, Any]) -> float:
+        # Estimate x1 if not present
+        return c["x1"] if "x1" in c else c["x0"] + 6
+
+    def text_between(self, x0: float, x1: float, top: float, bottom: float) -> str:
+        """Text of the chars with x0 in [x0, x1] and top in [top, bottom]."""
+        i0 = bisect_left(self.x0s, x0)
+        i1 = bisect_right(self.x0s, x1)
+        if i0 >= i1:
+            return ""
+        if top <= self.min_top and self.max_top <= bottom:
+            # Contiguous run of the line: reuse the precomputed gaps
+            parts = [self.chars[i0]["text"]]
+            for i in range(i0 + 1, i1):
+                parts.append(self.seps[i])
+                parts.append(self.chars[i]["text"])
+            return "".join(parts)
+        # Line straddles the band edge: rebuild gaps over the kept chars only
+        parts = []
+        prev = None
+        for c in self.chars[i0:i1]:
+            if not top <= c["top"] <= bottom:
+                continue
+            if prev is not None and c["x0"] - self._right(prev) > self.WORD_GAP:
+                parts.append(" ")
+            parts.append(c["text"])
+            prev = c
+        return "".join(parts)
+
+
+class LineIndex:
+    """Page chars bucketed into y-sorted TextLines with bisect lookup by band."""
+
+    def __init__(self, chars: List[Dict[str, Any]], bucket: int):
+        self.bucket = bucket
+        grouped: Dict[float, List[Dict[str, Any]]] = {}
+        for ch in chars:
+            y = round(ch.get("top", 0) / bucket) * bucket
+            grouped.setdefault(y, []).append(ch)
+        self.lines = [
+            TextLine(y, sorted(grouped[y], key=lambda c: c.get("x0", 0)))
+            for y in sorted(grouped.keys())
+        ]
+        self.ys = [line.y for line in self.lines]
+
+    def band(self, lo: Optional[float] = None, hi: Optional[float] = None) -> List[TextLine]:
+        """Lines that may hold chars with top between lo and hi."""
+        # A line key is within bucket/2 of every char top it holds
+        start = 0 if lo is None else bisect_left(self.ys, lo - self.bucket)
+        end = len(self.ys) if hi is None else bisect_right(self.ys, hi + self.bucket)
+        return self.lines[start:end]
+
+    def texts_within(self, bbox: Tuple[float, float, float, float]) -> List[Tuple[float, str]]:
+        """[(y_key, line text)] for chars with x0 in [x0, x1] and top in [top, bottom]."""
+        x0, top, x1, bottom = bbox
+        out: List[Tuple[float, str]] = []
+        for line in self.band(top, bottom):
+            text = line.text_between(x0, x1, top, bottom).strip()
+            if text:
+                out.append((line.y, text))
+        return out
+
+
+def nearest_unused_line(ys: List[float], used: set, y: float, max_distance: float) -> Optional[int]:
+    """Index of the unused y closest to y (lower index on ties), or None if
+    none is strictly closer than max_distance. ys must be sorted."""
+    pos = bisect_left(ys, y)
+    below = pos - 1
+    while below >= 0 and below in used:
+        below -= 1
+    above = pos
+    while above < len(ys) and above in used:
+        above += 1
+    best: Optional[int] = None
+    best_distance = max_distance
+    for idx in (below, above):
+        if 0 <= idx < len(ys):
+            distance = abs(ys[idx] - y)
+            if distance < best_distance:
+                best, best_distance = idx, distance
+    return best
+
+
+_PAGE_LAYOUTS: "weakref.WeakKeyDictionary[Any, PageLayout]" = weakref.WeakKeyDictionary()
+
+
+def get_page_layout(page) -> PageLayout:
+    """Return the PageLayout for a pdfplumber page, building it on first use."""
+    layout = _PAGE_LAYOUTS.get(page)
+    if layout is None:
+        layout = PageLayout(page)
+        _PAGE_LAYOUTS[page] = layout
+    return layout
+
+
+def release_page(page) -> None:
+    """Drop a page's PageLayout and pdfplumber's parsed objects for it.
+
+    pdf.pages keeps every Page alive until the PDF is closed, together with its
+    chars/rects caches; releasing pages once they are analysed keeps memory
+    flat on large catalogs.
+    """
+    _PAGE_LAYOUTS.pop(page, None)
+    close = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+    if close is not None:
+        try:
+            close()
+        except Exception:
+            pass
+
+
+class RssTracker:
+    """Tracks peak resident memory while a catalog is processed.
+
+    Uses psutil when installed (sampled per page, so the peak is per catalog).
+    Otherwise falls back to resource.getrusage, which reports the process-wide
+    peak so far. Peak is None when neither is available (e.g. Windows without
+    psutil).
+    """
+
+    def __init__(self) -> None:
+        self._proc = psutil.Process() if HAS_PSUTIL else None
+        self.peak_bytes: Optional[int] = None
+        self.sample()
+
+    def sample(self) -> None:
+        rss: Optional[int] = None
+        if self._proc is not None:
+            try:
+                rss = self._proc.memory_info().rss
+            except Exception:
+                rss = None
+        elif resource is not None:
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+            rss = maxrss if sys.platform == "darwin" else maxrss * 1024
+        if rss is not None and (self.peak_bytes is None or rss > self.peak_bytes):
+            self.peak_bytes = rss
+
+    @property
+    def peak_mb(self) -> Optional[float]:
+        if self.peak_bytes is None:
+            return None
+        return round(self.peak_bytes / (1024 * 1024), 1)
+
+
+# ------------------------
+# Stage profiling (--profile)
+# ------------------------
+
+# Per-page stages, in pipeline order
+PROFILE_STAGES = ("text", "tables", "repair", "headers", "images", "webp_encode", "enrich", "flatten")
+# Pages listed in the report's slowest_pages
+PROFILE_SLOWEST_PAGES = 10
+# Reports go to <output_dir>/profiles/<stem>.profile.json. A subdirectory on
+# purpose: the webshop scripts load every *.json file in the output directory.
+PROFILE_DIRNAME = "profiles"
+
+
+class StageProfiler:
+    """Wall time per pipeline stage for the page currently being processed.
+
+    Stages nest (table finding includes cell repair, image extraction
+    includes WebP encoding); each stage is charged its own time only, so a
+    page's stage times never add up to more than the page took. Does nothing
+    unless enabled and a page is open (see begin/end).
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._timings: Optional[Dict[str, float]] = None
+        # [stage, start, time spent in nested stages]
+        self._stack: List[List[Any]] = []
+
+    def begin(self, timings: Dict[str, float]) -> None:
+        """Charge stages to `timings` until end()."""
+        self._timings = timings if self.enabled else None
+
+    def end(self) -> None:
+        self._timings = None
+        self._stack.clear()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        if self._timings is None:
+            yield
+            return
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self._timings[name] = self._timings.get(name, 0.0) + elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+
+# One per process; process_pdf (and page-shard workers) switch it on for --profile
+PROFILER = StageProfiler()
+
+
+def set_profiling(enabled: bool) -> None:
+    PROFILER.enabled = enabled
+
+
+def build_profile_report(
+    pdf_name: str,
+    pages: List[Dict[str, Any]],
+    catalog_stages: Dict[str, float],
+    wall_seconds: float,
+) -> Dict[str, Any]:
+    """Per-catalog --profile report: per-page stage times, totals, slowest pages."""
+    totals: Dict[str, float] = {s: 0.0 for s in PROFILE_STAGES}
+    for page in pages:
+        for stage, seconds in page["stages"].items():
+            totals[stage] = totals.get(stage, 0.0) + seconds
+    accounted = sum(totals.values()) + sum(catalog_stages.values())
+
+    def rounded(d: Dict[str, float]) -> Dict[str, float]:
+        return {k: round(v, 4) for k, v in d.items()}
+
+    profiled = [p for p in pages if not p.get("cached")]
+    slowest = sorted(profiled, key=lambda p: p["seconds"], reverse=True)[:PROFILE_SLOWEST_PAGES]
+    return {
+        "pdf": pdf_name,
+        "wall_seconds": round(wall_seconds, 4),
+        "pages": len(pages),
+        "cached_pages": len(pages) - len(profiled),
+        "totals": rounded(totals),
+        "catalog_stages": rounded(catalog_stages),
+        # Time outside the named stages (record assembly, output, PDF open)
+        "unattributed_seconds": round(max(0.0, wall_seconds - accounted), 4),
+        "slowest_pages": [
+            {"page": p["page"], "seconds": round(p["seconds"], 4), "stages": rounded(p["stages"])}
+            for p in slowest
+        ],
+        "per_page": [
+            dict(p, seconds=round(p["seconds"], 4), stages=rounded(p["stages"]))
+            for p in pages
+        ],
+    }
+
+
+def write_profile_report(output_dir: Path, pdf_stem: str, report: Dict[str, Any]) -> Path:
+    path = output_dir / PROFILE_DIRNAME / f"{pdf_stem}.profile.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
 # ============================================================================
 # DEMA CATALOG PAGE DETECTION - Detect pages with DEMA footer
 # ============================================================================
@@ -817,18 +1425,14 @@ def has_dema_footer(page) -> bool:
     Returns:
         True if DEMA footer detected
     """
-    page_height = page.height
-    page_width = page.width
+    layout = get_page_layout(page)
+    page_height = layout.height
+    page_width = layout.width
     
     # Look for rectangles in the bottom 50 points of the page
     footer_zone_top = page_height - 50
     
-    rects = page.rects or []
-    for rect in rects:
-        # Check if rectangle is in footer zone
-        if rect.get("top", 0) < footer_zone_top:
-            continue
-        
+    for rect in layout.rects_below(footer_zone_top):
         # Check if rectangle spans most of the page width
         rect_width = rect.get("width", 0) or (rect.get("x1", 0) - rect.get("x0", 0))
         if rect_width < page_width * 0.8:
@@ -848,8 +1452,7 @@ def has_dema_footer(page) -> bool:
                 return True
     
     # Alternative: check for "DEMA" text in footer zone
-    chars = page.chars or []
-    footer_chars = [c for c in chars if c.get("top", 0) > footer_zone_top]
+    footer_chars = layout.chars_by_top(footer_zone_top, lo_inclusive=False)
     footer_text = "".join(c.get("text", "") for c in footer_chars).upper()
     
     if "DEMA" in footer_text:
@@ -867,33 +1470,13 @@ def extract_blue_header_text(page) -> Optional[Tuple[str, str]]:
     Returns:
         Tuple of (series_slug, series_name) or None
     """
-    chars = page.chars or []
+    # Detecting chars on top of blue rectangles is unreliable; rely on text
+    # patterns in the upper portion of the page instead.
+    layout = get_page_layout(page)
+    header_zone_bottom = layout.height * 0.25  # Top 25% of page
     
-    # Group chars by their background color
-    blue_text_chars = []
-    
-    for char in chars:
-        # Check background color (non_stroking_color when text is on colored rect)
-        # This is tricky - we need to find chars that are on top of blue rectangles
-        pass  # Complex implementation - for now rely on text patterns
-    
-    # Fallback: Look for text matching series patterns in upper portion of page
-    page_height = page.height
-    header_zone_bottom = page_height * 0.25  # Top 25% of page
-    
-    header_chars = [c for c in chars if c.get("top", 0) < header_zone_bottom]
-    
-    # Group by line (similar y position)
-    lines = {}
-    for char in header_chars:
-        y = round(char.get("top", 0) / 5) * 5  # Round to nearest 5
-        if y not in lines:
-            lines[y] = []
-        lines[y].append(char)
-    
-    # Sort chars in each line by x position and join
-    for y in sorted(lines.keys()):
-        line_chars = sorted(lines[y], key=lambda c: c.get("x0", 0))
+    # Lines grouped by similar y position (rounded to nearest 5), chars sorted by x
+    for y, line_chars in layout.lines(5, hi=header_zone_bottom, hi_inclusive=False):
         line_text = "".join(c.get("text", "") for c in line_chars).strip()
         
         # Check if this looks like a series title
@@ -917,22 +1500,10 @@ def extract_yellow_specs_text(page, below_y: float = 0) -> Optional[str]:
     Returns:
         Specs text if found
     """
-    chars = page.chars or []
-    
-    # Look for chars below the specified y position
-    candidate_chars = [c for c in chars if c.get("top", 0) > below_y]
-    
-    # Group by line
-    lines = {}
-    for char in candidate_chars:
-        y = round(char.get("top", 0) / 5) * 5
-        if y not in lines:
-            lines[y] = []
-        lines[y].append(char)
-    
-    # Check each line for specs patterns
-    for y in sorted(lines.keys()):
-        line_chars = sorted(lines[y], key=lambda c: c.get("x0", 0))
+    layout = get_page_layout(page)
+    
+    # Check each line below the specified y position for specs patterns
+    for y, line_chars in layout.lines(5, lo=below_y, lo_inclusive=False):
         line_text = "".join(c.get("text", "") for c in line_chars).strip().upper()
         
         # Check if this matches any specs pattern
@@ -2126,11 +2697,6 @@ def infer_series_from_sku(sku: str, pdf_name: str) -> Optional[Tuple[str, str]]:
 
 
 def enrich_makita_specific(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -> None:
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "makita" not in source_pdf:
-        return
-
     # Extract prices from all fields containing € symbol
     # This catches prices in fields like 'prijs_in', 'excl_btw', etc.
     price_excl = None
@@ -2361,11 +2927,6 @@ def detect_sku_series(record: Dict[str, Any]) -> Optional[str]:
 
 
 def enrich_airpress_specific(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -> None:
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "airpress" not in source_pdf:
-        return
-
     series = None
     intake = None
     volume = None
@@ -2510,11 +3071,6 @@ def enrich_airpress_specific(rec: Dict[str, Any], enriched_ctx: Dict[str, Any])
 
 
 def enrich_bronpompen(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -> None:
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "bronpompen" not in source_pdf:
-        return
-
     variation: Dict[str, Any] = {}
 
     variation["type"] = rec.get("type")
@@ -2532,10 +3088,7 @@ def enrich_bronpompen(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -> None
 
     def to_float(val: Any) -> Optional[float]:
         if isinstance(val, str):
-            try:
-                return float(val.replace(",", "."))
-            except ValueError:
-                return None
+            return parse_quantity(val, "number").value
         if isinstance(val, (int, float)):
             return float(val)
         return None
@@ -2550,12 +3103,9 @@ def enrich_bronpompen(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -> None
 
     pump_dia = rec.get("pomp_dia_mm")
     if isinstance(pump_dia, str):
-        m = re.search(r"([0-9]+(?:,[0-9]+)?)", pump_dia)
-        if m:
-            try:
-                variation["pump_diameter_mm"] = float(m.group(1).replace(",", "."))
-            except ValueError:
-                pass
+        pump_dia_mm = parse_quantity(pump_dia, "first_number").value
+        if pump_dia_mm is not None:
+            variation["pump_diameter_mm"] = pump_dia_mm
 
     enriched_ctx["bronpomp_variation"] = variation
 
@@ -2566,12 +3116,6 @@ def enrich_drive_technology(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -
     Target shape matches the provided product_series.variations example,
     as far as fields are available in the extracted JSON.
     """
-
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "catalogus-aandrijftechniek" not in source_pdf:
-        return
-
     variation: Dict[str, Any] = {}
 
     # Inner diameter (bore) in mm
@@ -2621,12 +3165,6 @@ def enrich_black_fittings(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) ->
     Example: 7ZF9012 -> angle 90 deg, size_code "12" which corresponds
     to 1/2" from the size column.
     """
-
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "zwarte-draad-en-lasfittingen" not in source_pdf:
-        return
-
     sku_key: Optional[str] = None
     for k in rec.keys():
         if not isinstance(k, str):
@@ -2687,12 +3225,6 @@ def enrich_galvanized_pipes(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -
     - Header/column codes like GB38 or ZF118 map to SKUs, while the actual
       inch size is given in maat_* columns (e.g. 3/8", 1/8").
     """
-
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "verzinkte-buizen" not in source_pdf:
-        return
-
     # SKU code: look for cell values like GB34, GB2, ZF118, etc.
     sku_code: Optional[str] = None
     for k, v in rec.items():
@@ -2793,12 +3325,6 @@ def enrich_airpress_nl_fr(rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) ->
     - series_line: last non-empty, non-numeric line (multi-language series description)
     - series_code: single-letter series identifier from series_line (e.g. G, K)
     """
-
-    ctx = rec.get("_context") or {}
-    source_pdf = str(ctx.get("source_pdf") or "").lower()
-    if "airpress-catalogus-nl-fr" not in source_pdf:
-        return
-
     text: Optional[str] = None
     for k, v in rec.items():
         if not isinstance(k, str):
@@ -2915,12 +3441,77 @@ def build_family_id(
     return f"{base}-{digest}"
 
 
-def enrich_record(rec: Dict[str, Any]) -> Dict[str, Any]:
+# Catalog-specific enrichers: (name, source PDF substring, function), in the
+# order they run. Each one only applies to PDFs whose name contains the key.
+ENRICHERS: List[Tuple[str, str, Callable[[Dict[str, Any], Dict[str, Any]], None]]] = [
+    ("airpress", "airpress", enrich_airpress_specific),
+    ("makita", "makita", enrich_makita_specific),
+    ("bronpompen", "bronpompen", enrich_bronpompen),
+    ("drive_technology", "catalogus-aandrijftechniek", enrich_drive_technology),
+    ("black_fittings", "zwarte-draad-en-lasfittingen", enrich_black_fittings),
+    ("galvanized_pipes", "verzinkte-buizen", enrich_galvanized_pipes),
+    ("airpress_nl_fr", "airpress-catalogus-nl-fr", enrich_airpress_nl_fr),
+]
+
+
+@dataclass
+class CatalogEnrichment:
+    """Enrichment context resolved once per source PDF.
+
+    Holds the lowercased PDF name, its catalog group and the enrichers that
+    apply to it, plus per-enricher call counts and time for the summary.
+    """
+
+    source_pdf: str
+    source_key: str
+    catalog_group: Optional[str]
+    enrichers: List[Tuple[str, Callable[[Dict[str, Any], Dict[str, Any]], None]]]
+    calls: Dict[str, int] = field(default_factory=dict)
+    seconds: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def for_pdf(cls, source_pdf: str) -> "CatalogEnrichment":
+        key = source_pdf.lower()
+        return cls(
+            source_pdf=source_pdf,
+            source_key=key,
+            catalog_group=detect_catalog_group(key),
+            enrichers=[(n, fn) for n, match, fn in ENRICHERS if match in key],
+        )
+
+    def run(self, rec: Dict[str, Any], enriched_ctx: Dict[str, Any]) -> None:
+        for enricher_name, fn in self.enrichers:
+            t0 = time.perf_counter()
+            fn(rec, enriched_ctx)
+            self.seconds[enricher_name] = self.seconds.get(enricher_name, 0.0) + time.perf_counter() - t0
+            self.calls[enricher_name] = self.calls.get(enricher_name, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enricher_calls": dict(self.calls),
+            # Milliseconds: most enrichers take microseconds per record
+            "enricher_ms": {k: round(v * 1000, 2) for k, v in self.seconds.items()},
+        }
+
+
+def enrich_record(rec: Dict[str, Any], catalog: Optional[CatalogEnrichment] = None) -> Dict[str, Any]:
+    """Attach the _enriched block to a record.
+
+    `catalog` is the CatalogEnrichment of the PDF being processed; records
+    from another source (or without one) resolve their own.
+    """
+    with PROFILER.stage("enrich"):
+        return _enrich_record(rec, catalog)
+
+
+def _enrich_record(rec: Dict[str, Any], catalog: Optional[CatalogEnrichment]) -> Dict[str, Any]:
     ctx = rec.get("_context") or {}
     source_pdf = str(ctx.get("source_pdf") or "")
     category = ctx.get("category")
 
-    catalog_group = detect_catalog_group(source_pdf)
+    if catalog is None or catalog.source_pdf != source_pdf:
+        catalog = CatalogEnrichment.for_pdf(source_pdf)
+    catalog_group = catalog.catalog_group
 
     # Default: use detected category as series label, but for centrifugal pumps
     # the header row often contains a generic word like 'VARIATIES'. In that
@@ -2931,8 +3522,8 @@ def enrich_record(rec: Dict[str, Any]) -> Dict[str, Any]:
             series_raw = "centrifugaal pompen"
 
     series = slugify(series_raw) if series_raw else None
-    product_type = detect_product_type(source_pdf, category, rec)
-    material = detect_material(source_pdf, category)
+    product_type = detect_product_type(catalog.source_key, category, rec)
+    material = detect_material(catalog.source_key, category)
     family_id = build_family_id(catalog_group, product_type, series, rec)
     sku_series = detect_sku_series(rec)
 
@@ -2941,34 +3532,20 @@ def enrich_record(rec: Dict[str, Any]) -> Dict[str, Any]:
     if catalog_group in {"compressed_air", "plastic_pipes"}:
         maat_val = rec.get("maat")
         if isinstance(maat_val, str):
-            m = re.search(r"([0-9]+(?:,[0-9]+)?)\s*mm", maat_val.lower())
-            if m:
-                try:
-                    diameter_mm = float(m.group(1).replace(",", "."))
-                except ValueError:
-                    diameter_mm = None
+            diameter_mm = parse_quantity(maat_val, "mm").value
 
         lengte_val = rec.get("lengte")
         if isinstance(lengte_val, str):
-            m_len = re.search(r"([0-9]+(?:,[0-9]+)?)\s*m\b", lengte_val.lower())
-            if m_len:
-                try:
-                    length_m = float(m_len.group(1).replace(",", "."))
-                except ValueError:
-                    length_m = None
+            length_m = parse_quantity(lengte_val, "m").value
 
         if length_m is None:
             for k, v in rec.items():
                 if not isinstance(v, str) or not isinstance(k, str):
                     continue
                 if k.endswith("_m") or "lengte" in k.lower():
-                    m_len = re.search(r"([0-9]+(?:,[0-9]+)?)\s*m\b", v.lower())
-                    if m_len:
-                        try:
-                            length_m = float(m_len.group(1).replace(",", "."))
-                            break
-                        except ValueError:
-                            length_m = None
+                    length_m = parse_quantity(v, "m").value
+                    if length_m is not None:
+                        break
 
     enriched_ctx = EnrichedContext(
         series_raw=series_raw,
@@ -2986,14 +3563,7 @@ def enrich_record(rec: Dict[str, Any]) -> Dict[str, Any]:
     if length_m is not None:
         enriched_dict["length_m"] = length_m
 
-    enrich_airpress_specific(rec, enriched_dict)
-    enrich_makita_specific(rec, enriched_dict)
-
-    enrich_bronpompen(rec, enriched_dict)
-    enrich_drive_technology(rec, enriched_dict)
-    enrich_black_fittings(rec, enriched_dict)
-    enrich_galvanized_pipes(rec, enriched_dict)
-    enrich_airpress_nl_fr(rec, enriched_dict)
+    catalog.run(rec, enriched_dict)
 
     rec["_enriched"] = enriched_dict
     return rec
@@ -3286,15 +3856,9 @@ def parse_boolean(value: Optional[str]) -> Optional[bool]:
 def parse_range(value: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
     if not value:
         return None, None
-    text = value.replace(",", ".")
     # Match patterns like "0.6 - 4.8" or "35-61"
-    m = re.match(r"\s*([0-9]*\.?[0-9]+)\s*[-–]\s*([0-9]*\.?[0-9]+)\s*", text)
-    if not m:
-        return None, None
-    try:
-        return float(m.group(1)), float(m.group(2))
-    except ValueError:
-        return None, None
+    q = parse_quantity(value, "range")
+    return q.low, q.high
 
 
 def parse_inch_size(value: Optional[str]) -> Optional[float]:
@@ -3305,32 +3869,7 @@ def parse_inch_size(value: Optional[str]) -> Optional[float]:
 
     if not value:
         return None
-    text = str(value).strip().replace("\u201d", '"').replace("\u201c", '"')
-    text = text.replace("\"", "").strip()
-    if not text:
-        return None
-
-    total = 0.0
-    for part in text.split():
-        part = part.strip()
-        if not part:
-            continue
-        if "/" in part:
-            num, _, den = part.partition("/")
-            try:
-                n = float(num)
-                d = float(den)
-                if d != 0:
-                    total += n / d
-            except ValueError:
-                return None
-        else:
-            try:
-                total += float(part)
-            except ValueError:
-                return None
-
-    return total if total > 0 else None
+    return parse_quantity(str(value), "inch").value
 
 
 def is_bold_font(fontname: str) -> bool:
@@ -3340,11 +3879,9 @@ def is_bold_font(fontname: str) -> bool:
 
 def detect_row_bold(page: pdfplumber.page.Page, row_bbox: Tuple[float, float, float, float]) -> bool:
     """Heuristic: if any char in this bbox uses a bold-ish font, mark in_stock=True."""
-    x0, top, x1, bottom = row_bbox
-    chars = page.within_bbox((x0, top, x1, bottom)).chars
-    for ch in chars:
-        fontname = ch.get("fontname") or ""
-        if is_bold_font(fontname):
+    layout = get_page_layout(page)
+    for ch in layout.chars_within(tuple(row_bbox)):
+        if layout.is_bold(ch):
             return True
     return False
 
@@ -3359,7 +3896,7 @@ def extract_category_above_table(page: pdfplumber.page.Page, table_bbox: Tuple[f
     if search_x0 >= search_x1 or search_top >= top:
         return None, None
     # Slightly widen horizontally, but stay within page
-    words = page.within_bbox((search_x0, search_top, search_x1, top)).extract_words()
+    words = get_page_layout(page).words_within((search_x0, search_top, search_x1, top))
     if not words:
         return None, None
     # Group words by their vertical line; use first line as header and last as application
@@ -3406,7 +3943,7 @@ def extract_product_specs_above_table(page: pdfplumber.page.Page, table_bbox: Tu
     if search_x0 >= search_x1 or search_top >= top:
         return {}
 
-    text = page.within_bbox((search_x0, search_top, search_x1, top)).extract_text()
+    text = get_page_layout(page).text_within((search_x0, search_top, search_x1, top))
     if not text:
         return {}
 
@@ -3829,7 +4366,7 @@ def _row_looks_like_data(row: List[Optional[str]]) -> bool:
         if not cell_str:
             continue
         # Check against Airpress SKU pattern (5-10 digit codes with optional suffixes)
-        if re.match(r"^\d{5,10}(-[A-Za-z0-9.]+)?$", cell_str):
+        if AIRPRESS_SKU_CELL.match(cell_str):
             return True
     
     # Then check the first non-empty cell
@@ -3843,7 +4380,7 @@ def _row_looks_like_data(row: List[Optional[str]]) -> bool:
         if cell[0].isdigit():
             return True
         # Product codes: letters followed by digits (e.g. "ABSBU016", "7BUL14120", "ZF9012")
-        if re.match(r"^[A-Za-z]+\d+", cell):
+        if PRODUCT_CODE_PREFIX.match(cell):
             return True
         # Short alphanumeric codes with digits (e.g. "T1-40", "B-28606")
         if len(cell) <= 12 and any(c.isdigit() for c in cell):
@@ -3866,36 +4403,10 @@ def _repair_missing_cells_from_text(page: pdfplumber.page.Page, table_bbox: Tupl
     x0, top, x1, bottom = table_bbox
     row_height = (bottom - top) / len(rows) if rows else 20
     
-    # Extract all chars in the table area
-    table_chars = [c for c in page.chars 
-                   if top <= c['top'] <= bottom 
-                   and x0 <= c['x0'] <= x1]
-    
-    # Group chars by y position into text lines
-    from collections import defaultdict
-    lines_by_y = defaultdict(list)
-    for c in table_chars:
-        y_key = round(c['top'] / 2) * 2
-        lines_by_y[y_key].append(c)
-    
-    # Convert each line to full text with y position, adding spaces between words
-    text_lines = []
-    for y in sorted(lines_by_y.keys()):
-        chars = sorted(lines_by_y[y], key=lambda c: c['x0'])
-        # Build text with spaces where there are gaps
-        text_parts = []
-        prev_x1 = None
-        for c in chars:
-            if prev_x1 is not None:
-                gap = c['x0'] - prev_x1
-                # If gap is larger than average char width, add space
-                if gap > 3:  # ~3px gap indicates word boundary
-                    text_parts.append(' ')
-            text_parts.append(c['text'])
-            prev_x1 = c['x1'] if 'x1' in c else c['x0'] + 6  # Estimate x1 if not present
-        text = ''.join(text_parts).strip()
-        if text:
-            text_lines.append((y, text))
+    # Text lines (chars grouped by y, spaces at word gaps) in the table area,
+    # looked up from the page's line index instead of rescanning page.chars
+    text_lines = get_page_layout(page).line_index(2).texts_within(table_bbox)
+    text_line_ys = [y for y, _ in text_lines]
     
     # Match text lines to rows by finding the closest y position
     used_text_lines = set()
@@ -3905,18 +4416,8 @@ def _repair_missing_cells_from_text(page: pdfplumber.page.Page, table_bbox: Tupl
         row_center_y = top + (i + 0.5) * row_height
         
         # Find the closest text line for this row
-        best_match_idx = None
-        best_match_text = None
-        best_distance = float('inf')
-        
-        for idx, (y, text) in enumerate(text_lines):
-            if idx in used_text_lines:
-                continue
-            distance = abs(y - row_center_y)
-            if distance < best_distance and distance < row_height:
-                best_distance = distance
-                best_match_idx = idx
-                best_match_text = text
+        best_match_idx = nearest_unused_line(text_line_ys, used_text_lines, row_center_y, row_height)
+        best_match_text = text_lines[best_match_idx][1] if best_match_idx is not None else None
         
         # Check if row needs repair (has any None values)
         row_has_none = row and any(v is None or (isinstance(v, str) and not v.strip()) for v in row)
@@ -3971,13 +4472,73 @@ def _repair_missing_cells_from_text(page: pdfplumber.page.Page, table_bbox: Tupl
     return repaired
 
 
-def find_tables_with_bboxes(page: pdfplumber.page.Page) -> List[ExtractedTable]:
+def table_regions(page: pdfplumber.page.Page, profile: Dict[str, Any]) -> List[Tuple[float, float, float, float]]:
+    """Regions of the page searched for tables under a table-detection profile.
+
+    The page bbox minus crop_margins (left, top, right, bottom, in points),
+    cut into columns at column_splits (fractions of the content width).
+    """
+    px0, ptop, px1, pbottom = page.bbox
+    left, top, right, bottom = profile.get("crop_margins") or (0, 0, 0, 0)
+    x0, y0 = px0 + left, ptop + top
+    x1, y1 = max(x0, px1 - right), max(y0, pbottom - bottom)
+
+    edges = [x0] + [x0 + (x1 - x0) * f for f in sorted(profile.get("column_splits") or ())] + [x1]
+    return [(a, y0, b, y1) for a, b in zip(edges, edges[1:]) if b > a]
+
+
+def find_raw_tables(page: pdfplumber.page.Page, profile: Optional[Dict[str, Any]] = None) -> List[Any]:
+    """pdfplumber tables on the page, honouring a PDF_CONFIG table_detection profile.
+
+    Without a profile this is page.find_tables() with pdfplumber's defaults.
+    With one, only the profile's regions are searched (cropped pages keep page
+    coordinates), using its table_settings. If a found table's ruling runs
+    across a column split, the split cut a full-width table in half: the
+    content area is then searched whole instead.
+    """
+    if not profile:
+        return page.find_tables()
+    settings = profile.get("table_settings") or {}
+    regions = table_regions(page, profile)
+    found = _find_tables_in_regions(page, regions, settings)
+    splits = [region[2] for region in regions[:-1]]
+    if splits and found and _ruling_crosses_splits(page, found, splits):
+        whole = table_regions(page, {**profile, "column_splits": ()})
+        found = _find_tables_in_regions(page, whole, settings)
+    return found
+
+
+def _ruling_crosses_splits(page: pdfplumber.page.Page, tables: Sequence[Any], splits: Sequence[float]) -> bool:
+    """True if a horizontal ruling line within a table's rows crosses a split."""
+    for edge in page.horizontal_edges:
+        for t in tables:
+            if not (t.bbox[1] - 1 <= edge["top"] <= t.bbox[3] + 1):
+                continue
+            if any(edge["x0"] < x - 1 and edge["x1"] > x + 1 for x in splits):
+                return True
+    return False
+
+
+def _find_tables_in_regions(
+    page: pdfplumber.page.Page,
+    regions: Sequence[Tuple[float, float, float, float]],
+    settings: Dict[str, Any],
+) -> List[Any]:
+    found: List[Any] = []
+    for region in regions:
+        region_page = page if region == tuple(page.bbox) else page.crop(region)
+        found.extend(region_page.find_tables(settings))
+    return found
+
+
+def find_tables_with_bboxes(page: pdfplumber.page.Page, profile: Optional[Dict[str, Any]] = None) -> List[ExtractedTable]:
     """Use pdfplumber's table finder to get tables plus row bboxes.
 
     This gives us geometry for category detection and bold detection.
+    `profile` is the catalog's table_detection profile (see PDF_CONFIG).
     """
     tables: List[ExtractedTable] = []
-    for t in page.find_tables():
+    for t in find_raw_tables(page, profile):
         raw = t.extract()
         if not raw:
             continue
@@ -4027,7 +4588,8 @@ def find_tables_with_bboxes(page: pdfplumber.page.Page) -> List[ExtractedTable]:
             adjusted_bbox = t.bbox
         
         num_cols = max(len(r) for r in data_rows) if data_rows else 0
-        data_rows = _repair_missing_cells_from_text(page, adjusted_bbox, data_rows, num_cols)
+        with PROFILER.stage("repair"):
+            data_rows = _repair_missing_cells_from_text(page, adjusted_bbox, data_rows, num_cols)
         
         # If no header was detected, generate column names based on data width
         if not header and data_rows:
@@ -4637,9 +5199,9 @@ def extract_aandrijftechniek(row: DataRow, header: List[str], page: pdfplumber.p
     if not obj.get("code") and row_bbox:
         x0, top, x1, bottom = row_bbox
         # Crop to the first ~25% of the row (where CODE column is)
-        code_area = page.within_bbox((x0, top, x0 + (x1 - x0) * 0.25, bottom))
+        code_area = (x0, top, x0 + (x1 - x0) * 0.25, bottom)
         if code_area:
-            text = code_area.extract_text() or ""
+            text = get_page_layout(page).text_within(code_area) or ""
             # Find CODE pattern in extracted text
             for word in text.split():
                 word = word.strip()
@@ -5071,7 +5633,7 @@ def extract_kranzle_transposed(table: ExtractedTable) -> List[Dict[str, Any]]:
     rows = [clean_row(r) for r in table.rows]
     
     # Kranzle SKU pattern: 5-6 digit article numbers, optionally with suffix
-    kranzle_sku_pattern = re.compile(r'^\d{5,6}(-\d+)?$')
+    kranzle_sku_pattern = KRANZLE_SKU
     
     products: List[Dict[str, Any]] = []
     
@@ -5157,16 +5719,6 @@ def extract_kranzle_transposed(table: ExtractedTable) -> List[Dict[str, Any]]:
 # MAKITA PRICE AND PROPERTY EXTRACTION - Regex-based parsing
 # ============================================================================
 
-# Regex patterns for extracting prices from various Makita catalog formats
-PRICE_PATTERNS = [
-    # Standard format: "€ 495,00" or "€495,00" or "€ 1.495,00"
-    re.compile(r"€\s*([\d.]+,\d{2})"),
-    # With space in number: "€ 419 ,00"
-    re.compile(r"€\s*([\d.]+)\s*,\s*(\d{2})"),
-    # Price range: "€ 495,00 - € 595,00" (take first)
-    re.compile(r"€\s*([\d.]+,\d{2})\s*[-–]"),
-]
-
 # Regex patterns for extracting technical properties
 PROPERTY_PATTERNS = {
     # Voltage patterns: "18V", "2 x 18V", "40Vmax", "230V"
@@ -5207,26 +5759,8 @@ def parse_euro_price(value: str) -> Optional[float]:
     if not value or "€" not in str(value):
         return None
     
-    value_str = str(value)
-    
-    # Try each pattern
-    for pattern in PRICE_PATTERNS:
-        match = pattern.search(value_str)
-        if match:
-            try:
-                if len(match.groups()) == 2:
-                    # Pattern with separated decimal: "419 ,00"
-                    price_str = f"{match.group(1)},{match.group(2)}"
-                else:
-                    price_str = match.group(1)
-                
-                # Normalize: remove thousand separators (.), replace decimal comma with dot
-                price_str = price_str.replace(".", "").replace(",", ".")
-                return float(price_str)
-            except (ValueError, AttributeError):
-                continue
-    
-    return None
+    # Patterns tried in order: see quantities.PRICE_PATTERNS
+    return parse_quantity(str(value), "eur").value
 
 
 def extract_makita_prices(record: Dict[str, Any]) -> None:
@@ -5462,314 +5996,340 @@ def generate_series_id(category: Optional[str], pdf_name: str, include_pdf_prefi
     return pdf_stem
 
 
-def flatten_records_with_grouping(records: List[Dict[str, Any]], pdf_name: str) -> List[Dict[str, Any]]:
-    """Convert all records to flat format with grouping metadata.
-    
-    Each record gets:
-    - sku: the canonical SKU field
-    - series_id: slugified grouping key for client-side aggregation
-    - series_name: human-readable series/category name
-    - All original fields preserved
-    - Inherited specs denormalized from _context.product_specs
+# Values sampled per col_N column when voting on its semantic name
+COLUMN_VOTE_SAMPLE = 25
+
+
+def column_group_key(rec: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Records sharing this key come from the same table/series and share
+    column semantics: (page, series id or category)."""
+    ctx = rec.get("_context") or {}
+    return ctx.get("page_number"), ctx.get("series_id") or ctx.get("category")
+
+
+def infer_column_renames(records: Sequence[Dict[str, Any]]) -> Dict[str, str]:
+    """Decide semantic names for generic col_N fields once for a group of records.
+
+    Each column is classified (catalog_patterns.classify_cell) on an evenly
+    spaced sample of its non-empty values; the kind with a strict majority of
+    the sample wins. Unclassifiable values vote for keeping col_N.
     """
-    flat: List[Dict[str, Any]] = []
-    
+    values: Dict[str, List[str]] = {}
     for rec in records:
-        if not isinstance(rec, dict):
-            continue
-        
-        ctx = rec.get("_context") or {}
-        enr = rec.get("_enriched") or {}
-        product_specs = ctx.get("product_specs") or {}
-        
-        # Build the flat record
-        out: Dict[str, Any] = {}
-        
-        # 1. SKU - canonical field
-        sku = rec.get("sku")
-        if not sku:
-            # Try common alternatives in priority order
-            for k in ("order_number", "bestelnr", "code", "model"):
-                v = rec.get(k)
-                if isinstance(v, str) and v.strip():
-                    sku = v.strip()
-                    break
+        for k, v in rec.items():
+            if k.startswith("col_") and isinstance(v, str) and v.strip():
+                values.setdefault(k, []).append(v.strip())
+
+    renames: Dict[str, str] = {}
+    for col, col_values in values.items():
+        step = max(1, len(col_values) // COLUMN_VOTE_SAMPLE)
+        sample = col_values[::step][:COLUMN_VOTE_SAMPLE]
+        votes: Dict[Optional[str], int] = {}
+        for v in sample:
+            kind = classify_cell(v, col)
+            votes[kind] = votes.get(kind, 0) + 1
+        # max() keeps the first kind seen on ties
+        winner = max(votes, key=lambda kind: votes[kind])
+        if winner is not None and votes[winner] * 2 > len(sample):
+            renames[col] = winner
+    return renames
+
+
+def column_renames_by_group(records: Sequence[Dict[str, Any]]) -> Dict[Tuple[Any, Any], Dict[str, str]]:
+    """infer_column_renames per column_group_key: col_N semantics are shared
+    by all rows of a table, so they are decided once per group."""
+    groups: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+    for rec in records:
+        if isinstance(rec, dict):
+            groups.setdefault(column_group_key(rec), []).append(rec)
+    return {key: infer_column_renames(recs) for key, recs in groups.items()}
+
+
+def flatten_record(
+    rec: Dict[str, Any],
+    pdf_name: str,
+    col_renames: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Convert one extracted record to the flat output format.
+
+    Returns None for records that should be dropped (no or invalid SKU).
+    See flatten_records_with_grouping for the resulting fields. col_renames
+    is the table-level col_N rename map (infer_column_renames); without it the
+    record's own values decide.
+    """
+    if not isinstance(rec, dict):
+        return None
+    
+    ctx = rec.get("_context") or {}
+    enr = rec.get("_enriched") or {}
+    product_specs = ctx.get("product_specs") or {}
+    
+    # Build the flat record
+    out: Dict[str, Any] = {}
+    
+    # 1. SKU - canonical field
+    sku = rec.get("sku")
+    if not sku:
+        # Try common alternatives in priority order
+        for k in ("order_number", "bestelnr", "code", "model"):
+            v = rec.get(k)
+            if isinstance(v, str) and v.strip():
+                sku = v.strip()
+                break
+    
+    # If still no SKU, check col_0 and col_1 with smart detection
+    if not sku:
+        col_0 = rec.get("col_0")
+        col_1 = rec.get("col_1")
         
-        # If still no SKU, check col_0 and col_1 with smart detection
-        if not sku:
-            col_0 = rec.get("col_0")
-            col_1 = rec.get("col_1")
-            
-            # col_0 looks like a measurement (e.g., "1/2"", "3/4"", "1 "", "20 mm") -> use col_1 as SKU
-            if isinstance(col_0, str) and re.match(r'^[\d/]+\s*["\']?$|^\d+\s*mm$', col_0.strip()):
-                if isinstance(col_1, str) and col_1.strip():
-                    sku = col_1.strip()
-            # col_1 looks like a numeric article code (e.g., "45349") -> use col_1 as SKU
-            elif isinstance(col_1, str) and re.match(r'^\d{4,}$', col_1.strip()):
+        # col_0 looks like a measurement (e.g., "1/2"", "3/4"", "1 "", "20 mm") -> use col_1 as SKU
+        if isinstance(col_0, str) and MEASUREMENT_CELL.match(col_0.strip()):
+            if isinstance(col_1, str) and col_1.strip():
                 sku = col_1.strip()
-            # Fallback to col_0 if it looks like an SKU (alphanumeric code)
-            elif isinstance(col_0, str) and re.match(r'^[A-Z]{2,}[A-Z0-9]+$', col_0.strip(), re.IGNORECASE):
-                sku = col_0.strip()
-            elif isinstance(col_0, str) and col_0.strip():
-                sku = col_0.strip()
-        
-        # Validate SKU - skip records with invalid/placeholder SKUs
-        if sku:
-            sku_str = str(sku).strip()
-            # Remove common PDF artifacts (checkmarks, bullets, etc.)
-            sku_str = re.sub(r'[\uf0fc\uf0fb\uf0a7\u2022\u2713\u2714]', '', sku_str).strip()
-            # Invalid patterns: "- -", "- XX cm", empty, just dashes/spaces, single dash
-            invalid_sku_patterns = [
-                r'^-\s*-$',           # "- -"
-                r'^-\s+\d+',          # "- 11,5 cm", "- 25 cm"
-                r'^-+\s*$',           # "---", "--", "- ", "-"
-                r'^\s*$',             # empty/whitespace
-                r'^\d+\s*-\s*$',      # "0 -", "1 -" (placeholder)
-            ]
-            is_invalid = any(re.match(p, sku_str) for p in invalid_sku_patterns)
-            if is_invalid:
-                continue  # Skip this record entirely
-            # Update sku with cleaned version
-            sku = sku_str
-        else:
-            continue  # Skip records without SKU
-        
-        # 1b. Makita-specific: If SKU doesn't look like a valid model code,
-        # try to extract from series_name or application field
-        if "makita" in pdf_name.lower():
-            makita_model_pattern = re.compile(r'^[A-Z]{2,3}\d{3,}[A-Z0-9]*$', re.IGNORECASE)
+        # col_1 looks like a numeric article code (e.g., "45349") -> use col_1 as SKU
+        elif isinstance(col_1, str) and NUMERIC_ARTICLE_CODE.match(col_1.strip()):
+            sku = col_1.strip()
+        # Fallback to col_0 if it looks like an SKU (alphanumeric code)
+        elif isinstance(col_0, str) and ALNUM_SKU.match(col_0.strip()):
+            sku = col_0.strip()
+        elif isinstance(col_0, str) and col_0.strip():
+            sku = col_0.strip()
+    
+    # Validate SKU - skip records with invalid/placeholder SKUs
+    if sku:
+        sku_str = str(sku).strip()
+        # Remove common PDF artifacts (checkmarks, bullets, etc.)
+        sku_str = SKU_ARTIFACTS.sub('', sku_str).strip()
+        # Invalid patterns: "- -", "- XX cm", empty, just dashes/spaces, single dash
+        if INVALID_SKU.match(sku_str):
+            return None  # Skip this record entirely
+        # Update sku with cleaned version
+        sku = sku_str
+    else:
+        return None  # Skip records without SKU
+    
+    # 1b. Makita-specific: If SKU doesn't look like a valid model code,
+    # try to extract from series_name or application field
+    if "makita" in pdf_name.lower():
+        makita_model_pattern = MAKITA_MODEL
+        if not makita_model_pattern.match(sku):
+            # Try series_name - often contains the actual model code
+            series_name_raw = ctx.get("series_name", "")
+            if series_name_raw:
+                # Extract first valid model code from series_name
+                # e.g., "UC010GZ UC010GT101 UC011GZ UC011GT101" -> "UC010GZ"
+                for part in str(series_name_raw).split():
+                    if makita_model_pattern.match(part):
+                        sku = part
+                        break
+            
+            # If still invalid, try application field
             if not makita_model_pattern.match(sku):
-                # Try series_name - often contains the actual model code
-                series_name_raw = ctx.get("series_name", "")
-                if series_name_raw:
-                    # Extract first valid model code from series_name
-                    # e.g., "UC010GZ UC010GT101 UC011GZ UC011GT101" -> "UC010GZ"
-                    for part in str(series_name_raw).split():
+                app = ctx.get("application", "") or rec.get("application", "")
+                if app:
+                    for part in str(app).split():
                         if makita_model_pattern.match(part):
                             sku = part
                             break
-                
-                # If still invalid, try application field
-                if not makita_model_pattern.match(sku):
-                    app = ctx.get("application", "") or rec.get("application", "")
-                    if app:
-                        for part in str(app).split():
-                            if makita_model_pattern.match(part):
+            
+            # Final check - if still invalid, skip this record
+            if not makita_model_pattern.match(sku):
+                return None
+    
+    # 1c. Kranzle-specific: Validate SKU is a proper article number (5-6 digits)
+    if "kranzle" in pdf_name.lower():
+        kranzle_sku_pattern = KRANZLE_SKU
+        if not kranzle_sku_pattern.match(sku):
+            # Try to extract from art_nr fields or model
+            for field in ["art_nr", "art_nr_ts_zonder_slanghaspel", "art_nr_tst_incl_slanghaspel"]:
+                val = rec.get(field)
+                if val and isinstance(val, str):
+                    val = val.strip()
+                    if kranzle_sku_pattern.match(val):
+                        sku = val
+                        break
+                    # Try extracting from pipe-separated value
+                    if "|" in val:
+                        for part in val.split("|"):
+                            part = part.strip()
+                            if kranzle_sku_pattern.match(part):
                                 sku = part
                                 break
-                
-                # Final check - if still invalid, skip this record
-                if not makita_model_pattern.match(sku):
-                    continue
-        
-        # 1c. Kranzle-specific: Validate SKU is a proper article number (5-6 digits)
-        if "kranzle" in pdf_name.lower():
-            kranzle_sku_pattern = re.compile(r'^\d{5,6}(-\d+)?$')
+            # If still invalid, skip
             if not kranzle_sku_pattern.match(sku):
-                # Try to extract from art_nr fields or model
-                for field in ["art_nr", "art_nr_ts_zonder_slanghaspel", "art_nr_tst_incl_slanghaspel"]:
-                    val = rec.get(field)
-                    if val and isinstance(val, str):
-                        val = val.strip()
-                        if kranzle_sku_pattern.match(val):
-                            sku = val
-                            break
-                        # Try extracting from pipe-separated value
-                        if "|" in val:
-                            for part in val.split("|"):
-                                part = part.strip()
-                                if kranzle_sku_pattern.match(part):
-                                    sku = part
-                                    break
-                # If still invalid, skip
-                if not kranzle_sku_pattern.match(sku):
-                    continue
-        
-        out["sku"] = sku
-        
-        # 2. Series/grouping metadata - prefer explicit series_id from context
-        category = ctx.get("category")
-        application = ctx.get("application")
-        
-        # Use series_id from context if available (from DEMA blue header detection)
-        ctx_series_id = ctx.get("series_id")
-        ctx_series_name = ctx.get("series_name")
-        
-        if ctx_series_id:
-            out["series_id"] = ctx_series_id
-        else:
-            out["series_id"] = generate_series_id(category, pdf_name)
-        
-        if ctx_series_name:
-            out["series_name"] = ctx_series_name
-        else:
-            out["series_name"] = category or pdf_name.replace(".pdf", "").replace("-", " ").title()
-        
-        # 2b. Improve series detection for messing/rvs fittings using SKU patterns
-        # If series_name is a poor placeholder, try to infer from SKU
-        poor_series_names = ["Bestelnr Maat", "Bestelnr Maten", "bestelnr maat"]
-        if out.get("series_name") in poor_series_names or (
-            out.get("series_name") and re.match(r'^(MF|RVS)\d+', str(out.get("series_name")))
-        ):
-            inferred_series = infer_series_from_sku(sku, pdf_name)
-            if inferred_series:
-                out["series_id"] = inferred_series[0]
-                out["series_name"] = inferred_series[1]
-        
-        # 3. Source PDF and page info for traceability
-        out["source_pdf"] = ctx.get("source_pdf")
-        out["page"] = ctx.get("page_number")
-        
-        # 4. Brand (from product_specs or context)
-        brand = product_specs.get("brand") or ctx.get("brand")
-        if brand:
-            out["brand"] = brand
-        
-        # 5. Copy all non-internal fields from original record
-        for k, v in rec.items():
-            if k.startswith("_"):  # Skip _context, _enriched
-                continue
-            if k == "sku":  # Already handled
-                continue
-            out[k] = v
-        
-        # 5b. Normalize property keys to consistent names
-        # First, rename Dutch/variant keys to standard English
-        KEY_NORMALIZATION = {
-            # Size/dimensions
-            "maat": "size",
-            "afmeting": "size",
-            "diameter": "diameter_mm",
-            "lengte": "length_mm",
-            "breedte": "width_mm",
-            "hoogte": "height_mm",
-            "dikte": "thickness_mm",
-            "wanddikte": "wall_thickness_mm",
-            # Pressure
-            "druk": "pressure_bar",
-            "werkdruk": "pressure_bar",
-            "max_druk": "max_pressure_bar",
-            "pn": "pressure_rating",
-            # Weight
-            "gewicht": "weight_kg",
-            # Connection
-            "aansluiting": "connection",
-            "draad": "thread",
-            "binnendraad": "thread_female",
-            "buitendraad": "thread_male",
-            # Flow/capacity
-            "debiet": "flow_rate",
-            "capaciteit": "capacity",
-            "inhoud": "volume",
-            # Power
-            "vermogen": "power_w",
-            "spanning": "voltage_v",
-            # Material
-            "materiaal": "material",
-        }
-        
-        normalized_out: Dict[str, Any] = {}
-        for k, v in out.items():
-            k_lower = k.lower().replace(" ", "_")
-            new_key = KEY_NORMALIZATION.get(k_lower, k)
-            normalized_out[new_key] = v
-        out = normalized_out
-        
-        # 5c. Rename generic col_N fields to semantic names based on value patterns
-        col_renames: Dict[str, str] = {}
-        
-        for k, v in list(out.items()):
-            if not k.startswith("col_") or not isinstance(v, str):
-                continue
-            v_stripped = v.strip()
-            
-            # Fitting sizes with x (e.g., "1/2" x 3/8"", "3/4 x 1/2", "1" x 3/4"")
-            if re.search(r'[\d/]+.*[xX×].*[\d/]+', v_stripped):
-                col_renames[k] = "size"
-            # Single fraction measurements (e.g., "1/2"", "3/4"", "1/2", "1"")
-            elif re.match(r'^[\d/]+\s*["\'"″]?\s*$', v_stripped) and len(v_stripped) < 15:
-                col_renames[k] = "size"
-            # Length in mm (e.g., "125 mm", "200 mm") - but NOT if it's actually weight
-            elif re.match(r'^\d+\s*mm$', v_stripped, re.IGNORECASE) and 'kg' not in v_stripped.lower():
-                col_renames[k] = "length_mm"
-            # Diameter in mm (e.g., "Ø 25", "25 Ø")
-            elif re.search(r'[Øø]\s*\d+|\d+\s*[Øø]', v_stripped):
-                col_renames[k] = "diameter_mm"
-            # Multiple sizes separated by / (e.g., "10 / 11 / 13 / ... mm")
-            elif re.search(r'\d+\s*/\s*\d+.*mm', v_stripped):
-                col_renames[k] = "socket_sizes"
-            # Weight (e.g., "19 kg", "2,5 kg")
-            elif re.match(r'^[\d,\.]+\s*kg$', v_stripped, re.IGNORECASE):
-                col_renames[k] = "weight_kg"
-            # Pressure (e.g., "10 bar", "16 bar")
-            elif re.match(r'^[\d,\.]+\s*bar$', v_stripped, re.IGNORECASE):
-                col_renames[k] = "pressure_bar"
-            # Length in meters (e.g., "5 m", "10m")
-            elif re.match(r'^[\d,\.]+\s*m$', v_stripped, re.IGNORECASE):
-                col_renames[k] = "length_m"
-            # Volume in liters (e.g., "50 L", "100 l")
-            elif re.match(r'^[\d,\.]+\s*[lL]$', v_stripped):
-                col_renames[k] = "volume_l"
-            # Product type/model names (e.g., "VORTEX 200", "DAB K30/70")
-            # col_0 with uppercase product names -> type
-            elif k == "col_0" and re.match(r'^[A-Z][A-Z0-9\s/\-]+$', v_stripped) and len(v_stripped) > 3:
-                col_renames[k] = "model_name"
-        
-        for old_key, new_key in col_renames.items():
-            if old_key in out and new_key not in out:
-                out[new_key] = out.pop(old_key)
-        
-        # 6. Denormalize inherited product specs
-        for spec_key, spec_val in product_specs.items():
-            if spec_key == "brand":  # Already handled
-                continue
-            # Prefix with spec_ to avoid collisions
-            out[f"spec_{spec_key}"] = spec_val
-        
-        # 7. Application as separate field
-        if application:
-            out["application"] = application
-        
-        # 8. Material detection from SKU prefix
-        if sku and not out.get("material"):
-            material_info = detect_material_from_sku(sku)
-            if material_info:
-                out["material"] = material_info[0]
-                out["material_name"] = material_info[1]
-        
-        # 8b. Messing SKU decoding - extract size from SKU pattern if not already present
-        if sku and not out.get("size"):
-            decoded = decode_messing_sku_sizes(sku, out.get("series_name", ""))
-            if decoded:
-                for dec_key, dec_val in decoded.items():
-                    if dec_key not in out or not out[dec_key]:
-                        out[dec_key] = dec_val
-        
-        # 9. Seal material and connection type from specs text
-        specs_text = ctx.get("specs_text") or product_specs.get("specs_text")
-        if specs_text:
-            out["specs_text"] = specs_text
-            
-            seal_info = detect_seal_material(specs_text)
-            if seal_info:
-                out["seal_material"] = seal_info[0]
-                out["seal_material_name"] = seal_info[1]
-            
-            conn_type = detect_connection_type(specs_text)
-            if conn_type:
-                out["connection_type"] = conn_type
-        
-        # 10. Image paths (from context)
-        images = ctx.get("images") or []
-        if images:
-            out["image"] = images[0] if images else ""
-            out["images"] = images
+                return None
+    
+    out["sku"] = sku
+    
+    # 2. Series/grouping metadata - prefer explicit series_id from context
+    category = ctx.get("category")
+    application = ctx.get("application")
+    
+    # Use series_id from context if available (from DEMA blue header detection)
+    ctx_series_id = ctx.get("series_id")
+    ctx_series_name = ctx.get("series_name")
+    
+    if ctx_series_id:
+        out["series_id"] = ctx_series_id
+    else:
+        out["series_id"] = generate_series_id(category, pdf_name)
+    
+    if ctx_series_name:
+        out["series_name"] = ctx_series_name
+    else:
+        out["series_name"] = category or pdf_name.replace(".pdf", "").replace("-", " ").title()
+    
+    # 2b. Improve series detection for messing/rvs fittings using SKU patterns
+    # If series_name is a poor placeholder, try to infer from SKU
+    poor_series_names = ["Bestelnr Maat", "Bestelnr Maten", "bestelnr maat"]
+    if out.get("series_name") in poor_series_names or (
+        out.get("series_name") and re.match(r'^(MF|RVS)\d+', str(out.get("series_name")))
+    ):
+        inferred_series = infer_series_from_sku(sku, pdf_name)
+        if inferred_series:
+            out["series_id"] = inferred_series[0]
+            out["series_name"] = inferred_series[1]
+    
+    # 3. Source PDF and page info for traceability
+    out["source_pdf"] = ctx.get("source_pdf")
+    out["page"] = ctx.get("page_number")
+    
+    # 4. Brand (from product_specs or context)
+    brand = product_specs.get("brand") or ctx.get("brand")
+    if brand:
+        out["brand"] = brand
+    
+    # 5. Copy all non-internal fields from original record
+    for k, v in rec.items():
+        if k.startswith("_"):  # Skip _context, _enriched
+            continue
+        if k == "sku":  # Already handled
+            continue
+        out[k] = v
+    
+    # 5b. Normalize property keys to consistent names
+    # First, rename Dutch/variant keys to standard English
+    KEY_NORMALIZATION = {
+        # Size/dimensions
+        "maat": "size",
+        "afmeting": "size",
+        "diameter": "diameter_mm",
+        "lengte": "length_mm",
+        "breedte": "width_mm",
+        "hoogte": "height_mm",
+        "dikte": "thickness_mm",
+        "wanddikte": "wall_thickness_mm",
+        # Pressure
+        "druk": "pressure_bar",
+        "werkdruk": "pressure_bar",
+        "max_druk": "max_pressure_bar",
+        "pn": "pressure_rating",
+        # Weight
+        "gewicht": "weight_kg",
+        # Connection
+        "aansluiting": "connection",
+        "draad": "thread",
+        "binnendraad": "thread_female",
+        "buitendraad": "thread_male",
+        # Flow/capacity
+        "debiet": "flow_rate",
+        "capaciteit": "capacity",
+        "inhoud": "volume",
+        # Power
+        "vermogen": "power_w",
+        "spanning": "voltage_v",
+        # Material
+        "materiaal": "material",
+    }
+    
+    normalized_out: Dict[str, Any] = {}
+    for k, v in out.items():
+        k_lower = k.lower().replace(" ", "_")
+        new_key = KEY_NORMALIZATION.get(k_lower, k)
+        normalized_out[new_key] = v
+    out = normalized_out
+    
+    # 5c. Rename generic col_N fields to semantic names based on value patterns
+    # (decided per table by infer_column_renames)
+    if col_renames is None:
+        col_renames = infer_column_renames([rec])
+    
+    for old_key in [k for k in out if k in col_renames]:
+        new_key = col_renames[old_key]
+        if new_key not in out:
+            out[new_key] = out.pop(old_key)
+    
+    # 6. Denormalize inherited product specs
+    for spec_key, spec_val in product_specs.items():
+        if spec_key == "brand":  # Already handled
+            continue
+        # Prefix with spec_ to avoid collisions
+        out[f"spec_{spec_key}"] = spec_val
+    
+    # 7. Application as separate field
+    if application:
+        out["application"] = application
+    
+    # 8. Material detection from SKU prefix
+    if sku and not out.get("material"):
+        material_info = detect_material_from_sku(sku)
+        if material_info:
+            out["material"] = material_info[0]
+            out["material_name"] = material_info[1]
+    
+    # 8b. Messing SKU decoding - extract size from SKU pattern if not already present
+    if sku and not out.get("size"):
+        decoded = decode_messing_sku_sizes(sku, out.get("series_name", ""))
+        if decoded:
+            for dec_key, dec_val in decoded.items():
+                if dec_key not in out or not out[dec_key]:
+                    out[dec_key] = dec_val
+    
+    # 9. Seal material and connection type from specs text
+    specs_text = ctx.get("specs_text") or product_specs.get("specs_text")
+    if specs_text:
+        out["specs_text"] = specs_text
         
-        # 11. Preserve enriched data under a cleaner structure
-        if enr:
-            out["_enriched"] = enr
+        seal_info = detect_seal_material(specs_text)
+        if seal_info:
+            out["seal_material"] = seal_info[0]
+            out["seal_material_name"] = seal_info[1]
         
-        flat.append(out)
+        conn_type = detect_connection_type(specs_text)
+        if conn_type:
+            out["connection_type"] = conn_type
+    
+    # 10. Image paths (from context)
+    images = ctx.get("images") or []
+    if images:
+        out["image"] = images[0] if images else ""
+        out["images"] = images
+    
+    # 11. Preserve enriched data under a cleaner structure
+    if enr:
+        out["_enriched"] = enr
+    
+    return out
+
+
+def flatten_records_with_grouping(records: List[Dict[str, Any]], pdf_name: str) -> List[Dict[str, Any]]:
+    """Convert all records to flat format with grouping metadata.
+    
+    Each record gets:
+    - sku: the canonical SKU field
+    - series_id: slugified grouping key for client-side aggregation
+    - series_name: human-readable series/category name
+    - All original fields preserved
+    - Inherited specs denormalized from _context.product_specs
+    """
+    group_renames = column_renames_by_group(records)
+
+    flat: List[Dict[str, Any]] = []
+    for rec in records:
+        renames = group_renames.get(column_group_key(rec)) if isinstance(rec, dict) else None
+        out = flatten_record(rec, pdf_name, renames)
+        if out is not None:
+            flat.append(out)
     
     # Sort by SKU for consistent output
     flat.sort(key=lambda x: str(x.get("sku") or x.get("series_id") or ""))
@@ -5781,6 +6341,23 @@ def flatten_records_with_grouping(records: List[Dict[str, Any]], pdf_name: str)
 # PDF CONFIGURATION - Pages to skip, extraction settings per PDF type
 # ============================================================================
 
+# Optional per-catalog "table_detection" profile (see find_raw_tables):
+#   table_settings  pdfplumber table_settings: vertical_strategy /
+#                   horizontal_strategy ("lines", "text", "explicit"),
+#                   snap_tolerance, join_tolerance, ...
+#   crop_margins    (left, top, right, bottom) points excluded from the search,
+#                   e.g. header bands and the DEMA footer
+#   column_splits   x positions as fractions of the content width; each column
+#                   is searched on its own. A table whose ruling runs across
+#                   a split (a full-width table) makes find_raw_tables search
+#                   the page unsplit; text-strategy tables have no ruling to
+#                   show that, so only split such catalogs if their columns
+#                   never share a table.
+# Catalogs without a profile use pdfplumber's defaults on the whole page.
+
+# DEMA catalogs: blue footer bar (~20-40 pt) at the bottom of every page
+DEMA_FOOTER_MARGINS = (0, 0, 0, 40)
+
 PDF_CONFIG = {
     "airpress-catalogus-eng": {
         "skip_pages": {
@@ -5861,6 +6438,11 @@ PDF_CONFIG = {
         "skip_empty_sku": True,
         "extract_images": True,
         "detect_series": True,
+        # Two NR series side by side: search each half separately, skip the footer
+        "table_detection": {
+            "crop_margins": DEMA_FOOTER_MARGINS,
+            "column_splits": (0.5,),
+        },
     },
     "rvs-draadfittingen": {
         "skip_pages": {1, 2},  # Cover and index pages
@@ -5869,6 +6451,11 @@ PDF_CONFIG = {
         "skip_empty_sku": True,
         "extract_images": True,
         "detect_series": True,
+        # Two NR series side by side: search each half separately, skip the footer
+        "table_detection": {
+            "crop_margins": DEMA_FOOTER_MARGINS,
+            "column_splits": (0.5,),
+        },
     },
     "slangkoppelingen": {
         "skip_pages": {1, 2},
@@ -5916,692 +6503,1492 @@ def get_pdf_config(pdf_name: str) -> Dict[str, Any]:
 
 
 # ------------------------
-# Driver per PDF
+# Page pre-scan (PyMuPDF)
 # ------------------------
+#
+# pdfplumber's table finder (lines strategy) builds cells from ruling edges and
+# find_tables_with_bboxes drops tables without any text, so a page that has
+# neither enough ruling to close a cell nor any text can never yield a table.
+# PyMuPDF answers both questions without running pdfminer's layout analysis.
+# Catalogs whose table_detection profile uses the "text" or "explicit"
+# strategy find tables without ruling, so for them only the text is checked.
+# A catalog can additionally set "prescan_sku_pattern" in PDF_CONFIG to skip
+# table pages whose text has no SKU-like token (this one is heuristic: such
+# pages are no longer able to update series/specs context).
+
+
+# pdfplumber strategies that only build cells from ruling edges
+RULING_STRATEGIES = ("lines", "lines_strict")
+
+
+def tables_need_ruling(profile: Optional[Dict[str, Any]]) -> bool:
+    """Whether tables under a table_detection profile need ruling lines
+    (both strategies line-based; pdfplumber's default)."""
+    settings = (profile or {}).get("table_settings") or {}
+    return all(
+        settings.get(key, "lines") in RULING_STRATEGIES
+        for key in ("vertical_strategy", "horizontal_strategy")
+    )
 
 
-def process_pdf(
+def page_may_have_tables(fitz_page, sku_pattern: Optional[re.Pattern] = None, needs_ruling: bool = True) -> bool:
+    """Cheap check whether pdfplumber could find a table on a PyMuPDF page."""
+    text = fitz_page.get_text("text")
+    if not text.strip():
+        return False
+    if sku_pattern is not None and not sku_pattern.search(text):
+        return False
+    return not needs_ruling or drawings_may_form_cells(fitz_page.get_drawings())
+
+
+def drawings_may_form_cells(drawings: List[Dict[str, Any]]) -> bool:
+    """True if PyMuPDF drawings contain enough ruling for a table cell."""
+    # A cell needs two horizontal and two vertical edges. Rects provide both;
+    # pdfplumber treats every non-horizontal segment as vertical, so slanted
+    # segments (and curve pieces) are counted generously on both sides.
+    horizontal = vertical = 0
+    for path in drawings:
+        for item in path.get("items", ()):
+            op = item[0]
+            if op in ("re", "qu"):
+                return True
+            points = item[1:] if op == "c" else item[1:3]
+            for p1, p2 in zip(points, points[1:]):
+                dy = abs(p1.y - p2.y)
+                if dy < 1:
+                    horizontal += 1
+                if dy > 1e-3:
+                    vertical += 1
+            if horizontal >= 2 and vertical >= 2:
+                return True
+    return False
+
+
+def prescan_pages(
     pdf_path: Path,
-    output_dir: Path,
-    clean_images: bool = False,
-) -> Dict[str, Any]:
-    name = pdf_path.name.lower()
-    records: List[Dict[str, Any]] = []
-    config = get_pdf_config(name)
-    skip_pages = config.get("skip_pages", set())
+    page_numbers: Sequence[int],
+    sku_pattern: Optional[str] = None,
+    needs_ruling: bool = True,
+) -> Set[int]:
+    """Return the 1-indexed pages that cannot contain tables (see page_may_have_tables)."""
+    pattern = re.compile(sku_pattern) if sku_pattern else None
+    skipped: Set[int] = set()
+    doc = fitz.open(str(pdf_path))
+    try:
+        for n in page_numbers:
+            try:
+                if not page_may_have_tables(doc[n - 1], pattern, needs_ruling):
+                    skipped.add(n)
+            except Exception as e:
+                METRICS.warn(f"    Warning: pre-scan failed on page {n}: {e}", pdf=pdf_path.name, page=n)
+    finally:
+        doc.close()
+    return skipped
 
-    # Optional destructive cleanup: remove previous extracted images for this PDF so
-    # regenerated outputs don't mix old/new assets.
-    if clean_images:
-        try:
-            shutil.rmtree(IMAGE_DIR / pdf_path.stem, ignore_errors=True)
-        except Exception:
-            pass
 
-    # Check if this is a DEMA catalog (has DEMA footer on first few pages)
-    is_dema_catalog = False
-    detect_series = config.get("detect_series", False)
-    extract_images_flag = config.get("extract_images", False)
-    
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        print(f"  Opened {pdf_path.name} with {len(pdf.pages)} pages")
-        
-        # Check first 5 pages for DEMA footer to determine catalog type
-        for check_page in pdf.pages[:5]:
-            if has_dema_footer(check_page):
-                is_dema_catalog = True
-                detect_series = True
-                extract_images_flag = True
-                print(f"    Detected DEMA catalog format (blue footer found)")
-                break
-        
-        current_category: Optional[str] = None
-        current_series_slug: Optional[str] = None
-        current_series_name: Optional[str] = None
-        current_specs_text: Optional[str] = None
-        current_images: List[str] = []
-        current_images_with_bboxes: List[Tuple[str, Tuple[float, float, float, float]]] = []
-
-        # Pomp-specials continuation pages: carry forward page-level context when the table continues.
-        last_pomp_specials_product_specs: Optional[Dict[str, str]] = None
-        last_pomp_specials_application_text: Optional[str] = None
-        last_pomp_specials_header: Optional[List[str]] = None
-        
-        for page_number, page in enumerate(pdf.pages, start=1):
-            page_text = page.extract_text() or ""
-            # Skip non-product pages based on config
-            if page_number in skip_pages:
-                continue
-            
-            # NOTE: We no longer skip pages based on DEMA footer detection per-page
-            # The footer detection is used only to identify DEMA catalog format initially
-            # Individual pages may not have detectable footers due to PDF structure
-                
-            tables = find_tables_with_bboxes(page)
-            if not tables:
+# ------------------------
+# Runtime estimate (--estimate)
+# ------------------------
+
+
+def scan_catalog(pdf_path: Path) -> CatalogScan:
+    """PyMuPDF pass over a whole PDF collecting the cost model's page features.
+
+    Pages in skip_pages, and pages the pre-scan would drop, are marked as not
+    analysed (they cost nothing beyond the scan itself).
+    """
+    config = get_pdf_config(pdf_path.name.lower())
+    skip_pages = config.get("skip_pages", set())
+    sku_pattern = config.get("prescan_sku_pattern")
+    pattern = re.compile(sku_pattern) if sku_pattern else None
+    needs_ruling = tables_need_ruling(config.get("table_detection"))
+    doc = fitz.open(str(pdf_path))
+    try:
+        scan = CatalogScan(pdf=pdf_path.name, page_count=len(doc))
+        for n in range(1, len(doc) + 1):
+            if n in skip_pages:
+                scan.pages.append(PageFeatures(page=n, analysed=False))
                 continue
+            page = doc[n - 1]
+            text = page.get_text("text")
+            drawings = page.get_drawings()
+            analysed = bool(text.strip()) and (pattern is None or bool(pattern.search(text)))
+            scan.pages.append(PageFeatures(
+                page=n,
+                images=len(page.get_images()),
+                chars=len(text),
+                sku_tokens=len(SKU_TOKEN.findall(text)),
+                drawings=len(drawings),
+                analysed=analysed and (not needs_ruling or drawings_may_form_cells(drawings)),
+            ))
+    finally:
+        doc.close()
+    return scan
 
-            print(f"    Page {page_number}: found {len(tables)} tables")
-            
-            # For draadfittingen catalogs, use page-level series detection due to multi-column layout
-            page_series_list: List[Tuple[str, str]] = []
-            page_mid_x: float = page.width / 2 if page else 300.0
-            is_draadfittingen = "rvs-draadfittingen" in name or "messing-draadfittingen" in name or "zwarte-draad-en-lasfittingen" in name or "verzinkte-buizen" in name or "slangkoppelingen" in name or "slangklemmen" in name
-            page_text = page.extract_text() or ""
-            
-            # Special handling for LANGSNAAD GELASTE RVS BUIS - use text-based extraction
-            if is_draadfittingen and "LANGSNAAD GELASTE RVS BUIS" in page_text:
-                langsnaad_products = extract_langsnaad_products_from_text(page_text)
-                if langsnaad_products:
-                    print(f"      LANGSNAAD text extraction: {len(langsnaad_products)} products")
-                    # Get page images
-                    page_images = []
-                    if extract_images_flag:
-                        page_images_with_bboxes = extract_images_with_bboxes_from_page(pdf_path, page_number, "langsnaad-gelaste-rvs-buis")
-                        page_images = [p for p, _ in page_images_with_bboxes]
-                    
-                    for prod in langsnaad_products:
-                        prod["source_pdf"] = pdf_path.name
-                        prod["page"] = page_number
-                        if page_images:
-                            prod["image"] = page_images[0]
-                            prod["images"] = page_images
-                        prod = enrich_record(prod)
-                        records.append(prod)
-                    continue  # Skip normal table processing for this page
-            
-            # For draadfittingen pages with two-column layout, use text-based extraction
-            if is_draadfittingen:
-                page_series_list = extract_all_series_from_page(page_text)
-                text_products = []
-                catalog_type = ""
-                
-                # RVS draadfittingen (9-prefixed SKUs)
-                if "rvs-draadfittingen" in name:
-                    has_skus = bool(re.search(r'9(?:ZF|BUL|LAK|LAT|LAE|LAR|LABR|ZFBF|LAN|LAS|LAF|LAFL|ZFVL|ZFGF)[A-Z]*\d+', page_text))
-                    if has_skus and len(page_series_list) >= 1:
-                        text_products = extract_rvs_draadfittingen_from_text(page_text, page_series_list, page_mid_x)
-                        catalog_type = "RVS"
-                
-                # Messing draadfittingen (MF-prefixed SKUs)
-                elif "messing-draadfittingen" in name:
-                    has_skus = bool(re.search(r'MF\d+', page_text))
-                    if has_skus and len(page_series_list) >= 1:
-                        text_products = extract_messing_draadfittingen_from_text(page_text, page_series_list, page_mid_x)
-                        catalog_type = "MESSING"
-                
-                # Zwarte draad- en lasfittingen (7-prefixed SKUs)
-                elif "zwarte-draad-en-lasfittingen" in name:
-                    has_skus = bool(re.search(r'7(?:ZF|GB|BUL|LAK|LAT|LAE|LAR|LABR|ZFBF|LAN|LAS|LAF)[A-Z]*\d+', page_text))
-                    if has_skus and len(page_series_list) >= 1:
-                        text_products = extract_zwarte_draadfittingen_from_text(page_text, page_series_list, page_mid_x)
-                        catalog_type = "ZWARTE"
-                
-                # Verzinkte buizen (ZF, GB, BUL prefixed SKUs without 7)
-                elif "verzinkte-buizen" in name:
-                    has_skus = bool(re.search(r'(?<![0-9])(?:ZF|GB|BUL)\d+', page_text))
-                    if has_skus and len(page_series_list) >= 1:
-                        text_products = extract_verzinkte_buizen_from_text(page_text, page_series_list, page_mid_x)
-                        catalog_type = "VERZINKTE"
-                
-                # Slangkoppelingen (B77, 9B77, C4, 9C77 prefixed SKUs)
-                elif "slangkoppelingen" in name:
-                    has_skus = bool(re.search(r'\d?[BC]\d{1,3}\d{3,}', page_text))
-                    if has_skus and len(page_series_list) >= 1:
-                        text_products = extract_slangkoppelingen_from_text(page_text, page_series_list, page_mid_x)
-                        catalog_type = "SLANGKOPPELINGEN"
-                
-                # Slangklemmen (GM, GMI, MAXM, MAXI, SBI, SBIV, SB, X prefixed SKUs)
-                elif "slangklemmen" in name:
-                    has_skus = bool(re.search(r'(?:GMI?|MAXI?|SBIV?|QDW|X)\d{4,}', page_text))
-                    if has_skus and len(page_series_list) >= 1:
-                        text_products = extract_slangklemmen_from_text(page_text, page_series_list, page_mid_x)
-                        catalog_type = "SLANGKLEMMEN"
-                
-                if text_products:
-                    print(f"      {catalog_type} text extraction: {len(text_products)} products, series: {[s[1] for s in page_series_list]}")
-                    
-                    # Extract images for EACH series separately, using column filtering for two-column layouts
-                    # Use series_slug as key to properly assign images to products by their series
-                    series_images_by_slug: Dict[str, List[str]] = {}
-                    series_images_by_idx: Dict[int, List[str]] = {}
-                    if extract_images_flag:
-                        for idx, (series_slug, series_name) in enumerate(page_series_list):
-                            # For two-column layouts, filter by column position
-                            if len(page_series_list) == 2:
-                                column_filter = 'left' if idx == 0 else 'right'
-                            else:
-                                column_filter = None
-                            images_with_bboxes = extract_images_with_bboxes_from_page(pdf_path, page_number, series_slug, column_filter=column_filter)
-                            img_paths = [p for p, _ in images_with_bboxes]
-                            series_images_by_slug[series_slug] = img_paths
-                            series_images_by_idx[idx] = img_paths
-                    
-                    # Assign images based on product's series_slug (not position)
-                    for prod_idx, prod in enumerate(text_products):
-                        prod["source_pdf"] = pdf_path.name
-                        prod["page"] = page_number
-                        
-                        # First try to match by product's series_slug
-                        prod_series_slug = prod.get("series_slug", "")
-                        if prod_series_slug and prod_series_slug in series_images_by_slug and series_images_by_slug[prod_series_slug]:
-                            prod["image"] = series_images_by_slug[prod_series_slug][0]
-                            prod["images"] = series_images_by_slug[prod_series_slug]
-                        elif len(page_series_list) == 2 and series_images_by_idx:
-                            # Fallback: for two-column layouts, alternate between columns
-                            col_idx = 0 if prod_idx % 2 == 0 else 1
-                            if col_idx in series_images_by_idx and series_images_by_idx[col_idx]:
-                                prod["image"] = series_images_by_idx[col_idx][0]
-                                prod["images"] = series_images_by_idx[col_idx]
-                            elif 0 in series_images_by_idx and series_images_by_idx[0]:
-                                prod["image"] = series_images_by_idx[0][0]
-                                prod["images"] = series_images_by_idx[0]
-                        elif series_images_by_idx and 0 in series_images_by_idx and series_images_by_idx[0]:
-                            # Single column - use first available images
-                            prod["image"] = series_images_by_idx[0][0]
-                            prod["images"] = series_images_by_idx[0]
-                        
-                        prod = enrich_record(prod)
-                        records.append(prod)
-                    continue  # Skip normal table processing for this page
-            
-            if is_draadfittingen:
-                page_series_list = extract_all_series_from_page(page_text)
-                if page_series_list:
-                    # Use the first series as default for this page
-                    current_series_slug, current_series_name = page_series_list[0]
-                    current_category = current_series_name
-                    print(f"      Page series: {[s[1] for s in page_series_list]}")
-            
-            # For DEMA catalogs, try to extract series from blue header
-            if is_dema_catalog or detect_series:
-                blue_header = extract_blue_header_text(page)
-                if blue_header:
-                    current_series_slug, current_series_name = blue_header
-                    current_category = current_series_name
-                    print(f"      Series: {current_series_name}")
-                
-                # Extract yellow specs text
-                yellow_specs = extract_yellow_specs_text(page)
-                if yellow_specs:
-                    current_specs_text = yellow_specs
-                    print(f"      Specs: {current_specs_text}")
-
-            for t in tables:
-                table_bbox = (page.bbox[0], page.bbox[1], page.bbox[2], page.bbox[3])
-                # More precise would be t.bbox, but our row bboxes already use it; we want
-                # category above the whole table.
-                table_bbox = t.bboxes[0][0], t.bboxes[0][1], t.bboxes[0][2], t.bboxes[-1][3]
-                
-                # For draadfittingen: assign series based on table's horizontal position (left/right column)
-                if is_draadfittingen and len(page_series_list) >= 2:
-                    table_center_x = (table_bbox[0] + table_bbox[2]) / 2
-                    if table_center_x < page_mid_x:
-                        # Left column - use first series
-                        current_series_slug, current_series_name = page_series_list[0]
-                    else:
-                        # Right column - use second series
-                        current_series_slug, current_series_name = page_series_list[1]
-                    current_category = current_series_name
-
-                # Zuigerpompen: pdfplumber can miss SKU cells (None) even though the SKU is visible.
-                # IMPORTANT: Only recover SKUs from the table region text, not the full page text,
-                # otherwise we risk assigning unrelated SKUs from other sections.
-                zuigerpompen_missing_sku_candidates: List[str] = []
-                zuigerpompen_missing_sku_idx: int = 0
-                if "zuigerpompen" in name:
-                    table_skus: set[str] = set()
-                    try:
-                        for _row in t.rows:
-                            try:
-                                row_joined = "".join(str(v) for v in _row if v is not None)
-                            except Exception:
-                                row_joined = ""
-                            row_compact = re.sub(r"\s+", "", row_joined)
-                            for m in re.findall(r"X\d{7}", row_compact):
-                                table_skus.add(m)
-                    except Exception:
-                        table_skus = set()
 
-                    try:
-                        table_text = page.crop(table_bbox).extract_text() or ""
-                    except Exception:
-                        table_text = ""
-                    table_text_compact = re.sub(r"\s+", "", table_text)
-                    table_text_skus = re.findall(r"X\d{7}", table_text_compact)
+def scan_catalogs(pdfs: Sequence[Path]) -> Dict[str, CatalogScan]:
+    scans: Dict[str, CatalogScan] = {}
+    for pdf_path in pdfs:
+        try:
+            scans[pdf_path.name] = scan_catalog(pdf_path)
+        except Exception as e:
+            METRICS.warn(f"  Warning: could not scan {pdf_path.name}: {e}", pdf=pdf_path.name)
+    return scans
 
-                    # Preserve order as seen in the table, but only keep SKUs not already in table cells.
-                    zuigerpompen_missing_sku_candidates = [s for s in table_text_skus if s not in table_skus]
 
-                header_text, application_text = extract_category_above_table(page, table_bbox)
-                category = header_text or current_category
-                
-                # Detect series title from header text (NR X - PRODUCT NAME pattern)
-                if header_text:
-                    series_info = detect_series_title(header_text)
-                    if series_info:
-                        current_series_slug, current_series_name = series_info
-                        current_category = current_series_name
-                        category = current_category
-                    else:
-                        current_category = category
-                
-                # Extract specs text (BUITENDRAAD, BINNENDRAAD, etc.)
-                if application_text:
-                    specs = extract_specs_text(application_text)
-                    if specs:
-                        current_specs_text = specs
-                
-                # Extract images from page (share with all SKUs in this table)
-                # Use series_slug if available, otherwise use pdf name as fallback
-                image_slug = current_series_slug or slugify(name) or "unknown"
-                if extract_images_flag:
-                    page_images_with_bboxes = extract_images_with_bboxes_from_page(pdf_path, page_number, image_slug)
-                    if page_images_with_bboxes:
-                        current_images_with_bboxes = page_images_with_bboxes
-                        current_images = [p for p, _ in page_images_with_bboxes]
-
-                # Extract product-level specs from text above table (temp, pressure, etc.)
-                product_specs = extract_product_specs_above_table(page, table_bbox)
-
-                # Pre-compute table-level images (bbox overlap with table bbox)
-                table_images: List[str] = []
-                if current_images_with_bboxes:
-                    for img_path, img_bbox in current_images_with_bboxes:
-                        img_area = _bbox_area(img_bbox)
-                        if img_area <= 0:
-                            continue
-                        inter = _bbox_intersection_area(img_bbox, table_bbox)
-                        if (inter / img_area) >= 0.15:
-                            table_images.append(img_path)
-
-                if "pomp-specials" in name:
-                    # Continuation pages often have only the continued table.
-                    # If we can't re-extract specs/application on this page, carry over the previous context.
-                    if (not application_text) and last_pomp_specials_application_text:
-                        application_text = last_pomp_specials_application_text
-                    if (not product_specs) and last_pomp_specials_product_specs:
-                        product_specs = dict(last_pomp_specials_product_specs)
-                    if application_text:
-                        last_pomp_specials_application_text = application_text
-                    if product_specs:
-                        last_pomp_specials_product_specs = dict(product_specs)
+def calibrate_cost_model(output_dir: Path, scans: Dict[str, CatalogScan]) -> Optional[CostModel]:
+    """Fit a CostModel on the --profile reports in output_dir for the scanned PDFs.
 
-                    # Header inheritance for continuation pages:
-                    # If the continued table does not repeat its header (or pdfplumber yields garbage/empty header),
-                    # reuse the last good header for correct column mapping.
-                    header_has_bestelnr = False
-                    try:
-                        header_joined = " ".join([str(h) for h in (t.header or []) if h is not None]).lower()
-                        header_has_bestelnr = ("bestel" in header_joined) or ("bestelnr" in header_joined)
-                    except Exception:
-                        header_has_bestelnr = False
-
-                    # Always attempt to synthesize an effective header for pomp-specials.
-                    # This handles pages where pdfplumber fails to capture the header row.
-                    synthesized_header = synthesize_pomp_specials_header(t.header, t.rows)
-                    if synthesized_header:
-                        last_pomp_specials_header = list(synthesized_header)
-                    elif header_has_bestelnr:
-                        last_pomp_specials_header = list(t.header or [])
-                
-                # Add specs_text to product_specs for downstream processing
-                if current_specs_text:
-                    product_specs["specs_text"] = current_specs_text
+    Returns None when there is no report to learn from. Catalogs profiled with
+    cached pages only contribute their uncached pages; page-sharded reports
+    under-count the per-catalog overhead (their pages ran in parallel).
+    """
+    page_samples: List[Tuple[PageFeatures, float]] = []
+    catalog_samples: List[Tuple[CatalogScan, float, float]] = []
+    for report_path in sorted((output_dir / PROFILE_DIRNAME).glob("*.profile.json")):
+        try:
+            with report_path.open("r", encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            continue
+        scan = scans.get(report.get("pdf"))
+        if scan is None:
+            continue
+        features = {p.page: p for p in scan.pages}
+        paged = 0.0
+        for entry in report.get("per_page", []):
+            page = features.get(entry.get("page"))
+            if page is None or entry.get("cached"):
+                continue
+            page_samples.append((page, float(entry.get("seconds", 0.0))))
+            paged += float(entry.get("seconds", 0.0))
+        if not report.get("cached_pages"):
+            catalog_samples.append((scan, float(report.get("wall_seconds", 0.0)), paged))
+    if not page_samples:
+        return None
+    return CostModel.calibrate(page_samples, catalog_samples)
 
-                if "zuigerpompen" in name:
-                    try:
-                        ztxt = page.crop(table_bbox).extract_text() or ""
-                    except Exception:
-                        ztxt = ""
-                    parsed = parse_zuigerpompen_table_text(ztxt)
-                    if parsed:
-                        for obj in parsed:
-                            inferred_type = infer_type_from_context(pdf_path.name, current_category, obj.get("type"))
-                            if inferred_type is not None:
-                                obj.setdefault("type", inferred_type)
-
-                            ctx = RowContext(
-                                source_pdf=pdf_path.name,
-                                page_number=page_number,
-                                category=current_category,
-                            )
-                            obj["_context"] = asdict(ctx)
-                            if current_series_slug:
-                                obj["_context"]["series_id"] = current_series_slug
-                            if current_series_name:
-                                obj["_context"]["series_name"] = current_series_name
-                            if application_text:
-                                obj["_context"]["application"] = application_text
-                            if product_specs:
-                                obj["_context"]["product_specs"] = product_specs
-                            if table_images:
-                                obj["_context"]["images"] = table_images
-                            elif current_images:
-                                obj["_context"]["images"] = current_images
-                            if current_specs_text:
-                                obj["_context"]["specs_text"] = current_specs_text
-
-                            normalize_sku_from_bestelnr(obj)
-                            extract_angle_from_context(obj)
-                            obj = enrich_record(obj)
-                            records.append(obj)
-
-                    # Always skip row-wise parsing for zuigerpompen to avoid duplicates.
-                    continue
 
-                # Special handling for Kranzle (transposed tables)
-                if "kranzle" in name:
-                    models = extract_kranzle_transposed(t)
-                    for m in models:
-                        # Attach context
-                        ctx = {
-                            "source_pdf": pdf_path.name,
-                            "page_number": page_number,
-                            "category": current_category,
-                            "series_id": current_series_slug,
-                            "series_name": current_series_name,
-                        }
-                        if application_text:
-                            ctx["application"] = application_text
-                        if product_specs:
-                            ctx["product_specs"] = product_specs
-                        if table_images:
-                            ctx["images"] = table_images
-                        elif current_images:
-                            ctx["images"] = current_images
-                        if current_specs_text:
-                            ctx["specs_text"] = current_specs_text
-                        m["_context"] = ctx
-                        # Ensure generic type
-                        inferred_type = infer_type_from_context(pdf_path.name, current_category, m.get("type"))
-                        if inferred_type is not None:
-                            m.setdefault("type", inferred_type)
-                        # Apply enrichment so analyze_product_pdfs does both extract + enrich
-                        m = enrich_record(m)
-                        records.append(m)
-                    continue
+def estimate_catalogs(output_dir: Path, pdfs: Sequence[Path], calibrate: bool = False) -> Dict[str, float]:
+    """Predicted extraction seconds per PDF name.
 
-                # Special handling for Makita (transposed tables like Kranzle)
-                if "makita" in name:
-                    models = extract_makita_transposed(t)
-                    for m in models:
-                        # Attach context
-                        ctx = {
-                            "source_pdf": pdf_path.name,
-                            "page_number": page_number,
-                            "category": current_category,
-                            "series_id": current_series_slug,
-                            "series_name": current_series_name,
-                        }
-                        if application_text:
-                            ctx["application"] = application_text
-                        if product_specs:
-                            ctx["product_specs"] = product_specs
-                        if table_images:
-                            ctx["images"] = table_images
-                        elif current_images:
-                            ctx["images"] = current_images
-                        if current_specs_text:
-                            ctx["specs_text"] = current_specs_text
-                        ctx["brand"] = "Makita"
-                        m["_context"] = ctx
-                        # Ensure generic type
-                        inferred_type = infer_type_from_context(pdf_path.name, current_category, m.get("type"))
-                        if inferred_type is not None:
-                            m.setdefault("type", inferred_type)
-                        # Apply enrichment
-                        m = enrich_record(m)
-                        records.append(m)
-                    continue
+    Uses the cost model saved in output_dir; with calibrate, refits it on the
+    --profile reports there first (and saves it).
+    """
+    scans = scan_catalogs(pdfs)
+    model_path = output_dir / COST_MODEL_NAME
+    model = CostModel.load(model_path)
+    if calibrate:
+        fitted = calibrate_cost_model(output_dir, scans)
+        if fitted is not None:
+            model = fitted
+            model.save(model_path)
+    estimates = {name: model.predict(scan) for name, scan in scans.items()}
+    for name, scan in scans.items():
+        METRICS.event("estimate", pdf=name, seconds=round(estimates[name], 3), **scan.totals())
+    _print_estimates(scans, estimates, model)
+    return estimates
+
+
+def _print_estimates(scans: Dict[str, CatalogScan], estimates: Dict[str, float], model: CostModel) -> None:
+    if model.samples:
+        METRICS.info(f"Cost model: fitted on {model.samples} profiled pages ({model.catalogs} catalogs)")
+    else:
+        METRICS.info("Cost model: defaults (run with --profile, then --estimate, to calibrate)")
+    for name in lpt_order(estimates, estimates):
+        t = scans[name].totals()
+        METRICS.detail(
+            f"  {name}: ~{estimates[name]:.1f}s ({t['analysed_pages']}/{t['pages']} pages, "
+            f"{t['images']} images, {t['sku_tokens']} SKU tokens)"
+        )
 
-                # For Airpress PDFs, detect SKU column once per table
-                airpress_sku_col_idx: Optional[int] = None
-                airpress_current_group: Optional[str] = None  # Track product group for grouped tables
-                airpress_current_sku: Optional[str] = None  # Track SKU for continuation rows
-                airpress_current_model: Optional[str] = None  # Track model name for continuation rows
-                if "airpress-catalogus" in name:
-                    airpress_sku_col_idx = detect_airpress_sku_column(t.header, t.rows)
 
-                # Row-wise extraction for other PDFs
-                for row, row_bbox in zip(t.rows, t.bboxes):
-                    ctx = RowContext(
-                        source_pdf=pdf_path.name,
-                        page_number=page_number,
-                        category=current_category,
-                    )
+# ------------------------
+# Driver per PDF
+# ------------------------
 
-                    if "abs-persluchtbuizen" in name:
-                        obj = extract_abs_persluchtbuizen(row, t.header)
-                        # Skip rows without SKU
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "bronpompen" in name:
-                        obj = extract_bronpompen(row, t.header)
-                        # Skip rows without SKU (header rows, empty rows)
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "aandrijftechniek" in name:
-                        obj = extract_aandrijftechniek(row, t.header, page, row_bbox)
-                        # Skip rows without CODE (header rows, empty rows)
-                        if not obj.get("code"):
-                            continue
-                    elif "centrifugaalpompen" in name:
-                        obj = extract_centrifugaalpompen(row, t.header)
-                        # Skip rows without SKU
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "pomp-specials" in name:
-                        # Prefer synthesized header for this table; fall back to last good header for continuation pages.
-                        effective_header = synthesize_pomp_specials_header(t.header, t.rows) or last_pomp_specials_header or t.header
 
-                        obj = extract_pomp_specials(row, effective_header or [])
-                        # Skip rows without SKU
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "dompelpompen" in name:
-                        obj = extract_dompelpompen(row, t.header)
-                        # Skip rows without SKU
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "zuigerpompen" in name:
-                        obj = extract_zuigerpompen(row, t.header)
+DRAADFITTINGEN_KEYS = (
+    "rvs-draadfittingen",
+    "messing-draadfittingen",
+    "zwarte-draad-en-lasfittingen",
+    "verzinkte-buizen",
+    "slangkoppelingen",
+    "slangklemmen",
+)
 
-                        # Fallback: if SKU is missing (often due to split/None in first column),
-                        # assign from page text list in order, skipping already-used SKUs.
-                        if not obj.get("bestelnr"):
-                            looks_like_product = False
-                            try:
-                                # Guard against header rows and random text rows.
-                                tv = obj.get("type")
-                                sv = obj.get("spanning_v")
-                                pv = obj.get("vermogen_kw")
-                                fv = obj.get("debiet_m3_h")
-
-                                tv_s = str(tv).strip().lower() if tv is not None else ""
-                                sv_s = str(sv).strip().lower() if sv is not None else ""
-                                pv_s = str(pv).strip().lower() if pv is not None else ""
-                                fv_s = str(fv).strip().lower() if fv is not None else ""
-
-                                # Header indicators (e.g. "type", "spanning", "vermogen")
-                                if tv_s in {"type", ""}:
-                                    looks_like_product = False
-                                elif "spanning" in tv_s or "vermogen" in tv_s or "debiet" in tv_s:
-                                    looks_like_product = False
-                                else:
-                                    # Require at least one numeric spec field to be present.
-                                    has_numeric_spec = any(
-                                        re.search(r"\d", s) for s in (sv_s, pv_s, fv_s)
-                                    )
-                                    looks_like_product = has_numeric_spec
-                            except Exception:
-                                looks_like_product = False
-
-                            if looks_like_product and zuigerpompen_missing_sku_candidates:
-                                if zuigerpompen_missing_sku_idx < len(zuigerpompen_missing_sku_candidates):
-                                    obj["bestelnr"] = zuigerpompen_missing_sku_candidates[zuigerpompen_missing_sku_idx]
-                                    zuigerpompen_missing_sku_idx += 1
-
-                        # Skip rows without SKU
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "pe-buizen" in name:
-                        obj = extract_pe_buizen(row, t.header)
-                        # Skip rows without SKU
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "drukbuizen" in name or "kunststof-afvoerleidingen" in name:
-                        obj = extract_drukbuizen(row, t.header)
-                        # Skip rows without SKU (header rows, empty rows)
-                        if not obj.get("bestelnr"):
-                            continue
-                    elif "airpress-catalogus" in name:
-                        # Use Airpress-specific extractor with SKU column detection
-                        obj = extract_airpress_row(row, t.header, airpress_sku_col_idx)
-                        
-                        # Propagate product_type from previous rows in grouped tables
-                        if obj.get("product_type"):
-                            airpress_current_group = obj["product_type"]
-                        elif airpress_current_group and not obj.get("product_type"):
-                            obj["product_type"] = airpress_current_group
-                        
-                        # Propagate SKU and model_name for continuation rows (spec variants)
-                        if obj.get("article_sku"):
-                            airpress_current_sku = obj["article_sku"]
-                            airpress_current_model = obj.get("model_name")
-                        elif airpress_current_sku and not obj.get("article_sku"):
-                            # This is a continuation row - inherit SKU and model from previous row
-                            obj["article_sku"] = airpress_current_sku
-                            obj["bestelnr"] = airpress_current_sku
-                            if airpress_current_model:
-                                obj["model_name"] = airpress_current_model
-                            obj["is_variant"] = True  # Mark as spec variant
-                    else:
-                        # Fallback: generic column mapping
-                        hmap = {i: slugify_header(h) for i, h in enumerate(t.header)}
-                        obj = {}
-                        for idx, val in enumerate(row):
-                            key = hmap.get(idx) or f"col_{idx}"
-                            v = val.strip() if isinstance(val, str) else val
-                            obj[key] = v
-                        
-                        # Skip completely empty rows
-                        if not any(v for v in obj.values() if v and str(v).strip()):
-                            continue
 
-                    # Ensure a generic type field is present
-                    inferred_type = infer_type_from_context(pdf_path.name, current_category, obj.get("type"))
+@dataclass
+class TableAnalysis:
+    """Page-derived data for one table that does not depend on carry-forward state."""
+
+    table: ExtractedTable
+    bbox: Tuple[float, float, float, float]
+    header_text: Optional[str]
+    application_text: Optional[str]
+    product_specs: Dict[str, str]
+    # Cropped table text (zuigerpompen only: SKU recovery + text parsing)
+    crop_text: Optional[str] = None
+    # Pre-extracted rows for extractors that read the page itself (aandrijftechniek)
+    row_objs: Optional[List[Dict[str, Any]]] = None
+
+
+@dataclass
+class PageAnalysis:
+    """Everything process_pdf needs from one pdfplumber page.
+
+    Built without any carry-forward state, so pages can be analysed in any
+    order (or in another process) and replayed in page order afterwards.
+    """
+
+    page_number: int
+    width: float
+    text: str
+    table_count: int
+    tables: List[TableAnalysis]
+    langsnaad_products: Optional[List[Dict[str, Any]]] = None
+    page_series_list: List[Tuple[str, str]] = field(default_factory=list)
+    text_products: List[Dict[str, Any]] = field(default_factory=list)
+    catalog_type: str = ""
+    blue_header: Optional[Tuple[str, str]] = None
+    yellow_specs: Optional[str] = None
+    # --profile: seconds per stage (analysis, then record assembly) and analyse time
+    timings: Dict[str, float] = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+@dataclass
+class PageCarryState:
+    """Context carried from one page to the next while assembling records."""
+
+    current_category: Optional[str] = None
+    current_series_slug: Optional[str] = None
+    current_series_name: Optional[str] = None
+    current_specs_text: Optional[str] = None
+    current_images: List[str] = field(default_factory=list)
+    current_images_with_bboxes: List[Tuple[str, Tuple[float, float, float, float]]] = field(default_factory=list)
+    # Pomp-specials continuation pages: carry forward page-level context when the table continues.
+    last_pomp_specials_product_specs: Optional[Dict[str, str]] = None
+    last_pomp_specials_application_text: Optional[str] = None
+    last_pomp_specials_header: Optional[List[str]] = None
+
+
+def analyze_page(page, page_number: int, name: str, detect_series: bool) -> PageAnalysis:
+    """Run all pdfplumber work for one page (tables, text, headers, specs).
+
+    `name` is the lowercased PDF filename and `detect_series` whether blue
+    header / yellow specs detection is enabled for this catalog.
+    """
+    analysis = PageAnalysis(
+        page_number=page_number,
+        width=page.width,
+        text="",
+        table_count=0,
+        tables=[],
+    )
+    t0 = time.perf_counter()
+    PROFILER.begin(analysis.timings)
+    try:
+        _analyze_page_content(page, analysis, name, detect_series)
+    finally:
+        PROFILER.end()
+    analysis.seconds = time.perf_counter() - t0
+    return analysis
+
+
+def _analyze_page_content(page, analysis: PageAnalysis, name: str, detect_series: bool) -> None:
+    """Body of analyze_page; fills `analysis` in place."""
+    with PROFILER.stage("tables"):
+        tables = find_tables_with_bboxes(page, get_pdf_config(name).get("table_detection"))
+    analysis.table_count = len(tables)
+    if not tables:
+        return
+
+    is_draadfittingen = any(k in name for k in DRAADFITTINGEN_KEYS)
+    with PROFILER.stage("text"):
+        page_text = page.extract_text() or ""
+    page_mid_x: float = page.width / 2 if page else 300.0
+    analysis.text = page_text
+
+    # Special handling for LANGSNAAD GELASTE RVS BUIS - use text-based extraction
+    if is_draadfittingen and "LANGSNAAD GELASTE RVS BUIS" in page_text:
+        langsnaad_products = extract_langsnaad_products_from_text(page_text)
+        if langsnaad_products:
+            analysis.langsnaad_products = langsnaad_products
+            return
+
+    # For draadfittingen pages with two-column layout, use text-based extraction
+    if is_draadfittingen:
+        page_series_list = extract_all_series_from_page(page_text)
+        analysis.page_series_list = page_series_list
+        text_products: List[Dict[str, Any]] = []
+        catalog_type = ""
+
+        # RVS draadfittingen (9-prefixed SKUs)
+        if "rvs-draadfittingen" in name:
+            has_skus = bool(CATALOG_SKU_PROBES["rvs-draadfittingen"].search(page_text))
+            if has_skus and len(page_series_list) >= 1:
+                text_products = extract_rvs_draadfittingen_from_text(page_text, page_series_list, page_mid_x)
+                catalog_type = "RVS"
+
+        # Messing draadfittingen (MF-prefixed SKUs)
+        elif "messing-draadfittingen" in name:
+            has_skus = bool(CATALOG_SKU_PROBES["messing-draadfittingen"].search(page_text))
+            if has_skus and len(page_series_list) >= 1:
+                text_products = extract_messing_draadfittingen_from_text(page_text, page_series_list, page_mid_x)
+                catalog_type = "MESSING"
+
+        # Zwarte draad- en lasfittingen (7-prefixed SKUs)
+        elif "zwarte-draad-en-lasfittingen" in name:
+            has_skus = bool(CATALOG_SKU_PROBES["zwarte-draad-en-lasfittingen"].search(page_text))
+            if has_skus and len(page_series_list) >= 1:
+                text_products = extract_zwarte_draadfittingen_from_text(page_text, page_series_list, page_mid_x)
+                catalog_type = "ZWARTE"
+
+        # Verzinkte buizen (ZF, GB, BUL prefixed SKUs without 7)
+        elif "verzinkte-buizen" in name:
+            has_skus = bool(CATALOG_SKU_PROBES["verzinkte-buizen"].search(page_text))
+            if has_skus and len(page_series_list) >= 1:
+                text_products = extract_verzinkte_buizen_from_text(page_text, page_series_list, page_mid_x)
+                catalog_type = "VERZINKTE"
+
+        # Slangkoppelingen (B77, 9B77, C4, 9C77 prefixed SKUs)
+        elif "slangkoppelingen" in name:
+            has_skus = bool(CATALOG_SKU_PROBES["slangkoppelingen"].search(page_text))
+            if has_skus and len(page_series_list) >= 1:
+                text_products = extract_slangkoppelingen_from_text(page_text, page_series_list, page_mid_x)
+                catalog_type = "SLANGKOPPELINGEN"
+
+        # Slangklemmen (GM, GMI, MAXM, MAXI, SBI, SBIV, SB, X prefixed SKUs)
+        elif "slangklemmen" in name:
+            has_skus = bool(CATALOG_SKU_PROBES["slangklemmen"].search(page_text))
+            if has_skus and len(page_series_list) >= 1:
+                text_products = extract_slangklemmen_from_text(page_text, page_series_list, page_mid_x)
+                catalog_type = "SLANGKLEMMEN"
+
+        if text_products:
+            analysis.text_products = text_products
+            analysis.catalog_type = catalog_type
+            return
+
+    # For DEMA catalogs, try to extract series from blue header and yellow specs
+    if detect_series:
+        with PROFILER.stage("headers"):
+            analysis.blue_header = extract_blue_header_text(page)
+            analysis.yellow_specs = extract_yellow_specs_text(page)
+
+    for t in tables:
+        # More precise would be t.bbox, but our row bboxes already use it; we want
+        # category above the whole table.
+        table_bbox = t.bboxes[0][0], t.bboxes[0][1], t.bboxes[0][2], t.bboxes[-1][3]
+
+        crop_text: Optional[str] = None
+        if "zuigerpompen" in name:
+            try:
+                crop_text = page.crop(table_bbox).extract_text() or ""
+            except Exception:
+                crop_text = ""
+
+        with PROFILER.stage("headers"):
+            header_text, application_text = extract_category_above_table(page, table_bbox)
+            product_specs = extract_product_specs_above_table(page, table_bbox)
+
+        row_objs: Optional[List[Dict[str, Any]]] = None
+        if "aandrijftechniek" in name:
+            row_objs = [
+                extract_aandrijftechniek(row, t.header, page, row_bbox)
+                for row, row_bbox in zip(t.rows, t.bboxes)
+            ]
+
+        analysis.tables.append(
+            TableAnalysis(
+                table=t,
+                bbox=table_bbox,
+                header_text=header_text,
+                application_text=application_text,
+                product_specs=product_specs,
+                crop_text=crop_text,
+                row_objs=row_objs,
+            )
+        )
+
+
+
+def assemble_page_records(
+    analysis: PageAnalysis,
+    pdf_path: Path,
+    state: PageCarryState,
+    extract_images_flag: bool,
+    image_index: Optional[PdfImageIndex] = None,
+    catalog: Optional[CatalogEnrichment] = None,
+) -> List[Dict[str, Any]]:
+    """Turn one analysed page into records, updating the carry-forward state.
+
+    This is the sequential half of process_pdf: pages must be assembled in
+    page order so series, specs, images and pomp-specials continuation context
+    flow from one page to the next exactly as in a single pass. `catalog` is
+    the PDF's CatalogEnrichment, shared by all its pages.
+    """
+    name = pdf_path.name.lower()
+    page_number = analysis.page_number
+    page_text = analysis.text
+    records: List[Dict[str, Any]] = []
+
+    if not analysis.table_count:
+        return records
+
+    METRICS.detail(f"    Page {page_number}: found {analysis.table_count} tables")
+
+    # For draadfittingen pages, use page-level series detection due to multi-column layout
+    page_series_list = analysis.page_series_list
+    page_mid_x: float = analysis.width / 2 if analysis.width else 300.0
+    is_draadfittingen = any(k in name for k in DRAADFITTINGEN_KEYS)
+
+    if analysis.langsnaad_products:
+        langsnaad_products = analysis.langsnaad_products
+        METRICS.detail(f"      LANGSNAAD text extraction: {len(langsnaad_products)} products")
+        # Get page images
+        page_images = []
+        if extract_images_flag:
+            with PROFILER.stage("images"):
+                page_images_with_bboxes = extract_images_with_bboxes_from_page(pdf_path, page_number, "langsnaad-gelaste-rvs-buis", image_index=image_index)
+            page_images = [p for p, _ in page_images_with_bboxes]
+
+        for prod in langsnaad_products:
+            prod["source_pdf"] = pdf_path.name
+            prod["page"] = page_number
+            if page_images:
+                prod["image"] = page_images[0]
+                prod["images"] = page_images
+            prod = enrich_record(prod, catalog)
+            records.append(prod)
+        return records  # Skip normal table processing for this page
+
+    if analysis.text_products:
+        text_products = analysis.text_products
+        METRICS.count("series", len(page_series_list))
+        METRICS.detail(f"      {analysis.catalog_type} text extraction: {len(text_products)} products, series: {[s[1] for s in page_series_list]}")
+
+        # Extract images for EACH series separately, using column filtering for two-column layouts
+        # Use series_slug as key to properly assign images to products by their series
+        series_images_by_slug: Dict[str, List[str]] = {}
+        series_images_by_idx: Dict[int, List[str]] = {}
+        if extract_images_flag:
+            for idx, (series_slug, series_name) in enumerate(page_series_list):
+                # For two-column layouts, filter by column position
+                if len(page_series_list) == 2:
+                    column_filter = 'left' if idx == 0 else 'right'
+                else:
+                    column_filter = None
+                with PROFILER.stage("images"):
+                    images_with_bboxes = extract_images_with_bboxes_from_page(pdf_path, page_number, series_slug, column_filter=column_filter, image_index=image_index)
+                img_paths = [p for p, _ in images_with_bboxes]
+                series_images_by_slug[series_slug] = img_paths
+                series_images_by_idx[idx] = img_paths
+
+        # Assign images based on product's series_slug (not position)
+        for prod_idx, prod in enumerate(text_products):
+            prod["source_pdf"] = pdf_path.name
+            prod["page"] = page_number
+
+            # First try to match by product's series_slug
+            prod_series_slug = prod.get("series_slug", "")
+            if prod_series_slug and prod_series_slug in series_images_by_slug and series_images_by_slug[prod_series_slug]:
+                prod["image"] = series_images_by_slug[prod_series_slug][0]
+                prod["images"] = series_images_by_slug[prod_series_slug]
+            elif len(page_series_list) == 2 and series_images_by_idx:
+                # Fallback: for two-column layouts, alternate between columns
+                col_idx = 0 if prod_idx % 2 == 0 else 1
+                if col_idx in series_images_by_idx and series_images_by_idx[col_idx]:
+                    prod["image"] = series_images_by_idx[col_idx][0]
+                    prod["images"] = series_images_by_idx[col_idx]
+                elif 0 in series_images_by_idx and series_images_by_idx[0]:
+                    prod["image"] = series_images_by_idx[0][0]
+                    prod["images"] = series_images_by_idx[0]
+            elif series_images_by_idx and 0 in series_images_by_idx and series_images_by_idx[0]:
+                # Single column - use first available images
+                prod["image"] = series_images_by_idx[0][0]
+                prod["images"] = series_images_by_idx[0]
+
+            prod = enrich_record(prod, catalog)
+            records.append(prod)
+        return records  # Skip normal table processing for this page
+
+    if is_draadfittingen and page_series_list:
+        # Use the first series as default for this page
+        state.current_series_slug, state.current_series_name = page_series_list[0]
+        state.current_category = state.current_series_name
+        METRICS.count("series", len(page_series_list))
+        METRICS.detail(f"      Page series: {[s[1] for s in page_series_list]}")
+
+    # For DEMA catalogs, the series comes from the blue header
+    if analysis.blue_header:
+        state.current_series_slug, state.current_series_name = analysis.blue_header
+        state.current_category = state.current_series_name
+        METRICS.count("series")
+        METRICS.detail(f"      Series: {state.current_series_name}")
+
+    # Yellow specs text
+    if analysis.yellow_specs:
+        state.current_specs_text = analysis.yellow_specs
+        METRICS.detail(f"      Specs: {state.current_specs_text}")
+
+    for ta in analysis.tables:
+        t = ta.table
+        table_bbox = ta.bbox
+        
+        # For draadfittingen: assign series based on table's horizontal position (left/right column)
+        if is_draadfittingen and len(page_series_list) >= 2:
+            table_center_x = (table_bbox[0] + table_bbox[2]) / 2
+            if table_center_x < page_mid_x:
+                # Left column - use first series
+                state.current_series_slug, state.current_series_name = page_series_list[0]
+            else:
+                # Right column - use second series
+                state.current_series_slug, state.current_series_name = page_series_list[1]
+            state.current_category = state.current_series_name
+
+        # Zuigerpompen: pdfplumber can miss SKU cells (None) even though the SKU is visible.
+        # IMPORTANT: Only recover SKUs from the table region text, not the full page text,
+        # otherwise we risk assigning unrelated SKUs from other sections.
+        zuigerpompen_missing_sku_candidates: List[str] = []
+        zuigerpompen_missing_sku_idx: int = 0
+        if "zuigerpompen" in name:
+            table_skus: set[str] = set()
+            try:
+                for _row in t.rows:
+                    try:
+                        row_joined = "".join(str(v) for v in _row if v is not None)
+                    except Exception:
+                        row_joined = ""
+                    row_compact = re.sub(r"\s+", "", row_joined)
+                    for m in re.findall(r"X\d{7}", row_compact):
+                        table_skus.add(m)
+            except Exception:
+                table_skus = set()
+
+            table_text = ta.crop_text or ""
+            table_text_compact = re.sub(r"\s+", "", table_text)
+            table_text_skus = re.findall(r"X\d{7}", table_text_compact)
+
+            # Preserve order as seen in the table, but only keep SKUs not already in table cells.
+            zuigerpompen_missing_sku_candidates = [s for s in table_text_skus if s not in table_skus]
+
+        header_text, application_text = ta.header_text, ta.application_text
+        category = header_text or state.current_category
+        
+        # Detect series title from header text (NR X - PRODUCT NAME pattern)
+        if header_text:
+            series_info = detect_series_title(header_text)
+            if series_info:
+                state.current_series_slug, state.current_series_name = series_info
+                state.current_category = state.current_series_name
+                category = state.current_category
+            else:
+                state.current_category = category
+        
+        # Extract specs text (BUITENDRAAD, BINNENDRAAD, etc.)
+        if application_text:
+            specs = extract_specs_text(application_text)
+            if specs:
+                state.current_specs_text = specs
+        
+        # Extract images from page (share with all SKUs in this table)
+        # Use series_slug if available, otherwise use pdf name as fallback
+        image_slug = state.current_series_slug or slugify(name) or "unknown"
+        if extract_images_flag:
+            with PROFILER.stage("images"):
+                page_images_with_bboxes = extract_images_with_bboxes_from_page(pdf_path, page_number, image_slug, image_index=image_index)
+            if page_images_with_bboxes:
+                state.current_images_with_bboxes = page_images_with_bboxes
+                state.current_images = [p for p, _ in page_images_with_bboxes]
+
+        # Extract product-level specs from text above table (temp, pressure, etc.)
+        product_specs = ta.product_specs
+
+        # Pre-compute table-level images (bbox overlap with table bbox)
+        table_images: List[str] = []
+        if state.current_images_with_bboxes:
+            for img_path, img_bbox in state.current_images_with_bboxes:
+                img_area = _bbox_area(img_bbox)
+                if img_area <= 0:
+                    continue
+                inter = _bbox_intersection_area(img_bbox, table_bbox)
+                if (inter / img_area) >= 0.15:
+                    table_images.append(img_path)
+
+        if "pomp-specials" in name:
+            # Continuation pages often have only the continued table.
+            # If we can't re-extract specs/application on this page, carry over the previous context.
+            if (not application_text) and state.last_pomp_specials_application_text:
+                application_text = state.last_pomp_specials_application_text
+            if (not product_specs) and state.last_pomp_specials_product_specs:
+                product_specs = dict(state.last_pomp_specials_product_specs)
+            if application_text:
+                state.last_pomp_specials_application_text = application_text
+            if product_specs:
+                state.last_pomp_specials_product_specs = dict(product_specs)
+
+            # Header inheritance for continuation pages:
+            # If the continued table does not repeat its header (or pdfplumber yields garbage/empty header),
+            # reuse the last good header for correct column mapping.
+            header_has_bestelnr = False
+            try:
+                header_joined = " ".join([str(h) for h in (t.header or []) if h is not None]).lower()
+                header_has_bestelnr = ("bestel" in header_joined) or ("bestelnr" in header_joined)
+            except Exception:
+                header_has_bestelnr = False
+
+            # Always attempt to synthesize an effective header for pomp-specials.
+            # This handles pages where pdfplumber fails to capture the header row.
+            synthesized_header = synthesize_pomp_specials_header(t.header, t.rows)
+            if synthesized_header:
+                state.last_pomp_specials_header = list(synthesized_header)
+            elif header_has_bestelnr:
+                state.last_pomp_specials_header = list(t.header or [])
+        
+        # Add specs_text to product_specs for downstream processing
+        if state.current_specs_text:
+            product_specs["specs_text"] = state.current_specs_text
+
+        if "zuigerpompen" in name:
+            ztxt = ta.crop_text or ""
+            parsed = parse_zuigerpompen_table_text(ztxt)
+            if parsed:
+                for obj in parsed:
+                    inferred_type = infer_type_from_context(pdf_path.name, state.current_category, obj.get("type"))
                     if inferred_type is not None:
                         obj.setdefault("type", inferred_type)
 
-                    # Attach context before downstream normalization/enrichment
+                    ctx = RowContext(
+                        source_pdf=pdf_path.name,
+                        page_number=page_number,
+                        category=state.current_category,
+                    )
                     obj["_context"] = asdict(ctx)
-                    # Add series info for SKU inheritance
-                    if current_series_slug:
-                        obj["_context"]["series_id"] = current_series_slug
-                    if current_series_name:
-                        obj["_context"]["series_name"] = current_series_name
+                    if state.current_series_slug:
+                        obj["_context"]["series_id"] = state.current_series_slug
+                    if state.current_series_name:
+                        obj["_context"]["series_name"] = state.current_series_name
                     if application_text:
                         obj["_context"]["application"] = application_text
                     if product_specs:
                         obj["_context"]["product_specs"] = product_specs
-
-                    # Attach images with best-effort per-row association:
-                    # 1) images overlapping the row bbox
-                    # 2) else images overlapping the table bbox
-                    # 3) else all page images
-                    row_images: List[str] = []
-                    if current_images_with_bboxes:
-                        for img_path, img_bbox in current_images_with_bboxes:
-                            img_area = _bbox_area(img_bbox)
-                            if img_area <= 0:
-                                continue
-                            inter = _bbox_intersection_area(img_bbox, row_bbox)
-                            if (inter / img_area) >= 0.15:
-                                row_images.append(img_path)
-
-                    if row_images:
-                        obj["_context"]["images"] = row_images
-                    elif table_images:
+                    if table_images:
                         obj["_context"]["images"] = table_images
-                    elif current_images:
-                        obj["_context"]["images"] = current_images
-                    if current_specs_text:
-                        obj["_context"]["specs_text"] = current_specs_text
-
-                    # Skip description/legend/header rows for Airpress (rows with no SKU and non-product content)
-                    if "airpress-catalogus" in name:
-                        has_sku = obj.get("article_sku") or obj.get("bestelnr")
-                        if not has_sku:
-                            # Check for long description text
-                            first_val = next((v for v in obj.values() if isinstance(v, str) and len(v) > 50), None)
-                            if first_val and len(first_val) > 100:
-                                continue
-                            # Check for header-like rows (all caps category names, percentages, etc.)
-                            vals = [str(v) for v in obj.values() if v and isinstance(v, str)]
-                            if vals and all(len(v) < 30 for v in vals):
-                                # Short values only - likely header row
-                                non_spec_vals = [v for v in vals if not any(c.isdigit() for c in v) or v in ['50%', '10', '3']]
-                                if len(non_spec_vals) == len(vals):
-                                    continue
-                    
-                    # Normalize zwarte-draad-en-lasfittingen dynamic SKU keys into explicit fields
-                    normalize_black_fittings_sku(obj, pdf_path.name)
-
-                    # Normalize bestelnr / order_number / code / col_0 to sku for all PDFs
+                    elif state.current_images:
+                        obj["_context"]["images"] = state.current_images
+                    if state.current_specs_text:
+                        obj["_context"]["specs_text"] = state.current_specs_text
+
                     normalize_sku_from_bestelnr(obj)
-                    
-                    # Extract angle from series name or SKU for pipe/fitting products
                     extract_angle_from_context(obj)
-
-                    # Apply enrichment so this script handles the full pipeline
-                    obj = enrich_record(obj)
+                    obj = enrich_record(obj, catalog)
                     records.append(obj)
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    out_path = output_dir / f"{pdf_path.stem}.json"
+            # Always skip row-wise parsing for zuigerpompen to avoid duplicates.
+            continue
 
-    # Always output flat format with grouping metadata for consistent structure
-    # This replaces the previous nested catalog builders (zuigerpompen, verzinkte-buizen, etc.)
-    payload = flatten_records_with_grouping(records, pdf_path.name)
+        # Special handling for Kranzle (transposed tables)
+        if "kranzle" in name:
+            models = extract_kranzle_transposed(t)
+            for m in models:
+                # Attach context
+                ctx = {
+                    "source_pdf": pdf_path.name,
+                    "page_number": page_number,
+                    "category": state.current_category,
+                    "series_id": state.current_series_slug,
+                    "series_name": state.current_series_name,
+                }
+                if application_text:
+                    ctx["application"] = application_text
+                if product_specs:
+                    ctx["product_specs"] = product_specs
+                if table_images:
+                    ctx["images"] = table_images
+                elif state.current_images:
+                    ctx["images"] = state.current_images
+                if state.current_specs_text:
+                    ctx["specs_text"] = state.current_specs_text
+                m["_context"] = ctx
+                # Ensure generic type
+                inferred_type = infer_type_from_context(pdf_path.name, state.current_category, m.get("type"))
+                if inferred_type is not None:
+                    m.setdefault("type", inferred_type)
+                # Apply enrichment so analyze_product_pdfs does both extract + enrich
+                m = enrich_record(m, catalog)
+                records.append(m)
+            continue
 
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+        # Special handling for Makita (transposed tables like Kranzle)
+        if "makita" in name:
+            models = extract_makita_transposed(t)
+            for m in models:
+                # Attach context
+                ctx = {
+                    "source_pdf": pdf_path.name,
+                    "page_number": page_number,
+                    "category": state.current_category,
+                    "series_id": state.current_series_slug,
+                    "series_name": state.current_series_name,
+                }
+                if application_text:
+                    ctx["application"] = application_text
+                if product_specs:
+                    ctx["product_specs"] = product_specs
+                if table_images:
+                    ctx["images"] = table_images
+                elif state.current_images:
+                    ctx["images"] = state.current_images
+                if state.current_specs_text:
+                    ctx["specs_text"] = state.current_specs_text
+                ctx["brand"] = "Makita"
+                m["_context"] = ctx
+                # Ensure generic type
+                inferred_type = infer_type_from_context(pdf_path.name, state.current_category, m.get("type"))
+                if inferred_type is not None:
+                    m.setdefault("type", inferred_type)
+                # Apply enrichment
+                m = enrich_record(m, catalog)
+                records.append(m)
+            continue
 
-    print(f"  Wrote JSON for {pdf_path.name} -> {out_path}")
+        # For Airpress PDFs, detect SKU column once per table
+        airpress_sku_col_idx: Optional[int] = None
+        airpress_current_group: Optional[str] = None  # Track product group for grouped tables
+        airpress_current_sku: Optional[str] = None  # Track SKU for continuation rows
+        airpress_current_model: Optional[str] = None  # Track model name for continuation rows
+        if "airpress-catalogus" in name:
+            airpress_sku_col_idx = detect_airpress_sku_column(t.header, t.rows)
+
+        # Row-wise extraction for other PDFs
+        for row_idx, (row, row_bbox) in enumerate(zip(t.rows, t.bboxes)):
+            ctx = RowContext(
+                source_pdf=pdf_path.name,
+                page_number=page_number,
+                category=state.current_category,
+            )
+
+            if "abs-persluchtbuizen" in name:
+                obj = extract_abs_persluchtbuizen(row, t.header)
+                # Skip rows without SKU
+                if not obj.get("bestelnr"):
+                    continue
+            elif "bronpompen" in name:
+                obj = extract_bronpompen(row, t.header)
+                # Skip rows without SKU (header rows, empty rows)
+                if not obj.get("bestelnr"):
+                    continue
+            elif "aandrijftechniek" in name:
+                obj = ta.row_objs[row_idx] if ta.row_objs is not None else {}
+                # Skip rows without CODE (header rows, empty rows)
+                if not obj.get("code"):
+                    continue
+            elif "centrifugaalpompen" in name:
+                obj = extract_centrifugaalpompen(row, t.header)
+                # Skip rows without SKU
+                if not obj.get("bestelnr"):
+                    continue
+            elif "pomp-specials" in name:
+                # Prefer synthesized header for this table; fall back to last good header for continuation pages.
+                effective_header = synthesize_pomp_specials_header(t.header, t.rows) or state.last_pomp_specials_header or t.header
 
-    # Build a small summary so the caller can report an overview after all
-    # PDFs are processed.
-    summary: Dict[str, Any] = {
-        "pdf": pdf_path.name,
-        "output": str(out_path),
-    }
+                obj = extract_pomp_specials(row, effective_header or [])
+                # Skip rows without SKU
+                if not obj.get("bestelnr"):
+                    continue
+            elif "dompelpompen" in name:
+                obj = extract_dompelpompen(row, t.header)
+                # Skip rows without SKU
+                if not obj.get("bestelnr"):
+                    continue
+            elif "zuigerpompen" in name:
+                obj = extract_zuigerpompen(row, t.header)
+
+                # Fallback: if SKU is missing (often due to split/None in first column),
+                # assign from page text list in order, skipping already-used SKUs.
+                if not obj.get("bestelnr"):
+                    looks_like_product = False
+                    try:
+                        # Guard against header rows and random text rows.
+                        tv = obj.get("type")
+                        sv = obj.get("spanning_v")
+                        pv = obj.get("vermogen_kw")
+                        fv = obj.get("debiet_m3_h")
+
+                        tv_s = str(tv).strip().lower() if tv is not None else ""
+                        sv_s = str(sv).strip().lower() if sv is not None else ""
+                        pv_s = str(pv).strip().lower() if pv is not None else ""
+                        fv_s = str(fv).strip().lower() if fv is not None else ""
+
+                        # Header indicators (e.g. "type", "spanning", "vermogen")
+                        if tv_s in {"type", ""}:
+                            looks_like_product = False
+                        elif "spanning" in tv_s or "vermogen" in tv_s or "debiet" in tv_s:
+                            looks_like_product = False
+                        else:
+                            # Require at least one numeric spec field to be present.
+                            has_numeric_spec = any(
+                                re.search(r"\d", s) for s in (sv_s, pv_s, fv_s)
+                            )
+                            looks_like_product = has_numeric_spec
+                    except Exception:
+                        looks_like_product = False
+
+                    if looks_like_product and zuigerpompen_missing_sku_candidates:
+                        if zuigerpompen_missing_sku_idx < len(zuigerpompen_missing_sku_candidates):
+                            obj["bestelnr"] = zuigerpompen_missing_sku_candidates[zuigerpompen_missing_sku_idx]
+                            zuigerpompen_missing_sku_idx += 1
+
+                # Skip rows without SKU
+                if not obj.get("bestelnr"):
+                    continue
+            elif "pe-buizen" in name:
+                obj = extract_pe_buizen(row, t.header)
+                # Skip rows without SKU
+                if not obj.get("bestelnr"):
+                    continue
+            elif "drukbuizen" in name or "kunststof-afvoerleidingen" in name:
+                obj = extract_drukbuizen(row, t.header)
+                # Skip rows without SKU (header rows, empty rows)
+                if not obj.get("bestelnr"):
+                    continue
+            elif "airpress-catalogus" in name:
+                # Use Airpress-specific extractor with SKU column detection
+                obj = extract_airpress_row(row, t.header, airpress_sku_col_idx)
+                
+                # Propagate product_type from previous rows in grouped tables
+                if obj.get("product_type"):
+                    airpress_current_group = obj["product_type"]
+                elif airpress_current_group and not obj.get("product_type"):
+                    obj["product_type"] = airpress_current_group
+                
+                # Propagate SKU and model_name for continuation rows (spec variants)
+                if obj.get("article_sku"):
+                    airpress_current_sku = obj["article_sku"]
+                    airpress_current_model = obj.get("model_name")
+                elif airpress_current_sku and not obj.get("article_sku"):
+                    # This is a continuation row - inherit SKU and model from previous row
+                    obj["article_sku"] = airpress_current_sku
+                    obj["bestelnr"] = airpress_current_sku
+                    if airpress_current_model:
+                        obj["model_name"] = airpress_current_model
+                    obj["is_variant"] = True  # Mark as spec variant
+            else:
+                # Fallback: generic column mapping
+                hmap = {i: slugify_header(h) for i, h in enumerate(t.header)}
+                obj = {}
+                for idx, val in enumerate(row):
+                    key = hmap.get(idx) or f"col_{idx}"
+                    v = val.strip() if isinstance(val, str) else val
+                    obj[key] = v
+                
+                # Skip completely empty rows
+                if not any(v for v in obj.values() if v and str(v).strip()):
+                    continue
+
+            # Ensure a generic type field is present
+            inferred_type = infer_type_from_context(pdf_path.name, state.current_category, obj.get("type"))
+            if inferred_type is not None:
+                obj.setdefault("type", inferred_type)
+
+            # Attach context before downstream normalization/enrichment
+            obj["_context"] = asdict(ctx)
+            # Add series info for SKU inheritance
+            if state.current_series_slug:
+                obj["_context"]["series_id"] = state.current_series_slug
+            if state.current_series_name:
+                obj["_context"]["series_name"] = state.current_series_name
+            if application_text:
+                obj["_context"]["application"] = application_text
+            if product_specs:
+                obj["_context"]["product_specs"] = product_specs
+
+            # Attach images with best-effort per-row association:
+            # 1) images overlapping the row bbox
+            # 2) else images overlapping the table bbox
+            # 3) else all page images
+            row_images: List[str] = []
+            if state.current_images_with_bboxes:
+                for img_path, img_bbox in state.current_images_with_bboxes:
+                    img_area = _bbox_area(img_bbox)
+                    if img_area <= 0:
+                        continue
+                    inter = _bbox_intersection_area(img_bbox, row_bbox)
+                    if (inter / img_area) >= 0.15:
+                        row_images.append(img_path)
+
+            if row_images:
+                obj["_context"]["images"] = row_images
+            elif table_images:
+                obj["_context"]["images"] = table_images
+            elif state.current_images:
+                obj["_context"]["images"] = state.current_images
+            if state.current_specs_text:
+                obj["_context"]["specs_text"] = state.current_specs_text
+
+            # Skip description/legend/header rows for Airpress (rows with no SKU and non-product content)
+            if "airpress-catalogus" in name:
+                has_sku = obj.get("article_sku") or obj.get("bestelnr")
+                if not has_sku:
+                    # Check for long description text
+                    first_val = next((v for v in obj.values() if isinstance(v, str) and len(v) > 50), None)
+                    if first_val and len(first_val) > 100:
+                        continue
+                    # Check for header-like rows (all caps category names, percentages, etc.)
+                    vals = [str(v) for v in obj.values() if v and isinstance(v, str)]
+                    if vals and all(len(v) < 30 for v in vals):
+                        # Short values only - likely header row
+                        non_spec_vals = [v for v in vals if not any(c.isdigit() for c in v) or v in ['50%', '10', '3']]
+                        if len(non_spec_vals) == len(vals):
+                            continue
+            
+            # Normalize zwarte-draad-en-lasfittingen dynamic SKU keys into explicit fields
+            normalize_black_fittings_sku(obj, pdf_path.name)
 
-    unique_skus: set[str] = set()
-    bestelnr_count: int = 0
+            # Normalize bestelnr / order_number / code / col_0 to sku for all PDFs
+            normalize_sku_from_bestelnr(obj)
+            
+            # Extract angle from series name or SKU for pipe/fitting products
+            extract_angle_from_context(obj)
+
+            # Apply enrichment so this script handles the full pipeline
+            obj = enrich_record(obj, catalog)
+            records.append(obj)
+
+    return records
 
-    def _collect_skus_from_obj(obj: Any) -> None:
-        nonlocal bestelnr_count
+
+def _analyze_page_range(
+    pdf_path: Path,
+    page_numbers: Sequence[int],
+    detect_series: bool,
+) -> List[PageAnalysis]:
+    """Worker for page-sharded mode: analyse a contiguous range of pages."""
+    name = pdf_path.name.lower()
+    out: List[PageAnalysis] = []
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        for n in page_numbers:
+            page = pdf.pages[n - 1]
+            out.append(analyze_page(page, n, name, detect_series))
+            # Pages are never revisited in a shard
+            release_page(page)
+    return out
+
+
+def analyze_pages_sharded(
+    pdf_path: Path,
+    page_numbers: Sequence[int],
+    detect_series: bool,
+    page_jobs: int,
+) -> Dict[int, PageAnalysis]:
+    """Analyse pages of one PDF across worker processes.
+
+    Pages are split into contiguous shards (a few per worker so one dense
+    section doesn't stall the pool). Only the state-independent pdfplumber
+    work runs here; records are assembled afterwards in page order.
+    """
+    page_numbers = list(page_numbers)
+    n_shards = max(1, min(len(page_numbers), page_jobs * 4))
+    size = -(-len(page_numbers) // n_shards)
+    shards = [page_numbers[i:i + size] for i in range(0, len(page_numbers), size)]
+
+    analyses: Dict[int, PageAnalysis] = {}
+    with ProcessPoolExecutor(
+        max_workers=page_jobs, initializer=set_profiling, initargs=(PROFILER.enabled,)
+    ) as pool:
+        for shard_result in pool.map(
+            _analyze_page_range,
+            [pdf_path] * len(shards),
+            shards,
+            [detect_series] * len(shards),
+        ):
+            for analysis in shard_result:
+                analyses[analysis.page_number] = analysis
+    return analyses
+
+
+# ------------------------
+# Output writers
+# ------------------------
+
+OUTPUT_FORMATS = ("json", "json-compact", "ndjson")
+
+
+class SkuCounter:
+    """Counts unique SKUs/order codes and bestelnr occurrences for the summary.
+
+    Walks nested dicts/lists; only the first matching key of each dict counts.
+    Feeding records one at a time gives the same totals as walking the whole
+    payload afterwards.
+    """
+
+    SKU_KEYS = ("sku", "order_number", "bestelnr", "sku_code", "code")
+
+    def __init__(self) -> None:
+        self.unique_skus: set = set()
+        self.bestelnr_count = 0
+
+    def add(self, obj: Any) -> None:
         if isinstance(obj, dict):
             # Common keys for order/SKU codes (sku is the canonical field)
-            for k in ("sku", "order_number", "bestelnr", "sku_code", "code"):
+            for k in self.SKU_KEYS:
                 v = obj.get(k)
                 if isinstance(v, str) and v.strip():
-                    val = v.strip().upper()
-                    unique_skus.add(val)
+                    self.unique_skus.add(v.strip().upper())
                     if k == "bestelnr":
-                        bestelnr_count += 1
+                        self.bestelnr_count += 1
                     break  # Only count once per record
             for v in obj.values():
-                _collect_skus_from_obj(v)
+                self.add(v)
         elif isinstance(obj, list):
             for v in obj:
-                _collect_skus_from_obj(v)
+                self.add(v)
+
+
+class NdjsonRecordWriter:
+    """Flattens and writes records as NDJSON while pages are processed.
+
+    Records are written in page order (the JSON writers sort by SKU) to a
+    temporary file that replaces the output on commit(), so an aborted run
+    never leaves a truncated catalog behind.
+    """
+
+    def __init__(self, path: Path, pdf_name: str):
+        self.path = path
+        self.pdf_name = pdf_name
+        self.items = 0
+        self.skus = SkuCounter()
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._f = self._tmp.open("w", encoding="utf-8")
+
+    def write_records(self, records: List[Dict[str, Any]]) -> None:
+        """Write one page's records (column_group_key includes the page, so
+        each table's col_N renames are decided on all of its rows, as in
+        flatten_records_with_grouping)."""
+        group_renames = column_renames_by_group(records)
+        for rec in records:
+            renames = group_renames.get(column_group_key(rec)) if isinstance(rec, dict) else None
+            out = flatten_record(rec, self.pdf_name, renames)
+            if out is None:
+                continue
+            self._f.write(json.dumps(out, ensure_ascii=False, separators=(",", ":")))
+            self._f.write("\n")
+            self.skus.add(out)
+            self.items += 1
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+
+    def commit(self) -> None:
+        self.close()
+        self._tmp.replace(self.path)
+
+
+# ------------------------
+# Per-page record cache
+# ------------------------
+
+
+class PageRecordCache:
+    """On-disk cache of each page's assembled records and outgoing carry state.
 
+    Entries are keyed by a hash of the page's content (content stream, form
+    XObjects, images, fonts, geometry) plus a hash of the incoming
+    PageCarryState, so a re-issued catalog only re-parses the pages that
+    changed and the pages whose incoming context changed because of them.
+    The salt covers everything else that affects output (PDF name, config,
+    detected catalog flags, extractor version).
+    """
+
+    def __init__(self, cache_dir: Path, pdf_path: Path, salt: str):
+        self.cache_dir = cache_dir
+        self.salt = salt
+        self._doc = fitz.open(str(pdf_path))
+        self._content_keys: Dict[int, str] = {}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._existing = {p.name for p in self.cache_dir.glob("*.pkl")}
+        self._used: set = set()
+        self.hits = 0
+        self.misses = 0
+
+    def content_key(self, page_number: int) -> str:
+        key = self._content_keys.get(page_number)
+        if key is None:
+            doc = self._doc
+            page = doc[page_number - 1]
+            h = sha256(self.salt.encode("utf-8"))
+            h.update(repr((page_number, tuple(page.mediabox), tuple(page.cropbox), page.rotation)).encode("utf-8"))
+            h.update(page.read_contents())
+            for xobj in page.get_xobjects():
+                h.update(doc.xref_stream_raw(xobj[0]) or b"")
+            for img in page.get_images(full=True):
+                h.update(doc.xref_stream_raw(img[0]) or b"")
+            for font in page.get_fonts(full=True):
+                h.update(repr(font[1:]).encode("utf-8"))
+            key = h.hexdigest()[:32]
+            self._content_keys[page_number] = key
+        return key
+
+    @staticmethod
+    def context_key(state: PageCarryState) -> str:
+        blob = json.dumps(asdict(state), sort_keys=True, ensure_ascii=False, default=str)
+        return md5(blob.encode("utf-8")).hexdigest()[:16]
+
+    def has_page(self, page_number: int) -> bool:
+        """True if any entry exists for this page content (whatever the context)."""
+        prefix = self.content_key(page_number) + "-"
+        return any(n.startswith(prefix) for n in self._existing)
+
+    def get(self, page_number: int, state: PageCarryState) -> Optional[Tuple[List[Dict[str, Any]], PageCarryState]]:
+        fname = f"{self.content_key(page_number)}-{self.context_key(state)}.pkl"
+        if fname not in self._existing:
+            self.misses += 1
+            return None
+        try:
+            with (self.cache_dir / fname).open("rb") as f:
+                page_records, state_out = pickle.load(f)
+        except Exception:
+            self.misses += 1
+            return None
+        self._used.add(fname)
+        self.hits += 1
+        return page_records, state_out
+
+    def put(self, page_number: int, context_key: str, page_records: List[Dict[str, Any]], state_out: PageCarryState) -> None:
+        fname = f"{self.content_key(page_number)}-{context_key}.pkl"
+        tmp = self.cache_dir / (fname + ".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump((page_records, state_out), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(self.cache_dir / fname)
+        self._existing.add(fname)
+        self._used.add(fname)
+
+    def prune(self) -> None:
+        """Drop entries not used by this run (old page versions / contexts)."""
+        for fname in self._existing - self._used:
+            try:
+                (self.cache_dir / fname).unlink()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        self._doc.close()
+
+
+def _write_profile(
+    summary: Dict[str, Any],
+    output_dir: Path,
+    pdf_path: Path,
+    pages: List[Dict[str, Any]],
+    catalog_stages: Dict[str, float],
+    started: float,
+) -> None:
+    report = build_profile_report(pdf_path.name, pages, catalog_stages, time.perf_counter() - started)
+    path = write_profile_report(output_dir, pdf_path.stem, report)
+    summary["profile"] = str(path)
+    slowest = ", ".join(f"p{p['page']} {p['seconds']:.2f}s" for p in report["slowest_pages"][:3])
+    METRICS.info(f"  Profile: {path} (slowest: {slowest or '-'})")
+
+
+def _finish_metrics(summary: Dict[str, Any], counters_before: Dict[str, int], started: float) -> None:
+    """Add this PDF's counters and wall time to the summary and log pdf_done."""
+    seconds = time.perf_counter() - started
+    summary["metrics"] = METRICS.since(counters_before)
+    summary["seconds"] = round(seconds, 3)
+    METRICS.event("pdf_done", pdf=summary["pdf"], seconds=summary["seconds"], **summary["metrics"])
+
+
+def _rounded_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in stats.items()}
+
+
+def process_pdf(
+    pdf_path: Path,
+    output_dir: Path,
+    clean_images: bool = False,
+    page_jobs: int = 1,
+    page_cache_dir: Optional[Path] = None,
+    output_format: str = "json",
+    low_memory: bool = False,
+    prescan: bool = True,
+    profile: bool = False,
+    encode_threads: int = DEFAULT_ENCODE_THREADS,
+) -> Dict[str, Any]:
+    """Extract one catalog PDF to JSON and return a summary for the overview.
+
+    With page_jobs > 1 the pdfplumber work is sharded over page ranges in
+    worker processes; records are still assembled sequentially in page order,
+    so the output is identical to a serial run.
+
+    With page_cache_dir set, each page's records are cached on disk (see
+    PageRecordCache) and reused when neither the page nor its incoming
+    context changed.
+
+    output_format is one of OUTPUT_FORMATS: "json" (indented, sorted by SKU),
+    "json-compact" (same payload without indentation) or "ndjson" (records
+    flattened and streamed to <stem>.ndjson while pages are processed, without
+    keeping them all in memory).
+
+    With low_memory, each pdfplumber page's caches are released as soon as the
+    page is analysed. Combined with ndjson output, memory stays flat regardless
+    of page count. Peak RSS is reported in the summary either way.
+
+    With prescan (default, needs PyMuPDF), pages that cannot contain a table
+    are dropped before pdfplumber touches them (see prescan_pages).
+
+    With profile, per-page stage timings are collected (see StageProfiler)
+    and written to a report under <output_dir>/profiles/.
+
+    Extracted images are encoded on encode_threads threads while pages are
+    parsed (inline with profile, so WebP time is charged to its page).
+    """
+    name = pdf_path.name.lower()
+    started = time.perf_counter()
+    counters_before = METRICS.snapshot()
+    set_profiling(profile)
+    ENCODE_POOL.configure(0 if profile else encode_threads)
+    encode_stats_before = ENCODE_POOL.stats()
+    profile_pages: List[Dict[str, Any]] = []
+    catalog_stages: Dict[str, float] = {}
+    rss = RssTracker()
+    quantity_stats_before = quantity_cache_stats()
+    records: List[Dict[str, Any]] = []
+    config = get_pdf_config(name)
+    skip_pages = config.get("skip_pages", set())
+
+    # Optional destructive cleanup: remove previous extracted images for this PDF so
+    # regenerated outputs don't mix old/new assets.
+    if clean_images:
+        try:
+            shutil.rmtree(IMAGE_DIR / pdf_path.stem, ignore_errors=True)
+            # Cached pages reference the deleted images; rebuild them as well.
+            if page_cache_dir is not None:
+                shutil.rmtree(page_cache_dir / pdf_path.stem, ignore_errors=True)
+        except Exception:
+            pass
+
+    # Check if this is a DEMA catalog (has DEMA footer on first few pages)
+    is_dema_catalog = False
+    detect_series = config.get("detect_series", False)
+    extract_images_flag = config.get("extract_images", False)
+
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        METRICS.info(f"  Opened {pdf_path.name} with {len(pdf.pages)} pages")
+
+        # Check first 5 pages for DEMA footer to determine catalog type
+        for check_page in pdf.pages[:5]:
+            if has_dema_footer(check_page):
+                is_dema_catalog = True
+                detect_series = True
+                extract_images_flag = True
+                METRICS.detail(f"    Detected DEMA catalog format (blue footer found)")
+                break
+
+        # Skip non-product pages based on config
+        page_numbers = [n for n in range(1, len(pdf.pages) + 1) if n not in skip_pages]
+        if low_memory:
+            for n, check_page in enumerate(pdf.pages[:5], start=1):
+                if n in skip_pages:
+                    release_page(check_page)
+
+        # Extra counters for the summary (pre-scan, caches)
+        run_stats: Dict[str, Any] = {}
+        if prescan and HAS_FITZ:
+            t0 = time.perf_counter()
+            prescan_skipped = prescan_pages(
+                pdf_path, page_numbers, config.get("prescan_sku_pattern"),
+                tables_need_ruling(config.get("table_detection")),
+            )
+            run_stats["prescan_seconds"] = time.perf_counter() - t0
+            run_stats["prescan_skipped_pages"] = len(prescan_skipped)
+            catalog_stages["prescan"] = run_stats["prescan_seconds"]
+            if prescan_skipped:
+                page_numbers = [n for n in page_numbers if n not in prescan_skipped]
+                METRICS.detail(f"    Pre-scan: skipping {len(prescan_skipped)} pages without tables")
+
+        page_cache: Optional[PageRecordCache] = None
+        if page_cache_dir is not None and HAS_FITZ:
+            salt = json.dumps(
+                [pdf_path.name, extractor_version_stamp(), pdf_fingerprint_config(config),
+                 is_dema_catalog, detect_series, extract_images_flag],
+                sort_keys=True,
+            )
+            page_cache = PageRecordCache(page_cache_dir / pdf_path.stem, pdf_path, salt)
+
+        # Pages with a cached entry are not sent to the shard workers; if their
+        # incoming context turns out to differ they are analysed in-process.
+        shard_pages = [n for n in page_numbers if page_cache is None or not page_cache.has_page(n)]
+        sharded: Optional[Dict[int, PageAnalysis]] = None
+        if page_jobs > 1 and len(shard_pages) > 1:
+            METRICS.detail(f"    Sharding {len(shard_pages)} pages over {page_jobs} workers")
+            sharded = analyze_pages_sharded(pdf_path, shard_pages, is_dema_catalog or detect_series, page_jobs)
+
+        # One image index per PDF: the document is opened once and each page's
+        # images are extracted once, however many tables/series ask for them.
+        image_index = PdfImageIndex(pdf_path) if (extract_images_flag and HAS_FITZ and HAS_PIL) else None
+
+        ndjson_writer: Optional[NdjsonRecordWriter] = None
+        if output_format == "ndjson":
+            output_dir.mkdir(parents=True, exist_ok=True)
+            ndjson_writer = NdjsonRecordWriter(output_dir / f"{pdf_path.stem}.ndjson", pdf_path.name)
+
+        state = PageCarryState()
+        catalog = CatalogEnrichment.for_pdf(pdf_path.name)
+        # Per-page analyse time, used to estimate what the pre-scan saved
+        analyze_seconds = 0.0
+        analyzed_pages = 0
+        METRICS.event("pdf_start", pdf=pdf_path.name, pages=len(page_numbers))
+        try:
+            for done, page_number in enumerate(page_numbers, start=1):
+                METRICS.progress(pdf_path.name, done, len(page_numbers))
+                context_key = ""
+                if page_cache is not None:
+                    cached = page_cache.get(page_number, state)
+                    if cached is not None:
+                        page_records, state = cached
+                        METRICS.count("pages")
+                        METRICS.count("pages_cached")
+                        METRICS.count("records", len(page_records))
+                        METRICS.event("page", pdf=pdf_path.name, page=page_number, records=len(page_records), cached=True)
+                        METRICS.detail(f"    Page {page_number}: {len(page_records)} records from page cache")
+                        if profile:
+                            profile_pages.append({"page": page_number, "cached": True, "seconds": 0.0, "stages": {}})
+                        if ndjson_writer is not None:
+                            ndjson_writer.write_records(page_records)
+                        else:
+                            records.extend(page_records)
+                        continue
+                    context_key = page_cache.context_key(state)
+
+                if sharded is not None and page_number in sharded:
+                    analysis = sharded.pop(page_number)
+                else:
+                    page = pdf.pages[page_number - 1]
+                    t0 = time.perf_counter()
+                    analysis = analyze_page(page, page_number, name, is_dema_catalog or detect_series)
+                    analyze_seconds += time.perf_counter() - t0
+                    analyzed_pages += 1
+                    if low_memory:
+                        release_page(page)
+                # Record assembly is charged to the same page as its analysis
+                t0 = time.perf_counter()
+                PROFILER.begin(analysis.timings)
+                page_records = assemble_page_records(analysis, pdf_path, state, extract_images_flag, image_index, catalog)
+                if page_cache is not None:
+                    page_cache.put(page_number, context_key, page_records, state)
+                if ndjson_writer is not None:
+                    with PROFILER.stage("flatten"):
+                        ndjson_writer.write_records(page_records)
+                else:
+                    records.extend(page_records)
+                PROFILER.end()
+                page_seconds = analysis.seconds + time.perf_counter() - t0
+                METRICS.count("pages")
+                METRICS.count("tables", analysis.table_count)
+                METRICS.count("records", len(page_records))
+                METRICS.event(
+                    "page", pdf=pdf_path.name, page=page_number, tables=analysis.table_count,
+                    records=len(page_records), seconds=round(page_seconds, 4),
+                )
+                if profile:
+                    profile_pages.append({
+                        "page": page_number,
+                        "tables": analysis.table_count,
+                        "records": len(page_records),
+                        "seconds": page_seconds,
+                        "stages": analysis.timings,
+                    })
+                rss.sample()
+            if page_cache is not None:
+                page_cache.prune()
+                METRICS.detail(f"    Page cache: {page_cache.hits} hits, {page_cache.misses} misses")
+            ENCODE_POOL.drain()
+            encode_stats = ENCODE_POOL.stats()
+            if encode_stats["jobs"] > encode_stats_before["jobs"]:
+                run_stats["encode_jobs"] = int(encode_stats["jobs"] - encode_stats_before["jobs"])
+                run_stats["encode_seconds"] = encode_stats["busy_seconds"] - encode_stats_before["busy_seconds"]
+                run_stats["encode_wait_seconds"] = encode_stats["wait_seconds"] - encode_stats_before["wait_seconds"]
+                run_stats["encode_threads"] = ENCODE_POOL.workers
+            quantity_stats = quantity_cache_stats()
+            hits = quantity_stats["hits"] - quantity_stats_before["hits"]
+            misses = quantity_stats["misses"] - quantity_stats_before["misses"]
+            run_stats.update(catalog.stats())
+            run_stats["quantity_cache_hits"] = hits
+            run_stats["quantity_cache_misses"] = misses
+            if hits + misses:
+                run_stats["quantity_cache_hit_rate"] = hits / (hits + misses)
+            if run_stats.get("prescan_skipped_pages") and analyzed_pages:
+                # Rough estimate: skipped pages would have cost an average page
+                saved = run_stats["prescan_skipped_pages"] * analyze_seconds / analyzed_pages
+                run_stats["prescan_saved_seconds"] = saved - run_stats["prescan_seconds"]
+                METRICS.detail(
+                    f"    Pre-scan: {run_stats['prescan_seconds']:.2f}s, "
+                    f"~{run_stats['prescan_saved_seconds']:.2f}s saved"
+                )
+        finally:
+            # Finish this catalog's image writes before its summary (and
+            # before the next catalog starts counting)
+            ENCODE_POOL.drain()
+            if image_index is not None:
+                image_index.close()
+            if page_cache is not None:
+                page_cache.close()
+            if ndjson_writer is not None:
+                ndjson_writer.close()
+
+    if ndjson_writer is not None:
+        ndjson_writer.commit()
+        METRICS.info(f"  Wrote NDJSON for {pdf_path.name} -> {ndjson_writer.path}")
+        summary: Dict[str, Any] = {
+            "pdf": pdf_path.name,
+            "output": str(ndjson_writer.path),
+            "payload_type": "ndjson",
+            "items": ndjson_writer.items,
+            "unique_skus": len(ndjson_writer.skus.unique_skus),
+            "bestelnr_count": ndjson_writer.skus.bestelnr_count,
+        }
+        summary.update(_rounded_stats(run_stats))
+        rss.sample()
+        if rss.peak_mb is not None:
+            summary["peak_rss_mb"] = rss.peak_mb
+            METRICS.detail(f"  Peak RSS: {rss.peak_mb} MB")
+        if profile:
+            _write_profile(summary, output_dir, pdf_path, profile_pages, catalog_stages, started)
+        _finish_metrics(summary, counters_before, started)
+        return summary
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    out_path = output_dir / f"{pdf_path.stem}.json"
+
+    # Always output flat format with grouping metadata for consistent structure
+    # This replaces the previous nested catalog builders (zuigerpompen, verzinkte-buizen, etc.)
+    t0 = time.perf_counter()
+    payload = flatten_records_with_grouping(records, pdf_path.name)
+    catalog_stages["flatten"] = time.perf_counter() - t0
+
+    with out_path.open("w", encoding="utf-8") as f:
+        if output_format == "json-compact":
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    METRICS.info(f"  Wrote JSON for {pdf_path.name} -> {out_path}")
+
+    # Build a small summary so the caller can report an overview after all
+    # PDFs are processed.
+    summary = {
+        "pdf": pdf_path.name,
+        "output": str(out_path),
+    }
+
+    skus = SkuCounter()
     if isinstance(payload, list):
         summary["payload_type"] = "list"
         summary["items"] = len(payload)
-        _collect_skus_from_obj(payload)
+        skus.add(payload)
     elif isinstance(payload, dict):
         summary["payload_type"] = "object"
         # Try to give a meaningful size metric for structured catalogs
@@ -6612,10 +7999,19 @@ def process_pdf(
             series = payload.get("product_series") or {}
             if isinstance(series, dict) and isinstance(series.get("variations"), list):
                 summary["variations"] = len(series["variations"])
-        _collect_skus_from_obj(payload)
+        skus.add(payload)
 
-    summary["unique_skus"] = len(unique_skus)
-    summary["bestelnr_count"] = bestelnr_count
+    summary["unique_skus"] = len(skus.unique_skus)
+    summary["bestelnr_count"] = skus.bestelnr_count
+    summary.update(_rounded_stats(run_stats))
+
+    rss.sample()
+    if rss.peak_mb is not None:
+        summary["peak_rss_mb"] = rss.peak_mb
+        METRICS.detail(f"  Peak RSS: {rss.peak_mb} MB")
+    if profile:
+        _write_profile(summary, output_dir, pdf_path, profile_pages, catalog_stages, started)
+    _finish_metrics(summary, counters_before, started)
 
     return summary
 
@@ -6626,6 +8022,241 @@ def discover_pdfs(base_dir: Path) -> List[Path]:
     return sorted(p for p in base_dir.glob("*.pdf") if p.is_file())
 
 
+# ------------------------
+# Incremental rebuild manifest
+# ------------------------
+
+# Bump when extraction output changes for reasons the source hash below can't
+# see (e.g. a changed dependency or helper module).
+EXTRACTOR_VERSION = 1
+
+# Stored next to the JSON output. Deliberately not named *.json: the webshop
+# scripts load every *.json file in that directory as a catalog.
+MANIFEST_NAME = ".analyze_product_pdfs.manifest"
+
+
+# Helper modules whose source is part of the extractor (hashed with this script),
+# including those deciding which images are written and recorded
+EXTRACTOR_MODULES = (
+    "catalog_patterns.py",
+    "image_store.py",
+    "page_renderer.py",
+    "pdf_image_info.py",
+    "quantities.py",
+    "slugs.py",
+)
+
+
+def extractor_version_stamp() -> str:
+    """Version stamp for the manifest: EXTRACTOR_VERSION plus a hash of this
+    script and EXTRACTOR_MODULES."""
+    script = Path(__file__)
+    digest = md5()
+    try:
+        digest.update(script.read_bytes())
+        for module in EXTRACTOR_MODULES:
+            digest.update(module.encode("utf-8"))
+            digest.update((script.parent / module).read_bytes())
+        source_hash = digest.hexdigest()[:12]
+    except OSError:
+        source_hash = "unknown"
+    return f"{EXTRACTOR_VERSION}:{source_hash}"
+
+
+def file_sha256(path: Path) -> str:
+    h = sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def pdf_fingerprint_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """PDF_CONFIG entry in JSON-comparable form (sets become sorted lists)."""
+    config_json = json.dumps(
+        config,
+        sort_keys=True,
+        default=lambda o: sorted(o) if isinstance(o, (set, frozenset)) else str(o),
+    )
+    return json.loads(config_json)
+
+
+def pdf_fingerprint(pdf_path: Path, version: str, output_format: str = "json") -> Dict[str, Any]:
+    """Everything that determines a PDF's JSON output: content, config, extractor."""
+    return {
+        "sha256": file_sha256(pdf_path),
+        "config": pdf_fingerprint_config(get_pdf_config(pdf_path.name.lower())),
+        "extractor_version": version,
+        "output_format": output_format,
+    }
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {"pdfs": {}}
+    if not isinstance(data, dict) or not isinstance(data.get("pdfs"), dict):
+        return {"pdfs": {}}
+    return data
+
+
+def save_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    tmp.replace(path)
+
+
+def is_unchanged(entry: Optional[Dict[str, Any]], fingerprint: Dict[str, Any]) -> bool:
+    """True if the manifest entry matches the fingerprint and its output still exists."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    summary = entry.get("summary")
+    if not isinstance(summary, dict):
+        return False
+    out = summary.get("output")
+    return bool(out) and Path(out).exists()
+
+
+# ------------------------
+# Parallel driver (--jobs)
+# ------------------------
+
+# Catalogs that dominate a full rebuild. They are scheduled first so the pool
+# doesn't end up waiting on one slow catalog after everything else finished.
+HEAVY_PDF_KEYS = ("makita", "pompentoebehoren", "aandrijftechniek")
+
+
+def order_pdfs_for_scheduling(pdfs: Sequence[Path]) -> List[Path]:
+    """Order PDFs longest-first: known heavy catalogs, then by file size."""
+
+    def _key(p: Path) -> Tuple[int, int, str]:
+        name = p.name.lower()
+        heavy = any(k in name for k in HEAVY_PDF_KEYS)
+        try:
+            size = p.stat().st_size
+        except OSError:
+            size = 0
+        return (0 if heavy else 1, -size, name)
+
+    return sorted(pdfs, key=_key)
+
+
+def _process_pdf_captured(
+    pdf_path: Path,
+    output_dir: Path,
+    clean_images: bool,
+    page_jobs: int = 1,
+    page_cache_dir: Optional[Path] = None,
+    output_format: str = "json",
+    low_memory: bool = False,
+    prescan: bool = True,
+    profile: bool = False,
+    metrics_config: Optional[Tuple[str, Optional[Path]]] = None,
+    encode_threads: int = DEFAULT_ENCODE_THREADS,
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Run process_pdf in a worker with its console output captured.
+
+    Returns (summary, log). The summary is None when the PDF failed; the error
+    is part of the log, mirroring the serial loop in main(). metrics_config is
+    the parent's (verbosity, event log path); the worker never draws the live
+    progress line, the parent does.
+    """
+    if metrics_config is not None:
+        METRICS.configure(metrics_config[0], metrics_config[1], live=False)
+    buf = io.StringIO()
+    summary: Optional[Dict[str, Any]] = None
+    with contextlib.redirect_stdout(buf):
+        METRICS.info(f"Processing {pdf_path.name}...")
+        try:
+            summary = process_pdf(
+                pdf_path,
+                output_dir,
+                clean_images=clean_images,
+                page_jobs=page_jobs,
+                page_cache_dir=page_cache_dir,
+                output_format=output_format,
+                low_memory=low_memory,
+                prescan=prescan,
+                profile=profile,
+                encode_threads=encode_threads,
+            )
+        except Exception as exc:  # pragma: no cover - safety net
+            METRICS.warn(f"  ERROR processing {pdf_path.name}: {exc}", pdf=pdf_path.name)
+    return summary, buf.getvalue()
+
+
+def process_pdfs_parallel(
+    pdfs: Sequence[Path],
+    output_dir: Path,
+    clean_images: bool,
+    jobs: int,
+    page_jobs: int = 1,
+    page_cache_dir: Optional[Path] = None,
+    output_format: str = "json",
+    low_memory: bool = False,
+    prescan: bool = True,
+    profile: bool = False,
+    estimates: Optional[Dict[str, float]] = None,
+    encode_threads: int = DEFAULT_ENCODE_THREADS,
+) -> List[Dict[str, Any]]:
+    """Process PDFs across a process pool.
+
+    Each catalog's log is printed as one block when it completes, so output of
+    different catalogs never interleaves. Summaries are returned in the input
+    order so the overview is identical to a serial run.
+
+    With estimates (predicted seconds per PDF name, see estimate_catalogs) the
+    PDFs are submitted longest first; otherwise order_pdfs_for_scheduling's
+    heuristic is used.
+    """
+    if estimates:
+        by_name = {p.name: p for p in pdfs}
+        scheduled = [by_name[n] for n in lpt_order(estimates, by_name)]
+    else:
+        scheduled = order_pdfs_for_scheduling(pdfs)
+    by_pdf: Dict[Path, Dict[str, Any]] = {}
+    workers = max(1, min(jobs, len(scheduled)))
+    METRICS.info(f"Processing {len(scheduled)} PDFs with {workers} workers...")
+    metrics_config = (METRICS.verbosity, METRICS.log_path)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _process_pdf_captured,
+                pdf_path,
+                output_dir,
+                clean_images,
+                page_jobs,
+                page_cache_dir,
+                output_format,
+                low_memory,
+                prescan,
+                profile,
+                metrics_config,
+                encode_threads,
+            ): pdf_path
+            for pdf_path in scheduled
+        }
+        for done, fut in enumerate(as_completed(futures), start=1):
+            pdf_path = futures[fut]
+            try:
+                summary, log = fut.result()
+            except Exception as exc:  # pragma: no cover - worker crashed
+                summary, log = None, f"Processing {pdf_path.name}...\n  ERROR processing {pdf_path.name}: {exc}\n"
+                METRICS.event("warning", message=f"ERROR processing {pdf_path.name}: {exc}", pdf=pdf_path.name)
+            METRICS.echo(log)
+            if summary is not None:
+                by_pdf[pdf_path] = summary
+                # Worker counters feed the run totals and the progress line
+                for k, v in (summary.get("metrics") or {}).items():
+                    METRICS.count(k, v)
+            METRICS.progress("PDFs", done, len(scheduled), force=True)
+    return [by_pdf[p] for p in pdfs if p in by_pdf]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Analyze Dema Product PDFs into JSON.")
     parser.add_argument(
@@ -6651,7 +8282,89 @@ def main() -> None:
         action="store_true",
         help="Delete extracted images for each PDF (documents/Product_pdfs/images/<pdf_stem>) before regenerating.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of PDFs to process in parallel (default: 1, serial).",
+    )
+    parser.add_argument(
+        "--page-jobs",
+        type=int,
+        default=1,
+        help="Worker processes per PDF for page-sharded parsing of large catalogs (default: 1). "
+        "Output is identical to a serial run.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-process every PDF, even if the manifest says it is unchanged.",
+    )
+    parser.add_argument(
+        "--page-cache",
+        action="store_true",
+        help="Cache extracted records per page (in <output-dir>/.page_cache) so a re-issued "
+        "catalog only re-parses the pages that changed.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Output format: json (indented, default), json-compact (no indentation) or "
+        "ndjson (one flattened record per line, streamed while pages are processed, in page order).",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Release each page's parsed objects once it is analysed. Use with --format ndjson "
+        "to keep memory flat on very large catalogs.",
+    )
+    parser.add_argument(
+        "--no-prescan",
+        action="store_true",
+        help="Disable the PyMuPDF pre-scan that skips pages which cannot contain tables.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a per-catalog timing report (per-page stage times, totals, slowest pages) "
+        f"to <output-dir>/{PROFILE_DIRNAME}/<pdf>.profile.json. Implies --force.",
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Only scan the PDFs with PyMuPDF and print the predicted extraction time (no extraction). "
+        "Recalibrates the cost model from the --profile reports in the output directory.",
+    )
+    parser.add_argument(
+        "--encode-threads",
+        type=int,
+        default=DEFAULT_ENCODE_THREADS,
+        help=f"Threads encoding extracted images to WebP while pages are parsed, per process "
+        f"(default: {DEFAULT_ENCODE_THREADS}; 0 encodes inline).",
+    )
+    add_metrics_arguments(parser)
     args = parser.parse_args()
+    METRICS.configure(verbosity_from_args(args), args.metrics_log)
+    try:
+        _run(args)
+    finally:
+        METRICS.close()
+
+
+def _format_duration(seconds: float) -> str:
+    return f"~{seconds:.0f}s" if seconds < 120 else f"~{seconds / 60:.1f} min"
+
+
+def _print_runtime_estimate(estimates: Dict[str, float], jobs: int) -> None:
+    line = f"Estimated extraction time: {_format_duration(sum(estimates.values()))} serial"
+    if jobs > 1:
+        line += f", {_format_duration(lpt_makespan(estimates.values(), jobs))} with {jobs} workers"
+    print(line)
+
+
+def _run(args: argparse.Namespace) -> None:
     pdf_dir = Path(args.pdf_dir)
 
     if args.output_dir:
@@ -6667,20 +8380,89 @@ def main() -> None:
         print(f"No PDFs found in {pdf_dir}")
         return
 
-    summaries: List[Dict[str, Any]] = []
+    page_cache_dir = output_dir / ".page_cache" if args.page_cache else None
+
+    if args.estimate:
+        if not HAS_FITZ:
+            print("ERROR: --estimate needs PyMuPDF (pip install pymupdf)")
+            return
+        estimates = estimate_catalogs(output_dir, pdfs, calibrate=True)
+        _print_runtime_estimate(estimates, args.jobs)
+        return
+
+    # Skip PDFs whose content, config and extractor version match the manifest;
+    # their previous summaries are reused in the overview.
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    version = extractor_version_stamp()
+    fingerprints: Dict[str, Dict[str, Any]] = {}
+    by_name: Dict[str, Dict[str, Any]] = {}
+    todo: List[Path] = []
     for pdf_path in pdfs:
-        print(f"Processing {pdf_path.name}...")
-        try:
-            s = process_pdf(pdf_path, output_dir, clean_images=bool(args.clean_images))
-        except Exception as exc:  # pragma: no cover - safety net
-            print(f"  ERROR processing {pdf_path.name}: {exc}")
-            continue
-        summaries.append(s)
+        fingerprints[pdf_path.name] = pdf_fingerprint(pdf_path, version, args.format)
+        entry = manifest["pdfs"].get(pdf_path.name)
+        if not (args.force or args.clean_images or args.profile) and is_unchanged(entry, fingerprints[pdf_path.name]):
+            METRICS.info(f"Skipping {pdf_path.name} (unchanged)")
+            by_name[pdf_path.name] = entry["summary"]
+        else:
+            todo.append(pdf_path)
+
+    processed: List[Dict[str, Any]] = []
+    if args.jobs > 1 and len(todo) > 1:
+        estimates: Optional[Dict[str, float]] = None
+        if HAS_FITZ:
+            estimates = estimate_catalogs(output_dir, todo)
+            _print_runtime_estimate(estimates, args.jobs)
+        processed = process_pdfs_parallel(
+            todo,
+            output_dir,
+            bool(args.clean_images),
+            args.jobs,
+            args.page_jobs,
+            page_cache_dir,
+            args.format,
+            bool(args.low_memory),
+            not args.no_prescan,
+            bool(args.profile),
+            estimates,
+            args.encode_threads,
+        )
+    else:
+        for pdf_path in todo:
+            METRICS.info(f"Processing {pdf_path.name}...")
+            try:
+                s = process_pdf(
+                    pdf_path,
+                    output_dir,
+                    clean_images=bool(args.clean_images),
+                    page_jobs=args.page_jobs,
+                    page_cache_dir=page_cache_dir,
+                    output_format=args.format,
+                    low_memory=bool(args.low_memory),
+                    prescan=not args.no_prescan,
+                    profile=bool(args.profile),
+                    encode_threads=args.encode_threads,
+                )
+            except Exception as exc:  # pragma: no cover - safety net
+                METRICS.warn(f"  ERROR processing {pdf_path.name}: {exc}", pdf=pdf_path.name)
+                continue
+            processed.append(s)
+
+    for s in processed:
+        by_name[s["pdf"]] = s
+        manifest["pdfs"][s["pdf"]] = {
+            "fingerprint": fingerprints[s["pdf"]],
+            "summary": s,
+        }
+    if processed:
+        save_manifest(manifest_path, manifest)
 
-    print(f"Done. JSON files written to {output_dir}")
+    summaries: List[Dict[str, Any]] = [by_name[p.name] for p in pdfs if p.name in by_name]
+
+    METRICS.info(f"Done. JSON files written to {output_dir}")
 
     # Overview
-    print("\nOverview:")
+    METRICS.info("\nOverview:")
     total_unique_skus = 0
     total_bestelnr = 0
     for s in summaries:
@@ -6700,14 +8482,47 @@ def main() -> None:
         if "bestelnr_count" in s:
             extra.append(f"bestelnr_count={s['bestelnr_count']}")
             total_bestelnr += int(s["bestelnr_count"] or 0)
+        if "quantity_cache_hit_rate" in s:
+            extra.append(f"qty_cache_hit_rate={s['quantity_cache_hit_rate']:.0%}")
+        if s.get("prescan_skipped_pages"):
+            extra.append(f"prescan_skipped={s['prescan_skipped_pages']}")
+        if "peak_rss_mb" in s:
+            extra.append(f"peak_rss_mb={s['peak_rss_mb']}")
         extra_str = ("; ".join(extra)) if extra else ""
         if extra_str:
-            print(f"  {pdf_name}: type={ptype}, {extra_str}\n    -> {out}")
+            METRICS.info(f"  {pdf_name}: type={ptype}, {extra_str}\n    -> {out}")
         else:
-            print(f"  {pdf_name}: type={ptype}\n    -> {out}")
+            METRICS.info(f"  {pdf_name}: type={ptype}\n    -> {out}")
 
     print(f"\nProcessed files: {len(summaries)}; total unique SKUs/order codes: {total_unique_skus}; total bestelnr occurrences: {total_bestelnr}")
 
+    # Throughput of the catalogs actually processed in this run (not the ones
+    # skipped as unchanged)
+    totals = merge_counters(s.get("metrics") or {} for s in processed)
+    rates = METRICS.throughput(totals)
+    if rates:
+        print(f"Throughput: {format_rates(rates)} ({METRICS.elapsed():.1f}s)")
+    if totals.get("images"):
+        print(
+            f"Images: {totals['images']} written, {totals.get('image_blobs_encoded', 0)} encoded, "
+            f"{totals.get('image_blobs_reused', 0)} reused from the image store"
+        )
+    if totals.get("image_streams_read") or totals.get("image_streams_skipped"):
+        print(f"Image streams: {format_read_stats(totals)}")
+    encoded = [s for s in processed if s.get("encode_jobs")]
+    if encoded:
+        encode_totals = {
+            "jobs": sum(s["encode_jobs"] for s in encoded),
+            "busy_seconds": sum(s.get("encode_seconds", 0.0) for s in encoded),
+            "wait_seconds": sum(s.get("encode_wait_seconds", 0.0) for s in encoded),
+        }
+        threads = max(s.get("encode_threads", 0) for s in encoded)
+        print(f"WebP encoding: {format_encode_stats(encode_totals, threads, totals.get('image_blobs_encoded', 0))}")
+    METRICS.event(
+        "run_done", pdfs=len(processed), skipped=len(summaries) - len(processed), seconds=round(METRICS.elapsed(), 3),
+        throughput={k: round(v, 2) for k, v in rates.items()}, **totals,
+    )
+
 
 if __name__ == "__main__":
     main()
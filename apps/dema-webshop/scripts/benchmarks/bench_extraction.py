@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Benchmark analyze_product_pdfs.py stage by stage on the synthetic fixtures.
+
+Runs process_pdf() on every fixture PDF (see make_fixtures.py) and times:
+
+- open                            pdfplumber.open + page list
+- find_tables_with_bboxes         includes _repair_missing_cells_from_text
+- _repair_missing_cells_from_text
+- enrich_record
+- flatten_records_with_grouping
+- image_extraction                extract_images_with_bboxes_from_page (incl. WebP;
+                                  encoded inline, see run_once)
+- total                           the whole process_pdf call
+
+Each fixture is run --repeat times and the fastest run is kept. Results can be
+saved as a JSON baseline and later runs compared against it.
+
+Usage:
+    python benchmarks/make_fixtures.py
+    python benchmarks/bench_extraction.py --save benchmarks/baselines/local.json
+    python benchmarks/bench_extraction.py --compare benchmarks/baselines/local.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdfplumber  # noqa: E402
+
+import analyze_product_pdfs as apd  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_FIXTURES = Path(__file__).parent / "fixtures"
+
+# Module-level functions wrapped with a timer; process_pdf looks them up as
+# globals at call time, so the wrappers see every call.
+TIMED_STAGES = {
+    "find_tables_with_bboxes": "find_tables_with_bboxes",
+    "_repair_missing_cells_from_text": "_repair_missing_cells_from_text",
+    "enrich_record": "enrich_record",
+    "flatten_records_with_grouping": "flatten_records_with_grouping",
+    "image_extraction": "extract_images_with_bboxes_from_page",
+}
+
+# Stages faster than this (seconds) are too noisy to flag as regressions
+NOISE_FLOOR = 0.005
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+class StageTimer:
+    """Accumulates wall time and call counts per stage."""
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        @wraps(func)
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - t0)
+        return timed
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            stage: {"seconds": round(self.seconds[stage], 6), "calls": self.calls[stage]}
+            for stage in sorted(self.seconds)
+        }
+
+
+@contextlib.contextmanager
+def instrumented(timer: StageTimer):
+    originals = {attr: getattr(apd, attr) for attr in TIMED_STAGES.values()}
+    try:
+        for stage, attr in TIMED_STAGES.items():
+            setattr(apd, attr, timer.wrap(stage, originals[attr]))
+        yield
+    finally:
+        for attr, func in originals.items():
+            setattr(apd, attr, func)
+
+
+def run_once(pdf_path: Path) -> Dict[str, Any]:
+    timer = StageTimer()
+
+    t0 = time.perf_counter()
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        n_pages = len(pdf.pages)
+    timer.add("open", time.perf_counter() - t0)
+
+    image_dir = apd.IMAGE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fresh image dir per run so images are always encoded, never reused
+        apd.IMAGE_DIR = Path(tmp) / "images"
+        try:
+            with instrumented(timer), contextlib.redirect_stdout(io.StringIO()):
+                t0 = time.perf_counter()
+                # encode_threads=0: WebP encodes run inline, inside the
+                # image_extraction stage, as before the encode pool existed
+                summary = apd.process_pdf(pdf_path, Path(tmp) / "json", clean_images=True, encode_threads=0)
+                timer.add("total", time.perf_counter() - t0)
+        finally:
+            apd.IMAGE_DIR = image_dir
+
+    return {"pages": n_pages, "items": summary.get("items"), "stages": timer.as_dict()}
+
+
+def run_fixture(pdf_path: Path, repeat: int) -> Dict[str, Any]:
+    """Run a fixture `repeat` times, keeping the fastest time per stage."""
+    best: Optional[Dict[str, Any]] = None
+    for _ in range(max(1, repeat)):
+        result = run_once(pdf_path)
+        if best is None:
+            best = result
+            continue
+        for stage, timing in result["stages"].items():
+            prev = best["stages"].get(stage)
+            if prev is None or timing["seconds"] < prev["seconds"]:
+                best["stages"][stage] = timing
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a stage-by-stage comparison and return the regressions found."""
+    regressions: List[str] = []
+    for fixture, result in current["results"].items():
+        base = baseline.get("results", {}).get(fixture)
+        if base is None:
+            print(f"  {fixture}: no baseline")
+            continue
+        print(f"  {fixture}:")
+        for stage, timing in result["stages"].items():
+            base_timing = base["stages"].get(stage)
+            if not base_timing:
+                continue
+            now, before = timing["seconds"], base_timing["seconds"]
+            ratio = now / before if before else float("inf")
+            flag = ""
+            if before >= NOISE_FLOOR and ratio > 1 + threshold:
+                flag = "  <-- slower"
+                regressions.append(f"{fixture}/{stage}")
+            print(f"    {stage:34s} {before:9.4f}s -> {now:9.4f}s  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stage-level benchmark of analyze_product_pdfs.py")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help=f"Fixture PDF directory (default: {DEFAULT_FIXTURES})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per fixture; the fastest is kept (default: 3)")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Compare against a saved baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown before a stage is flagged (default: 0.15)")
+    args = parser.parse_args()
+
+    pdfs = sorted(args.fixtures.glob("*.pdf"))
+    if not pdfs:
+        print(f"No fixtures in {args.fixtures}. Run benchmarks/make_fixtures.py first.")
+        exit(1)
+
+    current: Dict[str, Any] = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pdfplumber": getattr(pdfplumber, "__version__", "?"),
+            "extractor": apd.extractor_version_stamp(),
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    for pdf_path in pdfs:
+        result = run_fixture(pdf_path, args.repeat)
+        current["results"][pdf_path.name] = result
+        total = result["stages"]["total"]["seconds"]
+        print(f"{pdf_path.name}: {result['pages']} pages, {result['items']} items, {total:.3f}s")
+        for stage, timing in result["stages"].items():
+            if stage != "total":
+                print(f"    {stage:34s} {timing['seconds']:9.4f}s  ({timing['calls']} calls)")
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        with args.save.open("w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nSaved baseline -> {args.save}")
+
+    if args.compare:
+        with args.compare.open("r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nComparison with {args.compare}:")
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) slower than +{args.threshold:.0%}: {', '.join(regressions)}")
+            exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
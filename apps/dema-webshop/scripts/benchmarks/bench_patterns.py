@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: catalog_patterns vs the inline regex calls it replaced.
+
+Builds a cell corpus from every string value in public/data/*_products.json
+(the extracted catalogs), checks that the precompiled patterns give exactly
+the same answers as the original inline re.match/re.search chains, and times
+both.
+
+Usage:
+    python benchmarks/bench_patterns.py [--data-dir public/data] [--repeat 5]
+"""
+
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import catalog_patterns as cp  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "public" / "data"
+
+# Cells longer than this are descriptions/paths, not table cells
+MAX_CELL_LENGTH = 60
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (inline patterns as they were in analyze_product_pdfs.py)
+# ---------------------------------------------------------------------------
+
+def col_rename_inline(k: str, v_stripped: str) -> Optional[str]:
+    if re.search(r'[\d/]+.*[xX×].*[\d/]+', v_stripped):
+        return "size"
+    elif re.match(r'^[\d/]+\s*["\'"″]?\s*$', v_stripped) and len(v_stripped) < 15:
+        return "size"
+    elif re.match(r'^\d+\s*mm$', v_stripped, re.IGNORECASE) and 'kg' not in v_stripped.lower():
+        return "length_mm"
+    elif re.search(r'[Øø]\s*\d+|\d+\s*[Øø]', v_stripped):
+        return "diameter_mm"
+    elif re.search(r'\d+\s*/\s*\d+.*mm', v_stripped):
+        return "socket_sizes"
+    elif re.match(r'^[\d,\.]+\s*kg$', v_stripped, re.IGNORECASE):
+        return "weight_kg"
+    elif re.match(r'^[\d,\.]+\s*bar$', v_stripped, re.IGNORECASE):
+        return "pressure_bar"
+    elif re.match(r'^[\d,\.]+\s*m$', v_stripped, re.IGNORECASE):
+        return "length_m"
+    elif re.match(r'^[\d,\.]+\s*[lL]$', v_stripped):
+        return "volume_l"
+    elif k == "col_0" and re.match(r'^[A-Z][A-Z0-9\s/\-]+$', v_stripped) and len(v_stripped) > 3:
+        return "model_name"
+    return None
+
+
+def invalid_sku_inline(sku_str: str) -> bool:
+    invalid_sku_patterns = [
+        r'^-\s*-$',
+        r'^-\s+\d+',
+        r'^-+\s*$',
+        r'^\s*$',
+        r'^\d+\s*-\s*$',
+    ]
+    return any(re.match(p, sku_str) for p in invalid_sku_patterns)
+
+
+def sku_cell_inline(cell: str) -> bool:
+    return bool(re.match(r"^\d{5,10}(-[A-Za-z0-9.]+)?$", cell) or re.match(r"^[A-Za-z]+\d+", cell))
+
+
+def sku_cell_compiled(cell: str) -> bool:
+    return bool(cp.AIRPRESS_SKU_CELL.match(cell) or cp.PRODUCT_CODE_PREFIX.match(cell))
+
+
+# ---------------------------------------------------------------------------
+# Corpus and timing
+# ---------------------------------------------------------------------------
+
+def load_cells(data_dir: Path) -> List[str]:
+    cells: List[str] = []
+
+    def walk(value: Any) -> None:
+        if isinstance(value, str):
+            if len(value) <= MAX_CELL_LENGTH:
+                cells.append(value.strip())
+        elif isinstance(value, dict):
+            for v in value.values():
+                walk(v)
+        elif isinstance(value, list):
+            for v in value:
+                walk(v)
+
+    for path in sorted(data_dir.glob("*_products.json")):
+        with path.open("r", encoding="utf-8") as f:
+            walk(json.load(f))
+    return cells
+
+
+def check_same(name: str, before: Callable, after: Callable, cells: List[str]) -> None:
+    for cell in cells:
+        a, b = before(cell), after(cell)
+        if a != b:
+            print(f"MISMATCH in {name}: {cell!r}: inline={a!r} compiled={b!r}")
+            exit(1)
+
+
+def bench(name: str, before: Callable, after: Callable, cells: List[str], repeat: int) -> None:
+    check_same(name, before, after, cells)
+
+    def run(fn: Callable) -> float:
+        return min(timeit.repeat(lambda: [fn(c) for c in cells], number=1, repeat=repeat))
+
+    t_before, t_after = run(before), run(after)
+    print(f"  {name:24s} inline {t_before * 1000:8.1f} ms   compiled {t_after * 1000:8.1f} ms   x{t_before / t_after:4.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark catalog_patterns against inline regexes")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR, help=f"Directory with *_products.json (default: {DEFAULT_DATA_DIR})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats; the fastest is reported (default: 5)")
+    args = parser.parse_args()
+
+    cells = load_cells(args.data_dir)
+    if not cells:
+        print(f"No cells found in {args.data_dir}")
+        exit(1)
+    print(f"Corpus: {len(cells)} cells ({len(set(cells))} unique) from {args.data_dir}")
+
+    bench("col_N classification", lambda c: col_rename_inline("col_0", c), lambda c: cp.classify_cell(c, "col_0"), cells, args.repeat)
+    bench("col_N (not col_0)", lambda c: col_rename_inline("col_2", c), lambda c: cp.classify_cell(c, "col_2"), cells, args.repeat)
+    bench("invalid SKU", invalid_sku_inline, lambda c: bool(cp.INVALID_SKU.match(c)), cells, args.repeat)
+    bench("SKU-like cell", sku_cell_inline, sku_cell_compiled, cells, args.repeat)
+    print("All results identical.")
+
+
+if __name__ == "__main__":
+    main()
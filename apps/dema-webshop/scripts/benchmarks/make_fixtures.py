@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Generate synthetic DEMA-style catalog PDFs for the extraction benchmarks.
+
+The real supplier catalogs can't be committed, so these fixtures mimic the
+layouts analyze_product_pdfs.py has special handling for:
+
+1. Two-column "NR X - PRODUCT" fittings pages (messing-draadfittingen)
+2. DEMA pages with the blue footer band (drukbuizen)
+3. Kranzle transposed tables (models as columns)
+4. Pomp-specials continuation tables (header only on the first page)
+
+Filenames contain the catalog keys from PDF_CONFIG so the same extractors run
+as for the real catalogs. Output is deterministic for a given --scale.
+
+Usage:
+    python benchmarks/make_fixtures.py [--out benchmarks/fixtures] [--scale 1]
+"""
+
+import argparse
+import io
+import random
+import sys
+from pathlib import Path
+
+try:
+    import fitz  # PyMuPDF
+    import pdfplumber
+    from PIL import Image
+except ImportError:
+    print("ERROR: Required packages not installed. Run:")
+    print("  pip install pymupdf pdfplumber Pillow")
+    exit(1)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import analyze_product_pdfs as apd  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_OUT = Path(__file__).parent / "fixtures"
+
+# The footer blue is_dema_blue() looks for, so has_dema_footer() detects the
+# band by its colour rather than through the "DEMA" text fallback
+DEMA_BLUE = tuple(c / 255 for c in apd.DEMA_BLUE_RGB)
+
+
+# ---------------------------------------------------------------------------
+# Drawing helpers
+# ---------------------------------------------------------------------------
+
+def product_image(seed: int, width: int = 320, height: int = 240) -> bytes:
+    """Deterministic noisy PNG, large enough to pass is_good_product_image()."""
+    rng = random.Random(seed)
+    img = Image.frombytes("RGB", (width, height), rng.randbytes(width * height * 3))
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def draw_grid(page, x0: float, y0: float, col_w: float, row_h: float, rows) -> None:
+    """Draw a ruled table; the first row is set in bold like catalog headers."""
+    n_cols = len(rows[0])
+    for ri, row in enumerate(rows):
+        for ci, value in enumerate(row):
+            page.insert_text(
+                (x0 + ci * col_w + 3, y0 + ri * row_h + row_h - 5),
+                str(value),
+                fontsize=8,
+                fontname="hebo" if ri == 0 else "helv",
+            )
+    for ri in range(len(rows) + 1):
+        page.draw_line((x0, y0 + ri * row_h), (x0 + n_cols * col_w, y0 + ri * row_h))
+    for ci in range(n_cols + 1):
+        page.draw_line((x0 + ci * col_w, y0), (x0 + ci * col_w, y0 + len(rows) * row_h))
+
+
+def draw_dema_footer(page) -> None:
+    r = page.rect
+    # A plain "re" path: page.draw_rect() closes it with "h", which pdfplumber
+    # reports as a curve instead of a rect
+    band = page.new_shape()
+    band.draw_rect(fitz.Rect(0, r.height - 30, r.width, r.height))
+    band.finish(color=DEMA_BLUE, fill=DEMA_BLUE, closePath=False)
+    band.commit()
+    page.insert_text((20, r.height - 12), "DEMA", fontsize=10, color=(1, 1, 1))
+
+
+# ---------------------------------------------------------------------------
+# Layouts
+# ---------------------------------------------------------------------------
+
+def make_fittings_two_column(out: Path, n_pages: int) -> Path:
+    """Two NR series side by side, each with a photo and a Bestelnr/Maat table."""
+    doc = fitz.open()
+    for p in range(n_pages):
+        page = doc.new_page()
+        draw_dema_footer(page)
+        if p < 2:
+            # Cover and index (skip_pages {1, 2} for this catalog)
+            page.insert_text((50, 100), "INHOUD", fontsize=14)
+            continue
+        left_nr, right_nr = p * 2 - 3, p * 2 - 2
+        page.insert_text((40, 60), f"NR {left_nr} - MESSING BOCHT 90", fontsize=11)
+        page.insert_text((320, 60), f"NR {right_nr} - MESSING KNIE", fontsize=11)
+        page.insert_text((40, 80), "BINNENDRAAD", fontsize=9)
+        page.insert_image(fitz.Rect(40, 90, 240, 240), stream=product_image(p * 10 + 1))
+        page.insert_image(fitz.Rect(320, 90, 520, 240), stream=product_image(p * 10 + 2))
+        left = [["Bestelnr", "Maat"]] + [[f"MF{left_nr}{i}8", f'{i}/2"'] for i in range(1, 6)]
+        right = [["Bestelnr", "Maat"]] + [[f"MF{right_nr}{i}8", f'{i}/4"'] for i in range(1, 6)]
+        draw_grid(page, 40, 260, 90, 16, left)
+        draw_grid(page, 320, 260, 90, 16, right)
+    path = out / "messing-draadfittingen-synthetic.pdf"
+    doc.save(path)
+    return path
+
+
+def make_dema_footer_tables(out: Path, n_pages: int) -> Path:
+    """Blue-footer DEMA pages with a series title, optional photo and a spec table."""
+    doc = fitz.open()
+    for p in range(n_pages):
+        page = doc.new_page()
+        draw_dema_footer(page)
+        page.insert_text((40, 60), f"PVC DRUKBUIS PN{p % 10 + 6}", fontsize=12)
+        page.insert_text((40, 80), "LIJMMOF", fontsize=9)
+        if p % 2 == 0:
+            page.insert_image(fitz.Rect(350, 60, 550, 200), stream=product_image(100 + p))
+        rows = [["Bestelnr", "Diameter mm", "Lengte m", "Druk bar"]]
+        rows += [[f"DB{p}{i:03d}", f"{20 + i * 5}", "5", f"{p % 10 + 6}"] for i in range(12)]
+        draw_grid(page, 40, 220, 110, 16, rows)
+    path = out / "drukbuizen-synthetic.pdf"
+    doc.save(path)
+    return path
+
+
+def make_kranzle_transposed(out: Path, n_pages: int) -> Path:
+    """Kranzle layout: one column per model, properties as rows."""
+    doc = fitz.open()
+    for p in range(n_pages):
+        page = doc.new_page()
+        page.insert_text((40, 60), f"Kranzle serie {p}", fontsize=12)
+        page.insert_image(fitz.Rect(40, 80, 240, 230), stream=product_image(200 + p))
+        rows = [
+            ["MODEL", f"K {p}152 TS", f"K {p}160 TS", f"K {p}175 TST"],
+            ["Art.-nr. TS", f"60{p}010", f"60{p}020", f"60{p}030"],
+            ["Werkdruk", "120 bar", "130 bar", "150 bar"],
+            ["Doorloopcapaciteit", "8 l/min", "9 l/min", "10 l/min"],
+            ["Prijs", "€ 1.299,00", "€ 1.399,00", "€ 1.499,00"],
+        ]
+        draw_grid(page, 40, 260, 110, 18, rows)
+    path = out / "kranzle-synthetic.pdf"
+    doc.save(path)
+    return path
+
+
+def make_pomp_specials_continuation(out: Path, n_pages: int) -> Path:
+    """Pomp-specials: every other page continues the previous table without a header."""
+    doc = fitz.open()
+    for p in range(n_pages):
+        page = doc.new_page()
+        if p % 2 == 0:
+            page.insert_text((40, 60), f"Toepassing: drainage {p}", fontsize=10)
+            page.insert_text((40, 80), "Max. temperatuur: 35 °C", fontsize=9)
+            rows = [["Bestelnr", "Type", "Vermogen kW", "Debiet m3/h"]]
+        else:
+            rows = []
+        rows += [[f"PS{p}{i:02d}", f"T{p}{i}", f"{0.5 + i / 10:.1f}", f"{i + 3}"] for i in range(10)]
+        draw_grid(page, 40, 120, 110, 16, rows)
+    path = out / "pomp-specials-synthetic.pdf"
+    doc.save(path)
+    return path
+
+
+def footer_colour_misses(path: Path) -> list:
+    """1-indexed pages where has_dema_footer() holds only thanks to the
+    footer text: without the page's chars, the blue band alone must pass."""
+    misses = []
+    with pdfplumber.open(str(path)) as pdf:
+        for n, page in enumerate(pdf.pages, start=1):
+            if not apd.has_dema_footer(page):
+                continue
+            if not apd.has_dema_footer(page.filter(lambda obj: obj.get("object_type") != "char")):
+                misses.append(n)
+    return misses
+
+
+LAYOUTS = (
+    (make_fittings_two_column, 6),
+    (make_dema_footer_tables, 5),
+    (make_kranzle_transposed, 3),
+    (make_pomp_specials_continuation, 4),
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic catalog PDFs for benchmarks")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help=f"Output directory (default: {DEFAULT_OUT})")
+    parser.add_argument("--scale", type=int, default=1, help="Multiply the page count of every fixture")
+    args = parser.parse_args()
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    for make, pages in LAYOUTS:
+        path = make(args.out, pages * max(1, args.scale))
+        misses = footer_colour_misses(path)
+        if misses:
+            print(f"ERROR: {path.name}: blue footer not detected by colour on pages {misses}")
+            exit(1)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
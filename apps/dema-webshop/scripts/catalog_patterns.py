@@ -0,0 +1,140 @@
+"""
+Precompiled regular expressions shared by the catalog extraction scripts.
+
+analyze_product_pdfs.py runs the same literal patterns for every cell, record
+and page. Compiling them once here avoids re's cache lookup on each call, and
+classify_cell() folds the col_N value cascade into a single scan.
+
+SKU and price cells are not part of that scan: each catalog tests its own SKU
+pattern on one chosen cell per record (and the page probe on the page text),
+and prices are parsed by quantities.PRICE_PATTERNS. Those are single pattern
+calls with nothing to fold together; a cascade-wide "sku"/"price" kind would
+also rename col_N columns that flatten_record keeps under their own names.
+"""
+
+import re
+from typing import Callable, List, Optional, Tuple
+
+# ------------------------
+# SKU patterns
+# ------------------------
+
+# Airpress article codes: 5-10 digits with an optional suffix (e.g. "17130231", "45349-1.5")
+AIRPRESS_SKU_CELL = re.compile(r"^\d{5,10}(-[A-Za-z0-9.]+)?$")
+
+# Product codes: letters followed by digits (e.g. "ABSBU016", "ZF9012")
+PRODUCT_CODE_PREFIX = re.compile(r"^[A-Za-z]+\d+")
+
+# Makita model codes (e.g. "DHP484Z", "UC010GZ")
+MAKITA_MODEL = re.compile(r"^[A-Z]{2,3}\d{3,}[A-Z0-9]*$", re.IGNORECASE)
+
+# Kranzle article numbers: 5-6 digits, optionally with a suffix
+KRANZLE_SKU = re.compile(r"^\d{5,6}(-\d+)?$")
+
+# Page-level probes: does the page text contain SKUs of this draadfittingen catalog?
+CATALOG_SKU_PROBES = {
+    # RVS draadfittingen (9-prefixed SKUs)
+    "rvs-draadfittingen": re.compile(r"9(?:ZF|BUL|LAK|LAT|LAE|LAR|LABR|ZFBF|LAN|LAS|LAF|LAFL|ZFVL|ZFGF)[A-Z]*\d+"),
+    # Messing draadfittingen (MF-prefixed SKUs)
+    "messing-draadfittingen": re.compile(r"MF\d+"),
+    # Zwarte draad- en lasfittingen (7-prefixed SKUs)
+    "zwarte-draad-en-lasfittingen": re.compile(r"7(?:ZF|GB|BUL|LAK|LAT|LAE|LAR|LABR|ZFBF|LAN|LAS|LAF)[A-Z]*\d+"),
+    # Verzinkte buizen (ZF, GB, BUL prefixed SKUs without 7)
+    "verzinkte-buizen": re.compile(r"(?<![0-9])(?:ZF|GB|BUL)\d+"),
+    # Slangkoppelingen (B77, 9B77, C4, 9C77 prefixed SKUs)
+    "slangkoppelingen": re.compile(r"\d?[BC]\d{1,3}\d{3,}"),
+    # Slangklemmen (GM, GMI, MAXM, MAXI, SBI, SBIV, SB, X prefixed SKUs)
+    "slangklemmen": re.compile(r"(?:GMI?|MAXI?|SBIV?|QDW|X)\d{4,}"),
+}
+
+# Any SKU-like token in page text (codes like "MF1218", "DB050075", "45349"),
+# counted by the runtime estimate as a measure of table density
+SKU_TOKEN = re.compile(r"\b(?:[A-Z]{1,5}\d{3,}[A-Z0-9]*|\d{5,10})\b")
+
+# PDF artifacts that end up in SKU cells (checkmarks, bullets)
+SKU_ARTIFACTS = re.compile(r"[\uf0fc\uf0fb\uf0a7\u2022\u2713\u2714]")
+
+# Placeholder SKUs: "- -", "- 11,5 cm", "---", whitespace, "0 -"
+INVALID_SKU = re.compile(r"^(?:-\s*-$|-\s+\d+|-+\s*$|\s*$|\d+\s*-\s*$)")
+
+# col_0 holds a measurement rather than a code ("1/2\"", "3/4'", "20 mm")
+MEASUREMENT_CELL = re.compile(r"^[\d/]+\s*[\"']?$|^\d+\s*mm$")
+
+# Numeric article codes (e.g. "45349")
+NUMERIC_ARTICLE_CODE = re.compile(r"^\d{4,}$")
+
+# Alphanumeric codes (e.g. "ABSB02590")
+ALNUM_SKU = re.compile(r"^[A-Z]{2,}[A-Z0-9]+$", re.IGNORECASE)
+
+
+# ------------------------
+# Cell classification (col_N renaming)
+# ------------------------
+
+# (rename, pattern, mode, flags, extra check) in priority order. mode "search"
+# matches anywhere in the value, "match" at the start, as in the original
+# if/elif cascade in flatten_record.
+CellCheck = Optional[Callable[[str, Optional[str]], bool]]
+CELL_KINDS: List[Tuple[str, str, str, int, CellCheck]] = [
+    # Fitting sizes with x (e.g. "1/2\" x 3/8\"", "3/4 x 1/2")
+    ("size", r"[\d/]+.*[xX×].*[\d/]+", "search", 0, None),
+    # Single fraction measurements (e.g. "1/2\"", "3/4", "1\"")
+    ("size", r"^[\d/]+\s*[\"'\"″]?\s*$", "match", 0, lambda v, col: len(v) < 15),
+    # Length in mm (e.g. "125 mm") - but not if it's actually weight
+    ("length_mm", r"^\d+\s*mm$", "match", re.IGNORECASE, lambda v, col: "kg" not in v.lower()),
+    # Diameter in mm (e.g. "Ø 25", "25 Ø")
+    ("diameter_mm", r"[Øø]\s*\d+|\d+\s*[Øø]", "search", 0, None),
+    # Multiple sizes separated by / (e.g. "10 / 11 / 13 mm")
+    ("socket_sizes", r"\d+\s*/\s*\d+.*mm", "search", 0, None),
+    # Weight (e.g. "19 kg", "2,5 kg")
+    ("weight_kg", r"^[\d,\.]+\s*kg$", "match", re.IGNORECASE, None),
+    # Pressure (e.g. "10 bar")
+    ("pressure_bar", r"^[\d,\.]+\s*bar$", "match", re.IGNORECASE, None),
+    # Length in meters (e.g. "5 m", "10m")
+    ("length_m", r"^[\d,\.]+\s*m$", "match", re.IGNORECASE, None),
+    # Volume in liters (e.g. "50 L")
+    ("volume_l", r"^[\d,\.]+\s*[lL]$", "match", 0, None),
+    # Product type/model names in col_0 (e.g. "VORTEX 200", "DAB K30/70")
+    ("model_name", r"^[A-Z][A-Z0-9\s/\-]+$", "match", 0, lambda v, col: col == "col_0" and len(v) > 3),
+]
+
+_CELL_PATTERNS = [re.compile(p, f) for _, p, _, f, _ in CELL_KINDS]
+
+
+def _cell_alternative(idx: int, pattern: str, mode: str, flags: int) -> str:
+    if flags & re.IGNORECASE:
+        pattern = f"(?i:{pattern})"
+    if mode == "search":
+        # Zero-width lookahead so every alternative is tried at position 0 and
+        # the first one (in priority order) that matches anywhere wins
+        pattern = f"(?=[\\s\\S]*?(?:{pattern}))"
+    return f"(?P<k{idx}>{pattern})"
+
+
+# One pass over the value instead of up to ten separate re calls
+CELL_SCANNER = re.compile(
+    "|".join(_cell_alternative(i, p, mode, f) for i, (_, p, mode, f, _) in enumerate(CELL_KINDS))
+)
+
+
+def classify_cell(value: str, column: Optional[str] = None) -> Optional[str]:
+    """Semantic key for a stripped col_N value, or None if nothing matches.
+
+    Same result as trying CELL_KINDS in order; `column` is the col_N key
+    (model names are only recognised in col_0).
+    """
+    m = CELL_SCANNER.match(value)
+    if m is None:
+        return None
+    idx = int(m.lastgroup[1:])
+    rename, _, _, _, check = CELL_KINDS[idx]
+    if check is None or check(value, column):
+        return rename
+    # Extra condition failed: continue the cascade after the matched kind
+    for i in range(idx + 1, len(CELL_KINDS)):
+        rename, _, mode, _, check = CELL_KINDS[i]
+        pattern = _CELL_PATTERNS[i]
+        hit = pattern.search(value) if mode == "search" else pattern.match(value)
+        if hit and (check is None or check(value, column)):
+            return rename
+    return None
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Golden check for slugs.slug against the slugify functions it replaced.
+
+Collects every series name (plus names, categories and series ids) from
+public/data/*.json and checks that slug() gives exactly what the original
+regex-based slugify functions of analyze_product_pdfs.py (plain) and
+extract_product_images.py (accent folding) gave.
+
+Usage:
+    python scripts/check_slugs.py [--data-dir public/data]
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Optional, Set
+
+from slugs import slug
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / "public" / "data"
+
+# Fields whose values get slugified by the extraction scripts
+NAME_FIELDS = {"series_name", "series_id", "name", "category", "product_type", "application"}
+
+
+# Original implementations (reference)
+
+def slugify_analyze(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    t = text.strip().lower()
+    t = re.sub(r"/", " ", t)
+    t = re.sub(r"[^a-z0-9]+", "-", t)
+    t = re.sub(r"-+", "-", t).strip("-")
+    return t or None
+
+
+def slugify_images(text: str) -> str:
+    if not text:
+        return ""
+    text = text.lower().strip()
+    text = re.sub(r"[äàáâã]", "a", text)
+    text = re.sub(r"[ëèéê]", "e", text)
+    text = re.sub(r"[ïìíî]", "i", text)
+    text = re.sub(r"[öòóôõ]", "o", text)
+    text = re.sub(r"[üùúû]", "u", text)
+    text = re.sub(r"[ñ]", "n", text)
+    text = re.sub(r"[ß]", "ss", text)
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = re.sub(r"-+", "-", text).strip("-")
+    return text
+
+
+def collect_names(data_dir: Path) -> Set[str]:
+    names: Set[str] = set()
+
+    def walk(value: Any) -> None:
+        if isinstance(value, dict):
+            for k, v in value.items():
+                if k in NAME_FIELDS and isinstance(v, str):
+                    names.add(v)
+                walk(v)
+        elif isinstance(value, list):
+            for v in value:
+                walk(v)
+
+    for path in sorted(data_dir.glob("*.json")):
+        with path.open("r", encoding="utf-8") as f:
+            walk(json.load(f))
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check slugs.slug against the original slugify functions")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR, help=f"Directory with catalog JSON (default: {DEFAULT_DATA_DIR})")
+    args = parser.parse_args()
+
+    names = collect_names(args.data_dir)
+    # Edge cases the catalogs may not contain
+    names |= {"", " ", "Ø 25 / 32", "Straße", "ÄÖÜ àéîõû ñ", "--a--b--", "PVC/PE", "1/2\" x 3/4\""}
+    if len(names) < 10:
+        print(f"Too few names found in {args.data_dir}")
+        sys.exit(1)
+
+    failures = 0
+    for name in sorted(names):
+        expected_analyze = slugify_analyze(name)
+        actual_analyze = slug(name) or None
+        expected_images = slugify_images(name)
+        actual_images = slug(name, fold_accents=True) if name else ""
+        if actual_analyze != expected_analyze or actual_images != expected_images:
+            failures += 1
+            print(f"MISMATCH {name!r}: analyze {actual_analyze!r} != {expected_analyze!r} "
+                  f"or images {actual_images!r} != {expected_images!r}")
+
+    print(f"Checked {len(names)} names: {failures} mismatches")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Extraction-time cost model for catalog PDFs.
+
+analyze_product_pdfs.py --estimate scans every PDF with PyMuPDF (page count,
+images, text density, SKU-like tokens, vector drawings per page) and predicts
+how long extraction will take. The per-page weights are fitted on earlier
+--profile reports (per-page seconds) and stored next to the JSON output, so
+estimates improve as catalogs get profiled. The parallel driver uses the same
+predictions to start the longest catalogs first (LPT scheduling).
+"""
+
+import heapq
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Page features, in model order. Scaled so the default weights are seconds
+# per unit of a typical catalog page.
+FEATURES = ("base", "images", "kchars", "sku_tokens", "hdrawings")
+
+# Uncalibrated guesses (seconds): pdfplumber table finding dominates text and
+# ruling-heavy pages, image extraction + WebP encoding costs per image
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "base": 0.03,
+    "images": 0.04,
+    "kchars": 0.01,
+    "sku_tokens": 0.0005,
+    "hdrawings": 0.02,
+}
+# Per catalog: open, pre-scan, flatten and writing the JSON
+DEFAULT_OVERHEAD = 0.2
+DEFAULT_OVERHEAD_PER_PAGE = 0.005
+
+# Ridge strength (relative to the data's scale) pulling fitted weights toward
+# the defaults, so a handful of profiled pages can't produce wild weights
+RIDGE = 0.1
+
+# Stored in the output directory; deliberately not *.json (the webshop scripts
+# load every *.json file there as a catalog)
+COST_MODEL_NAME = ".analyze_product_pdfs.costmodel"
+
+
+@dataclass
+class PageFeatures:
+    """What the PyMuPDF scan sees on one page."""
+
+    page: int
+    images: int = 0
+    chars: int = 0
+    sku_tokens: int = 0
+    drawings: int = 0
+    # False when the pre-scan would skip the page (no table possible)
+    analysed: bool = True
+
+    def vector(self) -> List[float]:
+        return [1.0, float(self.images), self.chars / 1000.0, float(self.sku_tokens), self.drawings / 100.0]
+
+
+@dataclass
+class CatalogScan:
+    pdf: str
+    page_count: int
+    pages: List[PageFeatures] = field(default_factory=list)
+
+    @property
+    def analysed_pages(self) -> List[PageFeatures]:
+        return [p for p in self.pages if p.analysed]
+
+    def totals(self) -> Dict[str, int]:
+        return {
+            "pages": self.page_count,
+            "analysed_pages": len(self.analysed_pages),
+            "images": sum(p.images for p in self.pages),
+            "chars": sum(p.chars for p in self.pages),
+            "sku_tokens": sum(p.sku_tokens for p in self.pages),
+        }
+
+
+@dataclass
+class CostModel:
+    weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_WEIGHTS))
+    overhead: float = DEFAULT_OVERHEAD
+    overhead_per_page: float = DEFAULT_OVERHEAD_PER_PAGE
+    # Profiled pages / catalogs the weights were fitted on (0 = defaults)
+    samples: int = 0
+    catalogs: int = 0
+
+    def predict_page(self, page: PageFeatures) -> float:
+        if not page.analysed:
+            return 0.0
+        return sum(self.weights[f] * x for f, x in zip(FEATURES, page.vector()))
+
+    def predict(self, scan: CatalogScan) -> float:
+        """Predicted extraction seconds for one catalog."""
+        pages = sum(self.predict_page(p) for p in scan.pages)
+        return self.overhead + self.overhead_per_page * scan.page_count + pages
+
+    # ------------------------
+    # Calibration
+    # ------------------------
+
+    @classmethod
+    def calibrate(
+        cls,
+        page_samples: Sequence[Tuple[PageFeatures, float]],
+        catalog_samples: Sequence[Tuple[CatalogScan, float, float]] = (),
+    ) -> "CostModel":
+        """Fit weights on (page features, profiled seconds) pairs.
+
+        catalog_samples are (scan, wall seconds, sum of profiled page seconds)
+        per profiled catalog and fit the per-catalog overhead.
+        """
+        model = cls()
+        samples = [(p, s) for p, s in page_samples if p.analysed]
+        if samples:
+            model.weights = _ridge_fit(samples, DEFAULT_WEIGHTS)
+            model.samples = len(samples)
+        rest = [(scan.page_count, max(0.0, wall - paged)) for scan, wall, paged in catalog_samples]
+        if rest:
+            pages = sum(n for n, _ in rest)
+            seconds = sum(s for _, s in rest)
+            # Split evenly between the fixed and the per-page part
+            model.overhead = seconds / (2 * len(rest))
+            model.overhead_per_page = seconds / (2 * pages) if pages else DEFAULT_OVERHEAD_PER_PAGE
+            model.catalogs = len(rest)
+        return model
+
+    # ------------------------
+    # Persistence
+    # ------------------------
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "weights": self.weights,
+            "overhead": self.overhead,
+            "overhead_per_page": self.overhead_per_page,
+            "samples": self.samples,
+            "catalogs": self.catalogs,
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "CostModel":
+        """Saved model, or the default one if there is none (or it's unreadable)."""
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            weights = dict(DEFAULT_WEIGHTS)
+            weights.update({k: float(v) for k, v in data.get("weights", {}).items() if k in DEFAULT_WEIGHTS})
+            return cls(
+                weights=weights,
+                overhead=float(data.get("overhead", DEFAULT_OVERHEAD)),
+                overhead_per_page=float(data.get("overhead_per_page", DEFAULT_OVERHEAD_PER_PAGE)),
+                samples=int(data.get("samples", 0)),
+                catalogs=int(data.get("catalogs", 0)),
+            )
+        except (OSError, ValueError, TypeError, AttributeError):
+            return cls()
+
+
+def _ridge_fit(samples: Sequence[Tuple[PageFeatures, float]], prior: Dict[str, float]) -> Dict[str, float]:
+    """Least squares pulled toward `prior`, with weights clamped at zero."""
+    n = len(FEATURES)
+    xtx = [[0.0] * n for _ in range(n)]
+    xty = [0.0] * n
+    for page, seconds in samples:
+        x = page.vector()
+        for i in range(n):
+            xty[i] += x[i] * seconds
+            for j in range(n):
+                xtx[i][j] += x[i] * x[j]
+    # Per-feature ridge, scaled to that feature's magnitude in the data
+    w0 = [prior[f] for f in FEATURES]
+    for i in range(n):
+        lam = RIDGE * max(xtx[i][i], 1e-9)
+        xtx[i][i] += lam
+        xty[i] += lam * w0[i]
+    w = _solve(xtx, xty)
+    if w is None:
+        return dict(prior)
+    return {f: max(0.0, v) for f, v in zip(FEATURES, w)}
+
+
+def _solve(a: List[List[float]], b: List[float]) -> Optional[List[float]]:
+    """Gaussian elimination with partial pivoting (None if singular)."""
+    n = len(b)
+    m = [row[:] + [b[i]] for i, row in enumerate(a)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        if abs(m[pivot][col]) < 1e-12:
+            return None
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(n):
+            if r != col:
+                factor = m[r][col] / m[col][col]
+                for c in range(col, n + 1):
+                    m[r][c] -= factor * m[col][c]
+    return [m[i][n] / m[i][i] for i in range(n)]
+
+
+# ------------------------
+# Scheduling
+# ------------------------
+
+def lpt_order(estimates: Dict[str, float], names: Iterable[str]) -> List[str]:
+    """Longest-processing-time-first order (unknown estimates go last, by name)."""
+    return sorted(names, key=lambda n: (-estimates.get(n, 0.0), n))
+
+
+def lpt_makespan(durations: Iterable[float], workers: int) -> float:
+    """Wall time of LPT list scheduling: each job (longest first) goes to the
+    worker that frees up first, as ProcessPoolExecutor does with the submit
+    order."""
+    loads = [0.0] * max(1, workers)
+    for d in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + d)
+    return max(loads)
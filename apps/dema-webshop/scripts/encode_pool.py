@@ -0,0 +1,139 @@
+"""
+Bounded thread pool for WebP image writes.
+
+Image extraction used to encode every WebP inline, so page parsing stopped
+for each image (extract_product_images.py encodes with method=6, the slowest
+effort level). Pillow releases the GIL while encoding, so a few threads can
+encode while the main thread keeps parsing pages.
+
+EncodePool keeps at most max_pending jobs in flight; submit() blocks on the
+oldest job once that many are queued (back-pressure), so the raw image bytes
+held by queued jobs stay bounded. Completion callbacks run on the submitting
+thread, in submission order, from submit() and drain(): callers can update
+counters, lists and console output without locks.
+
+With workers=0 every job runs inline (used for --profile, whose per-page
+stage timer is not thread-safe).
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+DEFAULT_ENCODE_THREADS = min(4, os.cpu_count() or 1)
+
+# Jobs in flight per worker thread before submit() blocks
+PENDING_PER_WORKER = 4
+
+Callback = Optional[Callable[[Any], None]]
+
+
+class EncodePool:
+    """Thread pool with a bounded queue and in-order completion callbacks."""
+
+    def __init__(self, workers: int = DEFAULT_ENCODE_THREADS, max_pending: Optional[int] = None):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Tuple[Future, Callback, Callback]] = deque()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, float] = {"jobs": 0, "failed": 0, "busy_seconds": 0.0, "wait_seconds": 0.0}
+        self.configure(workers, max_pending)
+
+    def configure(self, workers: int, max_pending: Optional[int] = None) -> "EncodePool":
+        """Change the thread count (finishing queued jobs first)."""
+        workers = max(0, workers)
+        if getattr(self, "workers", None) == workers:
+            return self
+        self.close()
+        self.workers = workers
+        self.max_pending = max_pending or PENDING_PER_WORKER * max(1, workers)
+        return self
+
+    def submit(self, fn: Callable[..., Any], *args: Any, on_done: Callback = None, on_error: Callback = None, **kwargs: Any) -> None:
+        """Run fn(*args, **kwargs) on a worker thread.
+
+        on_done(result) or on_error(exception) is called later, on this
+        thread. Without on_error, a failing job's exception is re-raised from
+        submit()/drain().
+        """
+        if self.workers == 0:
+            future: Future = Future()
+            try:
+                future.set_result(self._timed(fn, args, kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+            self._finish(future, on_done, on_error)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="webp")
+        if len(self._pending) >= self.max_pending:
+            t0 = time.perf_counter()
+            self._pending[0][0].exception()
+            self._stats["wait_seconds"] += time.perf_counter() - t0
+        self._reap()
+        self._pending.append((self._executor.submit(self._timed, fn, args, kwargs), on_done, on_error))
+
+    def drain(self) -> None:
+        """Wait for every queued job and run its callback."""
+        while self._pending:
+            t0 = time.perf_counter()
+            self._pending[0][0].exception()
+            self._stats["wait_seconds"] += time.perf_counter() - t0
+            self._reap()
+
+    def stats(self) -> Dict[str, float]:
+        """Cumulative counters: jobs, failed, busy_seconds (summed over the
+        worker threads) and wait_seconds (submitting thread blocked)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        self.drain()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _timed(self, fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._stats["jobs"] += 1
+                self._stats["busy_seconds"] += time.perf_counter() - t0
+
+    def _reap(self) -> None:
+        """Run the callbacks of finished jobs at the head of the queue."""
+        while self._pending and self._pending[0][0].done():
+            self._finish(*self._pending.popleft())
+
+    def _finish(self, future: Future, on_done: Callback, on_error: Callback) -> None:
+        exc = future.exception()
+        if exc is None:
+            if on_done is not None:
+                on_done(future.result())
+            return
+        with self._lock:
+            self._stats["failed"] += 1
+        if on_error is None:
+            raise exc
+        on_error(exc)
+
+
+def format_encode_stats(stats: Dict[str, float], workers: int, encoded: int) -> str:
+    """One-line throughput summary, e.g. for the end of a run.
+
+    `encoded` is the number of new images the jobs encoded; jobs that only
+    linked an existing image-store blob take next to no time, so the rate is
+    over the new encodes alone.
+    """
+    jobs = int(stats.get("jobs", 0))
+    busy = stats.get("busy_seconds", 0.0)
+    rate = f"{encoded / busy:.1f} encodes/s per thread" if encoded and busy > 0 else "no new encodes"
+    threads = (f"{workers} thread" + ("s" if workers > 1 else "")) if workers else "inline"
+    return (
+        f"{jobs} image writes, {encoded} newly encoded, in {busy:.2f}s of pool time ({rate}, {threads}); "
+        f"main thread waited {stats.get('wait_seconds', 0.0):.2f}s for the queue"
+    )
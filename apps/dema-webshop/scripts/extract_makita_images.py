@@ -3,7 +3,8 @@
 Extract high-quality images from Makita PDF catalogs.
 
 This script renders PDF pages at high DPI to get better quality images
-than extracting embedded images which are often compressed.
+than extracting embedded images which are often compressed. Pages are
+rasterised in parallel worker processes (see page_renderer.py).
 
 Usage:
     python scripts/extract_makita_images.py
@@ -18,7 +19,7 @@ sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
 
 try:
     import fitz  # PyMuPDF
-    from PIL import Image
+    import PIL  # noqa: F401 - dependency check: page_renderer encodes with Pillow
 except ImportError as e:
     print(f"Error: Missing required package: {e}")
     print("Install with: pip install PyMuPDF Pillow")
@@ -34,12 +35,15 @@ MAKITA_PDFS = [
     "makita-tuinfolder-2022-nl.pdf",
 ]
 
+from page_renderer import DEFAULT_RENDER_WORKERS, PageRenderer, page_job  # noqa: E402
+
 # Settings
 DPI = 150  # Good balance of quality and file size
 QUALITY = 85  # WebP quality
+WORKERS = DEFAULT_RENDER_WORKERS  # Render processes (1 = serial)
 
 
-def render_pdf_pages(pdf_path: Path, output_dir: Path, dpi: int = 150, quality: int = 85):
+def render_pdf_pages(pdf_path: Path, output_dir: Path, dpi: int = 150, quality: int = 85, workers: int = WORKERS):
     """Render all pages of a PDF as high-quality images."""
     
     pdf_stem = pdf_path.stem
@@ -49,36 +53,23 @@ def render_pdf_pages(pdf_path: Path, output_dir: Path, dpi: int = 150, quality:
     print(f"\nProcessing: {pdf_path.name}")
     
     try:
-        doc = fitz.open(str(pdf_path))
-        total_pages = len(doc)
+        with fitz.open(str(pdf_path)) as doc:
+            total_pages = len(doc)
         print(f"  Total pages: {total_pages}")
         
-        for page_num in range(total_pages):
-            page = doc[page_num]
-            page_number = page_num + 1  # 1-indexed
-            
-            # Output filename
-            img_filename = f"{pdf_stem}__p{page_number}__rendered.webp"
-            img_path = page_output_dir / img_filename
-            
-            # Skip if already exists
-            if img_path.exists():
-                continue
-            
-            # Render at high DPI
-            mat = fitz.Matrix(dpi / 72, dpi / 72)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            
-            # Save as WebP
-            img.save(img_path, "WEBP", quality=quality)
-            
-            if page_number % 10 == 0:
-                print(f"  Rendered page {page_number}/{total_pages}")
+        # Skip pages whose image already exists
+        jobs = [
+            page_job(page_number, page_output_dir / f"{pdf_stem}__p{page_number}__rendered.webp", dpi)
+            for page_number in range(1, total_pages + 1)
+        ]
+        
+        def report(result):
+            if result.error is not None:
+                print(f"  Warning: page {result.page}: {result.error}")
+            elif result.page % 10 == 0:
+                print(f"  Rendered page {result.page}/{total_pages}")
         
-        doc.close()
+        PageRenderer(pdf_path, workers=workers, quality=quality).render(jobs, on_result=report)
         print(f"  Done! Images saved to: {page_output_dir}")
         
     except Exception as e:
@@ -91,6 +82,7 @@ def main():
     print("=" * 60)
     print(f"DPI: {DPI}")
     print(f"Quality: {QUALITY}")
+    print(f"Workers: {WORKERS}")
     print(f"Output: {OUTPUT_DIR}")
     
     for pdf_name in MAKITA_PDFS:
@@ -7,6 +7,7 @@ This script:
 3. Matches images to specific series using vertical proximity on the page
 4. Converts images to WebP format for optimal web performance
 5. Saves images with structured naming: {pdf_stem}/{series_slug}_{sku}.webp
+   plus smaller srcset copies in {pdf_stem}/srcset/ (--srcset-widths)
 6. Updates JSON files with accurate image paths per series
 7. Generates image-sku-mapping.json with complete SKU lists per image
 
@@ -21,12 +22,20 @@ Usage:
 """
 
 import argparse
+import hashlib
 import io
 import json
 import re
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from encode_pool import DEFAULT_ENCODE_THREADS, EncodePool, format_encode_stats
+from image_store import image_store_for
+from pdf_image_info import ImageInfo, format_read_stats, note_read, note_skipped, page_image_infos
+from run_metrics import METRICS, add_metrics_arguments, format_rates, verbosity_from_args
+from slugs import slug
 
 try:
     import fitz  # pymupdf
@@ -75,6 +84,11 @@ MIN_IMAGE_AREA = 10000  # e.g., 100x100 or 114x103 (rubber-slangen accessory ima
 # Ratio > 3.0 means very wide or very tall (likely a banner or logo strip)
 MAX_ASPECT_RATIO = 4.0  # Allow slightly wider images (rubber-slangen hose images are ~3.05)
 
+# Widths (px) of the smaller copies written next to each image for srcset;
+# the main image (--max-width) is the largest candidate
+DEFAULT_SRCSET_WIDTHS = (160, 320, 640)
+SRCSET_DIRNAME = "srcset"
+
 # Maximum distance (in PDF points) between image bottom and table top
 # for them to be considered related
 MAX_IMAGE_TABLE_DISTANCE = 300
@@ -88,17 +102,7 @@ def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
     if not text:
         return ""
-    text = text.lower().strip()
-    text = re.sub(r"[äàáâã]", "a", text)
-    text = re.sub(r"[ëèéê]", "e", text)
-    text = re.sub(r"[ïìíî]", "i", text)
-    text = re.sub(r"[öòóôõ]", "o", text)
-    text = re.sub(r"[üùúû]", "u", text)
-    text = re.sub(r"[ñ]", "n", text)
-    text = re.sub(r"[ß]", "ss", text)
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
-    return text
+    return slug(text, fold_accents=True)
 
 
 def load_json_records(json_path: Path) -> List[Dict[str, Any]]:
@@ -123,7 +127,7 @@ def load_json_records(json_path: Path) -> List[Dict[str, Any]]:
                 return [data]
         return []
     except Exception as e:
-        print(f"  Warning: Could not load {json_path}: {e}")
+        METRICS.warn(f"  Warning: Could not load {json_path}: {e}")
         return []
 
 
@@ -605,6 +609,37 @@ def has_sufficient_color_variance(image_bytes: bytes, min_std: float = 35.0) ->
         return True  # Default to keeping image if check fails
 
 
+def dimension_rejection(width: int, height: int) -> Optional[str]:
+    """Rejection reason from the image dimensions alone (None = passes)."""
+    area = width * height
+    if area < MIN_IMAGE_AREA:
+        return f"too_small ({width}x{height})"
+    if height > 0:
+        ratio = max(width / height, height / width)
+        if ratio > MAX_ASPECT_RATIO:
+            return f"bad_aspect_ratio ({ratio:.1f})"
+    return None
+
+
+def metadata_rejection(
+    info: ImageInfo,
+    min_width: int = MIN_IMAGE_WIDTH,
+    min_height: int = MIN_IMAGE_HEIGHT,
+) -> Optional[str]:
+    """The part of extract_images_from_page's filtering that needs no image
+    bytes: the same reasons, in the same order, decided from metadata."""
+    if info.width < min_width or info.height < min_height:
+        return "too_small"
+    reason = dimension_rejection(info.width, info.height)
+    if reason:
+        return reason
+    if info.is_grayscale:
+        # Decodes without any saturation: is_black_and_white_only() would
+        # reject it after extracting and decoding it
+        return "black_and_white_only"
+    return None
+
+
 def get_image_quality_score(image_bytes: bytes, width: int, height: int) -> dict:
     """Calculate quality metrics for an image.
     
@@ -619,21 +654,13 @@ def get_image_quality_score(image_bytes: bytes, width: int, height: int) -> dict
         "metrics": {}
     }
     
-    # Check 1: Size
-    area = width * height
-    if area < MIN_IMAGE_AREA:
+    # Checks 1-2: Size and aspect ratio
+    reason = dimension_rejection(width, height)
+    if reason:
         result["is_valid"] = False
-        result["rejection_reason"] = f"too_small ({width}x{height})"
+        result["rejection_reason"] = reason
         return result
     
-    # Check 2: Aspect ratio
-    if height > 0:
-        ratio = max(width / height, height / width)
-        if ratio > MAX_ASPECT_RATIO:
-            result["is_valid"] = False
-            result["rejection_reason"] = f"bad_aspect_ratio ({ratio:.1f})"
-            return result
-    
     # Check 3: Black and white only
     if is_black_and_white_only(image_bytes):
         result["is_valid"] = False
@@ -721,6 +748,7 @@ def extract_images_from_page(
     doc: fitz.Document,
     min_width: int = MIN_IMAGE_WIDTH,
     min_height: int = MIN_IMAGE_HEIGHT,
+    load_rejected: bool = True,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Extract all images from a PDF page with their bounding boxes.
     
@@ -729,32 +757,55 @@ def extract_images_from_page(
         
     Product images pass all filters.
     Brand images are those filtered out due to size/aspect ratio.
+    
+    Candidates are first filtered on metadata (placement, dimensions,
+    colorspace; see metadata_rejection), so most rejected images are never
+    extracted. With load_rejected=False those brand images carry no bytes.
     """
     product_images = []
     brand_images = []
     
-    for img_info in page.get_images(full=True):
-        xref = img_info[0]
+    for info in page_image_infos(doc, page):
+        xref = info.xref
         
         try:
+            # Get image position on page
+            img_rects = page.get_image_rects(xref)
+            if not img_rects:
+                note_skipped(info)
+                continue
+            
+            # Use first rect (image might appear multiple times)
+            rect = img_rects[0]
+            
+            # Reject on metadata before reading any bytes (rejected images
+            # only need their bytes when they are kept for review)
+            reason = metadata_rejection(info, min_width, min_height)
+            if reason and not load_rejected:
+                note_skipped(info)
+                brand_images.append({
+                    "xref": xref,
+                    "bbox": (rect.x0, rect.y0, rect.x1, rect.y1),
+                    "width": info.width,
+                    "height": info.height,
+                    "bytes": None,
+                    "ext": None,
+                    "ocr_skus": [],
+                    "rejection_reason": reason,
+                })
+                continue
+            
             # Get image data
             base_image = doc.extract_image(xref)
             if not base_image:
                 continue
+            note_read(info)
             
             image_bytes = base_image.get("image")
             image_ext = base_image.get("ext", "png")
             width = base_image.get("width", 0)
             height = base_image.get("height", 0)
             
-            # Get image position on page
-            img_rects = page.get_image_rects(xref)
-            if not img_rects:
-                continue
-            
-            # Use first rect (image might appear multiple times)
-            rect = img_rects[0]
-            
             img_data = {
                 "xref": xref,
                 "bbox": (rect.x0, rect.y0, rect.x1, rect.y1),
@@ -783,7 +834,7 @@ def extract_images_from_page(
                     product_images.append(img_data)
                 
         except Exception as e:
-            print(f"    Warning: Could not extract image xref={xref}: {e}")
+            METRICS.warn(f"    Warning: Could not extract image xref={xref}: {e}")
             continue
     
     return product_images, brand_images
@@ -793,52 +844,134 @@ def extract_images_from_page(
 # These were causing image quality issues by replacing dark pixels with white
 
 
+def open_for_webp(image_bytes: bytes) -> "Image.Image":
+    """Decode image bytes into a mode WebP can store, preserving transparency.
+    
+    WebP supports alpha channels natively, so we preserve transparency
+    instead of compositing onto a white background (which caused artifacts).
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    
+    # Handle different modes - PRESERVE TRANSPARENCY (WebP supports alpha)
+    if img.mode == "RGBA":
+        # Keep RGBA as-is - no white background compositing
+        pass
+    elif img.mode == "LA":
+        # Grayscale with alpha - convert to RGBA to preserve transparency
+        img = img.convert("RGBA")
+    elif img.mode == "P":
+        # Palette mode - may have transparency
+        if "transparency" in img.info:
+            img = img.convert("RGBA")
+        else:
+            img = img.convert("RGB")
+    elif img.mode == "L":
+        # Grayscale - convert to RGB
+        img = img.convert("RGB")
+    elif img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    return img
+
+
+def encode_decoded_webp(img: "Image.Image", quality: int = 95, max_width: Optional[int] = None) -> bytes:
+    """Encode an open_for_webp() image, downscaled to max_width if wider."""
+    # Resize if max_width specified
+    if max_width and img.width > max_width:
+        ratio = max_width / img.width
+        new_height = int(img.height * ratio)
+        img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
+    
+    # Save as WebP with high quality (supports both RGB and RGBA)
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=quality, method=6)
+    return buf.getvalue()
+
+
+def encode_webp(
+    image_bytes: bytes,
+    quality: int = 95,
+    max_width: Optional[int] = None,
+) -> bytes:
+    """Encode image bytes as WebP, preserving transparency."""
+    return encode_decoded_webp(open_for_webp(image_bytes), quality=quality, max_width=max_width)
+
+
+def webp_params(quality: int, max_width: Optional[int]) -> Tuple:
+    """Image store parameters of an encode_webp() output."""
+    return ("WEBP", quality, max_width, "method=6", "alpha-preserving")
+
+
+def derivative_widths(width: int, max_width: Optional[int], widths: Sequence[int]) -> List[int]:
+    """srcset widths worth producing for an image `width` px wide: those
+    below the main image's width (never upscaled)."""
+    main_width = min(width, max_width) if max_width else width
+    return sorted(w for w in set(widths) if w < main_width)
+
+
+def derivative_path(output_path: Path, width: int) -> Path:
+    """images/<pdf>/<name>.webp -> images/<pdf>/srcset/<name>__w<width>.webp
+    
+    A subfolder, so smart_dedupe.py and the mapping scan of the image
+    folders don't take derivatives for separate images.
+    """
+    return output_path.parent / SRCSET_DIRNAME / f"{output_path.stem}__w{width}{output_path.suffix}"
+
+
 def convert_to_webp(
     image_bytes: bytes,
     output_path: Path,
     quality: int = 95,
     max_width: Optional[int] = None,
+    srcset_widths: Sequence[int] = (),
 ) -> bool:
-    """Convert image bytes to WebP format, preserving transparency.
-    
-    WebP supports alpha channels natively, so we preserve transparency
-    instead of compositing onto a white background (which caused artifacts).
+    """Convert image bytes to WebP at output_path (overwriting it), plus a
+    smaller copy per srcset width at derivative_path(output_path, width).
+    
+    The encoded images come from the content-addressed image store next to
+    IMAGE_OUTPUT_DIR, so an image repeated across series or pages is encoded
+    once and hardlinked to each of its filenames. The source is decoded once
+    for all widths, and only when one of them isn't in the store yet;
+    outputs already holding this source's encoding are left untouched.
+    Thread-safe (see ENCODE_POOL); raises if the image can't be converted,
+    so the warning is printed by the pool's on_error (webp_failed) on the
+    submitting thread.
     """
-    try:
-        img = Image.open(io.BytesIO(image_bytes))
-        
-        # Handle different modes - PRESERVE TRANSPARENCY (WebP supports alpha)
-        if img.mode == "RGBA":
-            # Keep RGBA as-is - no white background compositing
-            pass
-        elif img.mode == "LA":
-            # Grayscale with alpha - convert to RGBA to preserve transparency
-            img = img.convert("RGBA")
-        elif img.mode == "P":
-            # Palette mode - may have transparency
-            if "transparency" in img.info:
-                img = img.convert("RGBA")
-            else:
-                img = img.convert("RGB")
-        elif img.mode == "L":
-            # Grayscale - convert to RGB
-            img = img.convert("RGB")
-        elif img.mode not in ("RGB", "RGBA"):
-            img = img.convert("RGB")
-        
-        # Resize if max_width specified
-        if max_width and img.width > max_width:
-            ratio = max_width / img.width
-            new_height = int(img.height * ratio)
-            img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Save as WebP with high quality (supports both RGB and RGBA)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(output_path, "WEBP", quality=quality, method=6)
-        return True
-    except Exception as e:
-        print(f"    Warning: Could not convert image to WebP: {e}")
-        return False
+    store = image_store_for(IMAGE_OUTPUT_DIR)
+    variants = [(webp_params(quality, max_width), output_path)]
+    variants += [(webp_params(quality, w), derivative_path(output_path, w)) for w in srcset_widths]
+    
+    def encode_set(raw: bytes, params_list: List[Tuple]) -> List[bytes]:
+        img = open_for_webp(raw)
+        return [encode_decoded_webp(img, quality=quality, max_width=params[2]) for params in params_list]
+    
+    store.materialize_set(image_bytes, variants, encode_set, replace=True)
+    return True
+
+
+def webp_failed(exc: Exception) -> None:
+    METRICS.warn(f"    Warning: Could not convert image to WebP: {exc}")
+
+
+def srcset_entries(relative_path: str, width: int, max_width: Optional[int], widths: Sequence[int]) -> List[Dict[str, Any]]:
+    """[{"width", "path"}, ...] for an image and its derivatives, smallest first."""
+    main_width = min(width, max_width) if max_width else width
+    main = Path(relative_path)
+    entries = [
+        {"width": w, "path": derivative_path(main, w).as_posix()}
+        for w in derivative_widths(width, max_width, widths)
+    ]
+    entries.append({"width": main_width, "path": relative_path})
+    return entries
+
+
+def srcset_attribute(entries: List[Dict[str, Any]]) -> str:
+    """HTML srcset value: "images/a__w160.webp 160w, images/a.webp 1200w"."""
+    return ", ".join(f"{e['path']} {e['width']}w" for e in entries)
+
+
+# convert_to_webp calls run on this pool while process_pdf moves on to the
+# next page; main() sets the thread count (--encode-threads)
+ENCODE_POOL = EncodePool()
 
 
 def generate_image_filename(
@@ -922,14 +1055,20 @@ def process_pdf(
     quality: int = 85,
     max_width: Optional[int] = None,
     save_brands: bool = True,
+    srcset_widths: Sequence[int] = DEFAULT_SRCSET_WIDTHS,
 ) -> List[Dict[str, Any]]:
     """Process a single PDF and extract images linked to specific series.
     
     Uses series-based matching to correctly link images to SKUs when
     multiple series appear on the same page.
     
+    Each product image also gets smaller copies at srcset_widths (see
+    convert_to_webp); the mapping's "srcset" lists them with the main image.
+    
     Brand/logo images are saved to images/brands/{pdf_stem}/ folder.
     """
+    started = time.perf_counter()
+    counters_before = METRICS.snapshot()
     extracted = []
     pdf_stem = pdf_path.stem
     pdf_output_dir = output_dir / slugify(pdf_stem)
@@ -938,10 +1077,10 @@ def process_pdf(
     try:
         doc = fitz.open(str(pdf_path))
     except Exception as e:
-        print(f"  Error opening PDF: {e}")
+        METRICS.warn(f"  Error opening PDF: {e}", pdf=pdf_path.name)
         return []
     
-    print(f"  Processing {pdf_path.name} ({len(doc)} pages)...")
+    METRICS.info(f"  Processing {pdf_path.name} ({len(doc)} pages)...")
     
     # Group records by page
     from collections import defaultdict
@@ -954,10 +1093,17 @@ def process_pdf(
         if page_num:
             records_by_page[page_num].append(rec)
     
+    def count_brand_image(ok: bool) -> None:
+        if ok:
+            METRICS.count("brand_images")
+    
     # Track which series have been assigned images (for deduplication)
     series_image_count: Dict[str, int] = defaultdict(int)
     
-    for page_num in sorted(records_by_page.keys()):
+    page_numbers = sorted(records_by_page.keys())
+    METRICS.event("pdf_start", pdf=pdf_path.name, pages=len(page_numbers))
+    for done, page_num in enumerate(page_numbers, start=1):
+        METRICS.progress(pdf_path.name, done, len(page_numbers))
         if page_num < 1 or page_num > len(doc):
             continue
         
@@ -966,9 +1112,11 @@ def process_pdf(
         
         if not page_records:
             continue
+        METRICS.count("pages")
+        METRICS.count("records", len(page_records))
         
         # Extract images from this page (product and brand images)
-        images, brand_images = extract_images_from_page(page, doc)
+        images, brand_images = extract_images_from_page(page, doc, load_rejected=save_brands)
         
         # Save brand images to separate folder
         if save_brands and brand_images:
@@ -976,11 +1124,14 @@ def process_pdf(
             for idx, brand_img in enumerate(brand_images):
                 brand_filename = f"{slugify(pdf_stem)}__p{page_num}__brand_{idx + 1}.webp"
                 brand_path = brand_output_dir / brand_filename
-                convert_to_webp(
+                ENCODE_POOL.submit(
+                    convert_to_webp,
                     brand_img["bytes"],
                     brand_path,
                     quality=quality,
                     max_width=max_width,
+                    on_done=count_brand_image,
+                    on_error=webp_failed,
                 )
         
         if not images:
@@ -1058,31 +1209,50 @@ def process_pdf(
                 series_image_count[series_id] += total_on_page
             
             output_path = pdf_output_dir / filename
+            relative_path = f"images/{slugify(pdf_stem)}/{filename}"
+            widths = derivative_widths(img_data["width"], max_width, srcset_widths)
+            mapping = {
+                "pdf": pdf_path.name,
+                "page": page_num,
+                "series_id": series_id if matched_series else None,
+                "series_name": matched_series["series_name"] if matched_series else None,
+                "skus": matched_series["skus"] if matched_series else skus,
+                "ocr_skus": ocr_skus,  # SKUs detected directly on the image
+                "image_path": relative_path,
+                "original_size": (img_data["width"], img_data["height"]),
+                "srcset": srcset_entries(relative_path, img_data["width"], max_width, widths),
+                "source_sha256": hashlib.sha256(img_data["bytes"]).hexdigest(),
+            }
+            series_label = series_id if matched_series else "unmatched"
             
-            # Convert and save
-            if convert_to_webp(
+            def saved(ok: bool, mapping=mapping, series_label=series_label, filename=filename) -> None:
+                # Runs on this thread, in submission order (see EncodePool)
+                if not ok:
+                    return
+                extracted.append(mapping)
+                METRICS.count("images")
+                METRICS.count("srcset_derivatives", len(mapping["srcset"]) - 1)
+                METRICS.event("image", pdf=pdf_path.name, page=mapping["page"], series=series_label, path=mapping["image_path"])
+                METRICS.detail(f"    Page {mapping['page']} [{series_label}]: {filename}")
+            
+            # Convert and save (on the encode pool; parsing continues)
+            ENCODE_POOL.submit(
+                convert_to_webp,
                 img_data["bytes"],
                 output_path,
                 quality=quality,
                 max_width=max_width,
-            ):
-                relative_path = f"images/{slugify(pdf_stem)}/{filename}"
-                
-                extracted.append({
-                    "pdf": pdf_path.name,
-                    "page": page_num,
-                    "series_id": series_id if matched_series else None,
-                    "series_name": matched_series["series_name"] if matched_series else None,
-                    "skus": matched_series["skus"] if matched_series else skus,
-                    "ocr_skus": ocr_skus,  # SKUs detected directly on the image
-                    "image_path": relative_path,
-                    "original_size": (img_data["width"], img_data["height"]),
-                })
-                
-                series_label = series_id if matched_series else "unmatched"
-                print(f"    Page {page_num} [{series_label}]: {filename}")
+                srcset_widths=widths,
+                on_done=saved,
+                on_error=webp_failed,
+            )
     
+    ENCODE_POOL.drain()
     doc.close()
+    METRICS.event(
+        "pdf_done", pdf=pdf_path.name, seconds=round(time.perf_counter() - started, 3),
+        **METRICS.since(counters_before),
+    )
     return extracted
 
 
@@ -1163,6 +1333,9 @@ def update_image_sku_mapping(
             "skus": sorted(all_skus),  # Complete list of ALL SKUs
             "sku_count": len(all_skus),
         }
+        if img_data.get("srcset"):
+            mapping[image_path]["srcset"] = img_data["srcset"]
+            mapping[image_path]["source_sha256"] = img_data.get("source_sha256")
         updated += 1
     
     return updated
@@ -1254,12 +1427,14 @@ def update_json_with_images(
     Adds fields:
     - image: Primary image path (first image for the series)
     - images: List of all image paths for the series (if multiple)
+    - image_srcset / images_srcset: HTML srcset values for image / each of
+      images (the derivative widths plus the main image)
     """
     try:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception as e:
-        print(f"  Warning: Could not read {json_path}: {e}")
+        METRICS.warn(f"  Warning: Could not read {json_path}: {e}")
         return 0
     
     updated_count = 0
@@ -1268,6 +1443,7 @@ def update_json_with_images(
     
     # Build mapping: series_id -> list of image paths
     series_images: Dict[str, List[str]] = defaultdict(list)
+    srcsets: Dict[str, str] = {}
     
     for mapping in image_mappings:
         series_id = mapping.get("series_id")
@@ -1276,6 +1452,8 @@ def update_json_with_images(
         if series_id and image_path:
             if image_path not in series_images[series_id]:
                 series_images[series_id].append(image_path)
+            if mapping.get("srcset"):
+                srcsets[image_path] = srcset_attribute(mapping["srcset"])
     
     def update_record(rec: Dict[str, Any]) -> bool:
         series_id = rec.get("series_id")
@@ -1290,6 +1468,12 @@ def update_json_with_images(
                 rec["images"] = images
             elif "images" in rec:
                 del rec["images"]
+            rec.pop("image_srcset", None)
+            rec.pop("images_srcset", None)
+            if images[0] in srcsets:
+                rec["image_srcset"] = srcsets[images[0]]
+            if len(images) > 1 and any(p in srcsets for p in images):
+                rec["images_srcset"] = [srcsets.get(p, p) for p in images]
             return True
         
         return False
@@ -1354,8 +1538,28 @@ def main():
         action="store_true",
         help="Save rejected images to a separate folder for review",
     )
+    parser.add_argument(
+        "--srcset-widths",
+        type=str,
+        default=",".join(str(w) for w in DEFAULT_SRCSET_WIDTHS),
+        help="Comma-separated widths (px) of the smaller srcset copies written per image "
+        f"(default: {','.join(str(w) for w in DEFAULT_SRCSET_WIDTHS)}; empty = none)",
+    )
+    parser.add_argument(
+        "--encode-threads",
+        type=int,
+        default=DEFAULT_ENCODE_THREADS,
+        help=f"Threads encoding WebP images while pages are processed (default: {DEFAULT_ENCODE_THREADS}; 0 = inline)",
+    )
+    add_metrics_arguments(parser)
     
     args = parser.parse_args()
+    METRICS.configure(verbosity_from_args(args), args.metrics_log)
+    ENCODE_POOL.configure(args.encode_threads)
+    try:
+        srcset_widths = tuple(int(w) for w in args.srcset_widths.split(",") if w.strip())
+    except ValueError:
+        parser.error(f"--srcset-widths must be comma-separated integers, got {args.srcset_widths!r}")
     
     # Handle --generate-mapping mode (no extraction needed)
     if args.generate_mapping:
@@ -1425,17 +1629,18 @@ def main():
         print("=" * 60)
         return
     
-    print("=" * 60)
-    print("Product Image Extraction")
-    print("=" * 60)
-    print(f"PDF directory: {PDF_DIR}")
-    print(f"JSON directory: {JSON_DIR}")
-    print(f"Output directory: {IMAGE_OUTPUT_DIR}")
-    print(f"Quality: {args.quality}")
-    print(f"Max width: {args.max_width}px")
-    print(f"Update JSON: {args.update_json}")
-    print(f"Save rejected: {args.save_rejected}")
-    print("=" * 60)
+    METRICS.info("=" * 60)
+    METRICS.info("Product Image Extraction")
+    METRICS.info("=" * 60)
+    METRICS.info(f"PDF directory: {PDF_DIR}")
+    METRICS.info(f"JSON directory: {JSON_DIR}")
+    METRICS.info(f"Output directory: {IMAGE_OUTPUT_DIR}")
+    METRICS.info(f"Quality: {args.quality}")
+    METRICS.info(f"Max width: {args.max_width}px")
+    METRICS.info(f"Srcset widths: {', '.join(str(w) for w in srcset_widths) or 'none'}")
+    METRICS.info(f"Update JSON: {args.update_json}")
+    METRICS.info(f"Save rejected: {args.save_rejected}")
+    METRICS.info("=" * 60)
     
     # Create output directory
     IMAGE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -1467,15 +1672,15 @@ def main():
         json_path = JSON_DIR / f"{pdf_path.stem}.json"
         
         if not json_path.exists():
-            print(f"\nSkipping {pdf_path.name} (no JSON found)")
+            METRICS.info(f"\nSkipping {pdf_path.name} (no JSON found)")
             continue
         
-        print(f"\n{pdf_path.name}")
+        METRICS.info(f"\n{pdf_path.name}")
         
         # Load JSON records
         records = load_json_records(json_path)
         if not records:
-            print("  No records found in JSON")
+            METRICS.info("  No records found in JSON")
             continue
         
         # Extract images
@@ -1486,6 +1691,7 @@ def main():
             quality=args.quality,
             max_width=args.max_width,
             save_brands=args.save_rejected,  # Save rejected to brands folder for review
+            srcset_widths=srcset_widths,
         )
         
         total_images += len(image_mappings)
@@ -1500,7 +1706,7 @@ def main():
             updated = update_json_with_images(json_path, image_mappings)
             total_updated += updated
             if updated:
-                print(f"  Updated {updated} records with image paths")
+                METRICS.info(f"  Updated {updated} records with image paths")
     
     # Save the complete image-SKU mapping
     if total_mapped > 0:
@@ -1508,12 +1714,30 @@ def main():
     
     print("\n" + "=" * 60)
     print(f"Total images extracted: {total_images}")
+    if METRICS.counters.get("srcset_derivatives"):
+        print(f"Srcset derivatives: {METRICS.counters['srcset_derivatives']}")
     print(f"Total images in SKU mapping: {len(image_sku_mapping)}")
     if args.update_json:
         print(f"Total records updated: {total_updated}")
     if args.save_rejected:
         print(f"Rejected images saved to: {rejected_dir}")
+    rates = METRICS.throughput()
+    if rates:
+        print(f"Throughput: {format_rates(rates)} ({METRICS.elapsed():.1f}s)")
+    encode_stats = ENCODE_POOL.stats()
+    if encode_stats["jobs"]:
+        store = image_store_for(IMAGE_OUTPUT_DIR)
+        print(f"WebP encoding: {format_encode_stats(encode_stats, ENCODE_POOL.workers, store.stats['encoded'])}")
+        print(f"Image store: {store.stats['encoded']} encoded, {store.stats['reused']} reused")
+    if METRICS.counters.get("image_streams_skipped"):
+        print(f"Image streams: {format_read_stats(METRICS.counters)}")
     print("=" * 60)
+    METRICS.event(
+        "run_done", seconds=round(METRICS.elapsed(), 3),
+        throughput={k: round(v, 2) for k, v in rates.items()}, **METRICS.counters,
+    )
+    ENCODE_POOL.close()
+    METRICS.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+"""
+Content-addressed store for encoded catalog images.
+
+The same embedded image (a logo, or a product photo shared by several series,
+columns or pages) used to be re-encoded to WebP once per placement, each
+under its own per-series filename. ImageStore keys every encoded image by the
+SHA-256 of its raw bytes plus the encode parameters, keeps one blob per key
+and exposes each per-series filename as a hardlink to that blob, so encoding
+work and disk usage scale with unique images instead of placements.
+
+Layout (next to the images directory, not inside it: copy_product_images.js
+and smart_dedupe.py walk the images tree):
+
+    .image_store/
+        blobs/ab/ab12...ef.webp   one file per (raw bytes, encode params)
+        aliases.ndjson            appended {"path", "key", "how"} per placement
+
+Where hardlinks aren't possible (another filesystem, FAT, no permission) the
+blob is copied instead; the alias log still records which blob it came from.
+"""
+
+import filecmp
+import json
+import os
+import shutil
+import threading
+from contextlib import ExitStack
+from hashlib import sha256
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+STORE_DIRNAME = ".image_store"
+ALIAS_LOG_NAME = "aliases.ndjson"
+
+# Bump when an encoder changes in a way its parameters don't capture, so old
+# blobs stop matching
+STORE_VERSION = 1
+
+
+class ImageStore:
+    """One blob per (raw image bytes, encode parameters), linked into place."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.blob_dir = root / "blobs"
+        self.stats: Dict[str, int] = {"encoded": 0, "reused": 0, "linked": 0, "copied": 0}
+        self._alias_log = None
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def key(raw: bytes, params: Sequence) -> str:
+        h = sha256(raw)
+        h.update(repr((STORE_VERSION, tuple(params))).encode("utf-8"))
+        return h.hexdigest()
+
+    def blob_path(self, key: str, suffix: str = ".webp") -> Path:
+        return self.blob_dir / key[:2] / f"{key}{suffix}"
+
+    def has_blob(self, raw: bytes, params: Sequence, suffix: str = ".webp") -> bool:
+        """Whether `raw` was already encoded with `params`."""
+        return self.blob_path(self.key(raw, params), suffix).exists()
+
+    def blob(self, raw: bytes, params: Sequence, encode: Callable[[bytes], bytes], suffix: str = ".webp") -> Tuple[Path, bool]:
+        """(path of the encoded blob, whether it was encoded now); runs
+        `encode(raw)` only if the blob is new."""
+        key = self.key(raw, params)
+        path = self.blob_path(key, suffix)
+        with self._key_lock(key):
+            # Threads of this process encode a key once; the others wait here
+            # and reuse the blob
+            if path.exists():
+                self._count("reused")
+                return path, False
+            self._write_blob(path, encode(raw))
+        self._count("encoded")
+        return path, True
+
+    def _write_blob(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name + atomic rename: worker processes may encode the
+        # same image at the same time; either result is the same blob
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def materialize(
+        self,
+        raw: bytes,
+        params: Sequence,
+        dest: Path,
+        encode: Callable[[bytes], bytes],
+        replace: bool = False,
+    ) -> Optional[str]:
+        """Make `dest` the encoded image for `raw` (hardlink, else copy).
+
+        An existing dest is kept unless replace=True. Returns None when dest
+        was kept, otherwise "encoded" (new blob) or "reused" (blob existed).
+        Safe to call from several threads.
+        """
+        if dest.exists() and not replace:
+            return None
+        blob, encoded = self.blob(raw, params, encode, dest.suffix or ".webp")
+        outcome = "encoded" if encoded else "reused"
+        if dest.exists() and os.path.samefile(blob, dest):
+            # Already linked to this blob (renaming a link over another link
+            # of the same file would be a no-op and leave the temp link)
+            return outcome
+        self._place(blob, dest)
+        return outcome
+
+    def materialize_set(
+        self,
+        raw: bytes,
+        variants: Sequence[Tuple[Sequence, Path]],
+        encode_set: Callable[[bytes, List[Sequence]], List[bytes]],
+        replace: bool = False,
+    ) -> List[Optional[str]]:
+        """materialize() for several encodings of one source image, given as
+        (params, dest) pairs, e.g. one per output width.
+
+        The missing blobs come from a single encode_set(raw, [params, ...])
+        call, so the source is decoded at most once. Per variant, returns
+        None (existing dest kept), "matched" (dest already holds this
+        source's blob: nothing written), "encoded" or "reused".
+        """
+        needed = [i for i, (_, dest) in enumerate(variants) if replace or not dest.exists()]
+        blobs = {
+            i: self.blob_path(self.key(raw, variants[i][0]), variants[i][1].suffix or ".webp")
+            for i in needed
+        }
+        missing = [i for i in needed if not blobs[i].exists()]
+        if missing:
+            # As in blob(): one thread encodes a key, the others wait and
+            # reuse it. Locks are taken in key order so two sets sharing keys
+            # can't deadlock.
+            with ExitStack() as stack:
+                for key in sorted({blobs[i].stem for i in missing}):
+                    stack.enter_context(self._key_lock(key))
+                missing = [i for i in missing if not blobs[i].exists()]
+                if missing:
+                    for i, data in zip(missing, encode_set(raw, [variants[i][0] for i in missing])):
+                        self._write_blob(blobs[i], data)
+            for _ in missing:
+                self._count("encoded")
+        outcomes: List[Optional[str]] = [None] * len(variants)
+        for i in needed:
+            blob, dest = blobs[i], variants[i][1]
+            if i not in missing:
+                self._count("reused")
+                if dest.exists() and (os.path.samefile(blob, dest) or filecmp.cmp(blob, dest, shallow=False)):
+                    outcomes[i] = "matched"
+                    continue
+            self._place(blob, dest)
+            outcomes[i] = "encoded" if i in missing else "reused"
+        return outcomes
+
+    def _place(self, blob: Path, dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            os.link(blob, tmp)
+            how = "linked"
+        except OSError:
+            shutil.copyfile(blob, tmp)
+            how = "copied"
+        os.replace(tmp, dest)
+        self._count(how)
+        self._record_alias(dest, blob.stem, how)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _record_alias(self, dest: Path, key: str, how: str) -> None:
+        with self._lock:
+            if self._alias_log is None:
+                self.root.mkdir(parents=True, exist_ok=True)
+                # Line-buffered append, like the metrics event log: one write
+                # per alias, safe to share between worker processes
+                self._alias_log = (self.root / ALIAS_LOG_NAME).open("a", encoding="utf-8", buffering=1)
+            self._alias_log.write(json.dumps({"path": str(dest), "key": key, "how": how}) + "\n")
+
+    def close(self) -> None:
+        if self._alias_log is not None:
+            self._alias_log.close()
+            self._alias_log = None
+
+
+_STORES: Dict[Path, ImageStore] = {}
+
+
+def image_store_for(image_dir: Path, root: Optional[Path] = None) -> ImageStore:
+    """Process-wide store for an images directory (default: a .image_store
+    directory beside it)."""
+    root = root if root is not None else image_dir.parent / STORE_DIRNAME
+    store = _STORES.get(root)
+    if store is None:
+        store = _STORES[root] = ImageStore(root)
+    return store
@@ -0,0 +1,185 @@
+"""
+Batch page rendering for catalog PDFs.
+
+render_page_as_image (analyze_product_pdfs.py) opened the PDF for every page
+it rendered, and extract_makita_images.py rasterised whole catalogs page by
+page on one core. PageRenderer takes a batch of RenderJobs for one PDF:
+
+- the document is opened once per worker process (once per render() call
+  when rendering in-process) and reused for every page
+- page ranges are rasterised in parallel worker processes (workers > 1)
+- a job can be clipped to a bbox (a product region instead of the page)
+- a job can ask for several resolutions: the page is rasterised once at the
+  highest DPI and the smaller outputs are downscaled from that pixmap
+
+Outputs that already exist are not rendered again.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fitz  # PyMuPDF
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+DEFAULT_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
+# Page ranges per worker: small enough to balance uneven pages, large enough
+# that each task reuses the worker's open document for many pages
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class RenderOutput:
+    path: Path
+    dpi: int
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One page (1-indexed), optionally clipped to a bbox in PDF points, written
+    at one or more resolutions."""
+
+    page: int
+    outputs: Tuple[RenderOutput, ...]
+    clip: Optional[Tuple[float, float, float, float]] = None
+
+
+@dataclass
+class RenderResult:
+    page: int
+    written: List[Path] = field(default_factory=list)
+    # Outputs that already existed
+    skipped: List[Path] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+# ------------------------
+# Rendering (runs in the worker, or in-process)
+# ------------------------
+
+# Open documents of this process, by path (a worker renders one PDF)
+_DOCS: Dict[str, "fitz.Document"] = {}
+
+
+def _document(pdf_path: str) -> "fitz.Document":
+    doc = _DOCS.get(pdf_path)
+    if doc is None:
+        for old in _DOCS.values():
+            old.close()
+        _DOCS.clear()
+        doc = _DOCS[pdf_path] = fitz.open(pdf_path)
+    return doc
+
+
+def close_documents() -> None:
+    for doc in _DOCS.values():
+        doc.close()
+    _DOCS.clear()
+
+
+def render_job(doc: "fitz.Document", job: RenderJob, quality: int) -> RenderResult:
+    result = RenderResult(page=job.page)
+    todo = [o for o in job.outputs if not o.path.exists()]
+    result.skipped = [o.path for o in job.outputs if o not in todo]
+    if not todo:
+        return result
+    try:
+        page = doc[job.page - 1]
+        top_dpi = max(o.dpi for o in todo)
+        mat = fitz.Matrix(top_dpi / 72, top_dpi / 72)
+        clip = fitz.Rect(job.clip) if job.clip is not None else None
+        pix = page.get_pixmap(matrix=mat, clip=clip, alpha=False)
+        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        for out in sorted(todo, key=lambda o: -o.dpi):
+            scaled = img
+            if out.dpi != top_dpi:
+                scale = out.dpi / top_dpi
+                size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+                scaled = img.resize(size, Image.Resampling.LANCZOS)
+            out.path.parent.mkdir(parents=True, exist_ok=True)
+            scaled.save(out.path, "WEBP", quality=quality)
+            result.written.append(out.path)
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def _render_chunk(pdf_path: str, jobs: Sequence[RenderJob], quality: int) -> List[RenderResult]:
+    doc = _document(pdf_path)
+    return [render_job(doc, job, quality) for job in jobs]
+
+
+# ------------------------
+# Batch API
+# ------------------------
+
+class PageRenderer:
+    """Renders batches of pages of one PDF, in parallel when workers > 1."""
+
+    def __init__(self, pdf_path: Path, workers: int = DEFAULT_RENDER_WORKERS, quality: int = 90):
+        self.pdf_path = pdf_path
+        self.workers = max(1, workers)
+        self.quality = quality
+
+    def render(
+        self,
+        jobs: Sequence[RenderJob],
+        on_result: Optional[Callable[[RenderResult], None]] = None,
+    ) -> List[RenderResult]:
+        """Render jobs; results come back in job order.
+
+        on_result is called in this process for each result as its page range
+        completes (in order), e.g. for progress output.
+        """
+        if not HAS_FITZ or not HAS_PIL:
+            raise RuntimeError("page rendering needs PyMuPDF and Pillow")
+        jobs = sorted(jobs, key=lambda j: j.page)
+        # Only pages with something left to write go to the workers
+        pending = [j for j in jobs if any(not o.path.exists() for o in j.outputs)]
+        rendered: Dict[RenderJob, RenderResult] = {}
+        if self.workers == 1 or len(pending) < 2:
+            try:
+                for job in pending:
+                    rendered[job] = render_job(_document(str(self.pdf_path)), job, self.quality)
+                    if on_result is not None:
+                        on_result(rendered[job])
+            finally:
+                # Worker processes keep their document for the next chunk;
+                # this process may not render this PDF again
+                close_documents()
+        else:
+            chunks = _page_ranges(pending, self.workers * CHUNKS_PER_WORKER)
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+                futures = [pool.submit(_render_chunk, str(self.pdf_path), chunk, self.quality) for chunk in chunks]
+                for chunk, future in zip(chunks, futures):
+                    for job, result in zip(chunk, future.result()):
+                        rendered[job] = result
+                        if on_result is not None:
+                            on_result(result)
+        return [
+            rendered.get(job) or RenderResult(page=job.page, skipped=[o.path for o in job.outputs])
+            for job in jobs
+        ]
+
+
+def _page_ranges(jobs: Sequence[RenderJob], n: int) -> List[List[RenderJob]]:
+    """Split page-ordered jobs into at most n contiguous ranges."""
+    size = max(1, -(-len(jobs) // n))
+    return [list(jobs[i:i + size]) for i in range(0, len(jobs), size)]
+
+
+def page_job(page: int, path: Path, dpi: int, clip: Optional[Tuple[float, float, float, float]] = None) -> RenderJob:
+    """Single-resolution job."""
+    return RenderJob(page=page, outputs=(RenderOutput(path, dpi),), clip=clip)
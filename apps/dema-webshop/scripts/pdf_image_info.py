@@ -0,0 +1,87 @@
+"""
+Metadata-first filtering of embedded PDF images.
+
+doc.extract_image(xref) reads the image's whole byte stream (and re-encodes
+anything that isn't a JPEG to PNG), yet most candidates are rejected on facts
+PyMuPDF knows without it: page.get_images(full=True) gives dimensions and
+colorspace, page.get_image_rects() the placement, and the xref dictionary the
+stream length. The extraction scripts check those
+first and only extract the survivors; the counters below report how much of
+the image data was never read.
+
+Counters (on METRICS, so --jobs workers add up):
+- image_streams_read / image_bytes_read: streams passed to extract_image
+- image_streams_skipped / image_bytes_skipped: rejected on metadata alone
+Byte counts are compressed stream lengths as stored in the PDF.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from run_metrics import METRICS
+
+
+@dataclass
+class ImageInfo:
+    """The parts of a page.get_images(full=True) entry the filters check,
+    plus its stream length."""
+
+    xref: int
+    width: int = 0
+    height: int = 0
+    colorspace: str = ""
+    # Compressed bytes of the image stream (0 if the PDF doesn't say)
+    stream_length: int = 0
+
+    @property
+    def is_grayscale(self) -> bool:
+        """Single-channel device gray: decodes to an image without colour."""
+        return self.colorspace == "DeviceGray"
+
+
+def stream_length(doc, xref: int) -> int:
+    """/Length of an xref's stream, following an indirect reference."""
+    try:
+        kind, value = doc.xref_get_key(xref, "Length")
+        if kind == "xref":
+            value = doc.xref_object(int(value.split()[0]), compressed=True)
+        return int(value)
+    except (ValueError, TypeError, IndexError, RuntimeError):
+        return 0
+
+
+def page_image_infos(doc, page) -> List[ImageInfo]:
+    """Metadata of every image on a page, in page.get_images() order."""
+    infos = []
+    for xref, _smask, width, height, _bpc, colorspace, *_ in page.get_images(full=True):
+        infos.append(ImageInfo(
+            xref=xref,
+            width=width,
+            height=height,
+            colorspace=colorspace,
+            stream_length=stream_length(doc, xref),
+        ))
+    return infos
+
+
+def note_read(info: ImageInfo) -> None:
+    METRICS.count("image_streams_read")
+    METRICS.count("image_bytes_read", info.stream_length)
+
+
+def note_skipped(info: ImageInfo) -> None:
+    METRICS.count("image_streams_skipped")
+    METRICS.count("image_bytes_skipped", info.stream_length)
+
+
+def format_read_stats(counters) -> str:
+    """e.g. '12 of 40 image streams read, 3.1 of 9.8 MB never read'"""
+    read = counters.get("image_streams_read", 0)
+    skipped = counters.get("image_streams_skipped", 0)
+    bytes_read = counters.get("image_bytes_read", 0)
+    bytes_skipped = counters.get("image_bytes_skipped", 0)
+    total_mb = (bytes_read + bytes_skipped) / 1e6
+    return (
+        f"{read} of {read + skipped} image streams read; "
+        f"{bytes_skipped / 1e6:.1f} of {total_mb:.1f} MB never read"
+    )
@@ -0,0 +1,162 @@
+"""
+Memoized quantity parsing for catalog cells.
+
+Catalog tables repeat the same handful of strings ('1/2"', '16 bar', '25 mm',
+'€ 495,00') thousands of times. parse_quantity() turns a raw cell into a typed
+Quantity for one of a few grammars and caches the result, so each distinct
+string is parsed once per run. The helpers in analyze_product_pdfs.py
+(parse_range, parse_inch_size, parse_euro_price, the enrich_record diameter
+and length regexes, enrich_bronpompen's to_float) all go through it.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional
+
+# Large enough for every distinct cell of the biggest catalogs
+QUANTITY_CACHE_SIZE = 16384
+
+
+class Quantity(NamedTuple):
+    """Parsed cell: a value with its unit, or a low/high range."""
+
+    value: Optional[float] = None
+    unit: Optional[str] = None
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+
+NO_QUANTITY = Quantity()
+
+# ------------------------
+# Grammars
+# ------------------------
+
+# "0.6 - 4.8", "35-61" (after decimal comma -> dot)
+RANGE_PATTERN = re.compile(r"\s*([0-9]*\.?[0-9]+)\s*[-–]\s*([0-9]*\.?[0-9]+)\s*")
+
+PRICE_PATTERNS = [
+    # Standard format: "€ 495,00" or "€495,00" or "€ 1.495,00"
+    re.compile(r"€\s*([\d.]+,\d{2})"),
+    # With space in number: "€ 419 ,00"
+    re.compile(r"€\s*([\d.]+)\s*,\s*(\d{2})"),
+    # Price range: "€ 495,00 - € 595,00" (take first)
+    re.compile(r"€\s*([\d.]+,\d{2})\s*[-–]"),
+]
+
+# First number followed by a unit, searched in the lowercased cell
+UNIT_PATTERNS = {
+    "mm": re.compile(r"([0-9]+(?:,[0-9]+)?)\s*mm"),
+    "m": re.compile(r"([0-9]+(?:,[0-9]+)?)\s*m\b"),
+}
+
+# First number anywhere in the cell (e.g. pump diameter "98,5 mm")
+FIRST_NUMBER = re.compile(r"([0-9]+(?:,[0-9]+)?)")
+
+
+def _parse_range(text: str) -> Quantity:
+    m = RANGE_PATTERN.match(text.replace(",", "."))
+    if not m:
+        return NO_QUANTITY
+    try:
+        return Quantity(low=float(m.group(1)), high=float(m.group(2)))
+    except ValueError:
+        return NO_QUANTITY
+
+
+def _parse_inch(text: str) -> Quantity:
+    text = text.strip().replace("\u201d", '"').replace("\u201c", '"')
+    text = text.replace("\"", "").strip()
+    if not text:
+        return NO_QUANTITY
+
+    total = 0.0
+    for part in text.split():
+        part = part.strip()
+        if not part:
+            continue
+        if "/" in part:
+            num, _, den = part.partition("/")
+            try:
+                n = float(num)
+                d = float(den)
+                if d != 0:
+                    total += n / d
+            except ValueError:
+                return NO_QUANTITY
+        else:
+            try:
+                total += float(part)
+            except ValueError:
+                return NO_QUANTITY
+
+    return Quantity(total, "inch") if total > 0 else NO_QUANTITY
+
+
+def _parse_euro(text: str) -> Quantity:
+    for pattern in PRICE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            try:
+                if len(match.groups()) == 2:
+                    # Pattern with separated decimal: "419 ,00"
+                    price_str = f"{match.group(1)},{match.group(2)}"
+                else:
+                    price_str = match.group(1)
+                # Normalize: remove thousand separators (.), replace decimal comma with dot
+                price_str = price_str.replace(".", "").replace(",", ".")
+                return Quantity(float(price_str), "EUR")
+            except (ValueError, AttributeError):
+                continue
+    return NO_QUANTITY
+
+
+def _parse_number(text: str) -> Quantity:
+    try:
+        return Quantity(float(text.replace(",", ".")))
+    except ValueError:
+        return NO_QUANTITY
+
+
+def _parse_first_number(text: str) -> Quantity:
+    m = FIRST_NUMBER.search(text)
+    if not m:
+        return NO_QUANTITY
+    return Quantity(float(m.group(1).replace(",", ".")))
+
+
+def _parse_unit(text: str, unit: str) -> Quantity:
+    m = UNIT_PATTERNS[unit].search(text.lower())
+    if not m:
+        return NO_QUANTITY
+    return Quantity(float(m.group(1).replace(",", ".")), unit)
+
+
+_GRAMMARS = {
+    "range": _parse_range,
+    "inch": _parse_inch,
+    "eur": _parse_euro,
+    "number": _parse_number,
+    "first_number": _parse_first_number,
+}
+
+
+@lru_cache(maxsize=QUANTITY_CACHE_SIZE)
+def parse_quantity(raw: str, kind: str) -> Quantity:
+    """Parse a raw cell with one grammar (cached on (raw, kind)).
+
+    kind: "range" (low/high), "inch" (fractions like 2 1/2"), "eur" (Euro
+    price), "number" (whole cell as a decimal-comma number), "first_number",
+    or a unit key of UNIT_PATTERNS ("mm", "m") for the first number followed
+    by that unit. Returns NO_QUANTITY when the cell doesn't parse.
+    """
+    grammar = _GRAMMARS.get(kind)
+    if grammar is not None:
+        return grammar(raw)
+    return _parse_unit(raw, kind)
+
+
+def quantity_cache_stats() -> Dict[str, Any]:
+    """Cumulative cache counters for this process."""
+    info = parse_quantity.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
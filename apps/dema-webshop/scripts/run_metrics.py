@@ -0,0 +1,206 @@
+"""
+Run metrics for the catalog extraction scripts.
+
+analyze_product_pdfs.py and extract_product_images.py report through the
+process-wide METRICS object instead of printing a line per page, table,
+series and image:
+
+- counters ("pages", "tables", "records", "images", ...) with throughput
+  (per second of wall time)
+- an optional machine-readable event log: one JSON object per line, appended,
+  so worker processes of a --jobs run can share the file
+- a compact live progress line on stderr (only when stderr is a terminal)
+- verbosity: "verbose" (default) prints the per-page detail lines as before,
+  "progress" replaces them with the progress line, "quiet" prints warnings
+  and the final totals only (CI, cron)
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+VERBOSITY = ("quiet", "progress", "verbose")
+
+# Counters reported as throughput (per second)
+THROUGHPUT_COUNTERS = ("pages", "tables", "images", "records")
+
+# Minimum seconds between two redraws of the progress line
+PROGRESS_INTERVAL = 0.2
+
+
+class RunMetrics:
+    """Counters, event log and console output for one process."""
+
+    def __init__(self) -> None:
+        self._log: Optional[TextIO] = None
+        self.configure()
+
+    def configure(
+        self,
+        verbosity: str = "verbose",
+        log_path: Optional[Path] = None,
+        live: bool = True,
+        stream: Optional[TextIO] = None,
+    ) -> "RunMetrics":
+        """(Re)start the metrics: reset counters, set output and event log.
+
+        live=False disables the progress line, e.g. in worker processes whose
+        output is collected by the parent.
+        """
+        if verbosity not in VERBOSITY:
+            raise ValueError(f"verbosity must be one of {VERBOSITY}, got {verbosity!r}")
+        self.close()
+        self.verbosity = verbosity
+        self.log_path = log_path
+        self.counters: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self._stream = stream if stream is not None else sys.stderr
+        # The live line only makes sense on a terminal (and in one process)
+        self._live = live and verbosity == "progress" and self._stream.isatty()
+        self._last_draw = 0.0
+        self._line_width = 0
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered append: each event is one write, so lines from
+            # concurrent worker processes don't interleave
+            self._log = log_path.open("a", encoding="utf-8", buffering=1)
+        return self
+
+    # ------------------------
+    # Counters and events
+    # ------------------------
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self.counters)
+
+    def since(self, snapshot: Dict[str, int]) -> Dict[str, int]:
+        """Counter increments since an earlier snapshot()."""
+        return {k: v - snapshot.get(k, 0) for k, v in self.counters.items() if v != snapshot.get(k, 0)}
+
+    def event(self, kind: str, **fields: Any) -> None:
+        """Append one event to the machine-readable log (no-op without one)."""
+        if self._log is None:
+            return
+        entry = {"ts": round(time.time(), 3), "event": kind}
+        entry.update(fields)
+        self._log.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+    # ------------------------
+    # Console output
+    # ------------------------
+
+    def detail(self, message: str) -> None:
+        """Per-page/table/series/image line: printed in verbose mode only."""
+        if self.verbosity == "verbose":
+            print(message)
+
+    def info(self, message: str) -> None:
+        """Per-catalog line: printed unless quiet."""
+        if self.verbosity != "quiet":
+            self._clear_progress()
+            print(message)
+
+    def warn(self, message: str, **fields: Any) -> None:
+        """Always printed, and logged as a "warning" event."""
+        self._clear_progress()
+        print(message)
+        self.event("warning", message=message.strip(), **fields)
+
+    def echo(self, text: str) -> None:
+        """Print output that was already filtered, e.g. a worker's captured log."""
+        if text:
+            self._clear_progress()
+            print(text, end="" if text.endswith("\n") else "\n", flush=True)
+
+    def progress(self, label: str, done: int, total: int, force: bool = False) -> None:
+        """Redraw the live progress line (throttled to PROGRESS_INTERVAL)."""
+        if not self._live:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_draw < PROGRESS_INTERVAL:
+            return
+        self._last_draw = now
+        rates = self.throughput()
+        rate_text = " ".join(f"{rates[k]:.1f} {k}/s" for k in ("pages", "records", "images") if rates.get(k))
+        line = f"{label} {done}/{total}" + (f" | {rate_text}" if rate_text else "")
+        self._stream.write("\r" + line.ljust(self._line_width))
+        self._stream.flush()
+        self._line_width = len(line)
+
+    def _clear_progress(self) -> None:
+        if self._live and self._line_width:
+            self._stream.write("\r" + " " * self._line_width + "\r")
+            self._stream.flush()
+            self._line_width = 0
+
+    # ------------------------
+    # Totals
+    # ------------------------
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def throughput(self, counters: Optional[Dict[str, int]] = None, seconds: Optional[float] = None) -> Dict[str, float]:
+        counters = self.counters if counters is None else counters
+        seconds = self.elapsed() if seconds is None else seconds
+        if seconds <= 0:
+            return {}
+        return {k: counters[k] / seconds for k in THROUGHPUT_COUNTERS if counters.get(k)}
+
+    def close(self) -> None:
+        if getattr(self, "_line_width", 0):
+            self._clear_progress()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+def merge_counters(parts: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    total: Dict[str, int] = {}
+    for part in parts:
+        for k, v in part.items():
+            total[k] = total.get(k, 0) + v
+    return total
+
+
+def format_rates(rates: Dict[str, float]) -> str:
+    return ", ".join(f"{rates[k]:.1f} {k}/s" for k in THROUGHPUT_COUNTERS if k in rates)
+
+
+# Process-wide instance; scripts call METRICS.configure() at startup
+METRICS = RunMetrics()
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show a live progress line with throughput instead of per-page output.",
+    )
+    group.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Print only warnings and the final totals (for CI and cron).",
+    )
+    parser.add_argument(
+        "--metrics-log",
+        type=Path,
+        default=None,
+        help="Append machine-readable events (one JSON object per line) to this file.",
+    )
+
+
+def verbosity_from_args(args: argparse.Namespace) -> str:
+    if getattr(args, "quiet", False):
+        return "quiet"
+    if getattr(args, "progress", False):
+        return "progress"
+    return "verbose"
+
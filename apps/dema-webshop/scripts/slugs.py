@@ -0,0 +1,39 @@
+"""
+Shared slug helper for the catalog scripts.
+
+Series ids, family ids and image filenames are all slugs. slug() folds
+accents with a precomputed translation table instead of a chain of re.sub
+calls, and memoizes results because the same series names are slugified for
+every record and image.
+"""
+
+import re
+from functools import lru_cache
+
+# Accented vowels and a few specials as they appear in Dutch/German/French catalogs
+ACCENT_FOLD = str.maketrans({
+    **{c: "a" for c in "äàáâã"},
+    **{c: "e" for c in "ëèéê"},
+    **{c: "i" for c in "ïìíî"},
+    **{c: "o" for c in "öòóôõ"},
+    **{c: "u" for c in "üùúû"},
+    "ñ": "n",
+    "ß": "ss",
+})
+
+# Every run of other characters becomes a single dash
+NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=8192)
+def slug(text: str, fold_accents: bool = False) -> str:
+    """Lowercase dash-separated slug of text ("" if nothing is left).
+
+    Without fold_accents, accented letters are treated like any other
+    non-alphanumeric character (the analyze_product_pdfs series ids rely on
+    this); with it they are folded to ASCII first (image filenames).
+    """
+    t = text.strip().lower()
+    if fold_accents:
+        t = t.translate(ACCENT_FOLD)
+    return NON_SLUG_CHARS.sub("-", t).strip("-")
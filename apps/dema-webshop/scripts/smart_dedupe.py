@@ -81,8 +81,9 @@ def find_all_images(images_dir: Path) -> List[Path]:
     images = []
     
     for root, dirs, files in os.walk(images_dir):
-        # Skip brands folder
-        if 'brands' in root:
+        # Skip brands folder and srcset derivatives (smaller copies of the
+        # image next to them, see extract_product_images.py)
+        if 'brands' in root or 'srcset' in Path(root).parts:
             continue
         for file in files:
             if Path(file).suffix.lower() in extensions: